@@ -1,5 +1,10 @@
 from .core import DataFrame
-from .series import Series
-from .merge import merge
-from .io import read_csv, read_json, read_ndjson
+from .series import Series, BooleanMask
+from .merge import merge, merge_asof, merge_chunks, JoinIndex
+from .io import read_csv, read_json, read_ndjson, read_csv_async, read_ndjson_async
 from .concat import concat
+from .reshape import pivot_table, pivot, crosstab, melt
+from .groupby import StreamingGroupBy, groupby_stream
+from .sqlite import read_sql, sql
+from .spill import external_sort
+from .aggregation import Accumulator, register_aggregation
@@ -0,0 +1,385 @@
+import abc
+import math
+
+class Accumulator(abc.ABC):
+    """
+    Base class for mergeable aggregations.
+
+    An accumulator describes how to fold non-None values into a per-group
+    state and turn that state into a result:
+      init()               -> fresh state
+      update(state, value) -> new state
+      merge(state, other)  -> state combining two partial states
+      finalize(state)      -> result value
+    States should be plain numbers, strings, lists or None so partial
+    results can be pickled or JSON-serialised and merged elsewhere
+    (set-based states such as nunique's pickle but are not JSON-safe).
+
+    Accumulators with `shares_values = True` keep the list of a group's
+    values as their state; GroupBy.agg collects that list once per column
+    and hands the same lists to all of them. Set `skips_none = False` to
+    have update() called for None values too.
+    """
+    name = None
+    shares_values = False
+    skips_none = True
+
+    def init(self):
+        return None
+
+    @abc.abstractmethod
+    def update(self, state, value):
+        """Fold one value into `state` and return the new state."""
+
+    @abc.abstractmethod
+    def merge(self, state, other):
+        """Combine two partial states into one."""
+
+    def finalize(self, state):
+        return state
+
+    def update_many(self, states, group_ids, values):
+        """Fold a column into `states` (indexed by dense group id)."""
+        update = self.update
+        skips_none = self.skips_none
+        for gid, value in zip(group_ids, values):
+            if value is not None or not skips_none:
+                states[gid] = update(states[gid], value)
+
+class SumAccumulator(Accumulator):
+    name = 'sum'
+
+    def update(self, state, value):
+        return value if state is None else state + value
+
+    def merge(self, state, other):
+        if state is None:
+            return other
+        if other is None:
+            return state
+        return state + other
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                states[gid] = value if state is None else state + value
+
+class CountAccumulator(Accumulator):
+    name = 'count'
+
+    def init(self):
+        return 0
+
+    def update(self, state, value):
+        return state + 1
+
+    def merge(self, state, other):
+        return state + other
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                states[gid] += 1
+
+class MinAccumulator(Accumulator):
+    name = 'min'
+
+    def update(self, state, value):
+        return value if state is None or value < state else state
+
+    def merge(self, state, other):
+        if state is None:
+            return other
+        if other is None:
+            return state
+        return other if other < state else state
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                if state is None or value < state:
+                    states[gid] = value
+
+class MaxAccumulator(Accumulator):
+    name = 'max'
+
+    def update(self, state, value):
+        return value if state is None or value > state else state
+
+    def merge(self, state, other):
+        if state is None:
+            return other
+        if other is None:
+            return state
+        return other if other > state else state
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                if state is None or value > state:
+                    states[gid] = value
+
+class MeanAccumulator(Accumulator):
+    """State: [sum, count]."""
+    name = 'mean'
+
+    def init(self):
+        return [0, 0]
+
+    def update(self, state, value):
+        state[0] += value
+        state[1] += 1
+        return state
+
+    def merge(self, state, other):
+        return [state[0] + other[0], state[1] + other[1]]
+
+    def finalize(self, state):
+        return state[0] / state[1] if state[1] else None
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                state[0] += value
+                state[1] += 1
+
+class VarAccumulator(Accumulator):
+    """
+    Sample variance (ddof=1) via Welford's online update.
+    State: [count, mean, M2]; partial states combine with Chan's formula.
+    """
+    name = 'var'
+
+    def init(self):
+        return [0, 0.0, 0.0]
+
+    def update(self, state, value):
+        n = state[0] + 1
+        delta = value - state[1]
+        mean = state[1] + delta / n
+        state[0] = n
+        state[1] = mean
+        state[2] += delta * (value - mean)
+        return state
+
+    def merge(self, state, other):
+        n_a, mean_a, m2_a = state
+        n_b, mean_b, m2_b = other
+        n = n_a + n_b
+        if not n:
+            return [0, 0.0, 0.0]
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        return [n, mean, m2_a + m2_b + delta * delta * n_a * n_b / n]
+
+    def finalize(self, state):
+        if state[0] < 2:
+            return None
+        return state[2] / (state[0] - 1)
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                n = state[0] + 1
+                delta = value - state[1]
+                mean = state[1] + delta / n
+                state[0] = n
+                state[1] = mean
+                state[2] += delta * (value - mean)
+
+class StdAccumulator(VarAccumulator):
+    name = 'std'
+
+    def finalize(self, state):
+        var = VarAccumulator.finalize(self, state)
+        return None if var is None else math.sqrt(var)
+
+class ProdAccumulator(Accumulator):
+    name = 'prod'
+
+    def update(self, state, value):
+        return value if state is None else state * value
+
+    def merge(self, state, other):
+        if state is None:
+            return other
+        if other is None:
+            return state
+        return state * other
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                state = states[gid]
+                states[gid] = value if state is None else state * value
+
+class SizeAccumulator(CountAccumulator):
+    """Number of rows per group, None values included."""
+    name = 'size'
+    skips_none = False
+
+    def update_many(self, states, group_ids, values):
+        for gid in group_ids:
+            states[gid] += 1
+
+class FirstAccumulator(Accumulator):
+    """First non-None value; merge(a, b) treats `a` as the earlier part."""
+    name = 'first'
+
+    def update(self, state, value):
+        return value if state is None else state
+
+    def merge(self, state, other):
+        return other if state is None else state
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None and states[gid] is None:
+                states[gid] = value
+
+class LastAccumulator(Accumulator):
+    """Last non-None value; merge(a, b) treats `b` as the later part."""
+    name = 'last'
+
+    def update(self, state, value):
+        return value
+
+    def merge(self, state, other):
+        return state if other is None else other
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                states[gid] = value
+
+class NuniqueAccumulator(Accumulator):
+    """State: set of distinct non-None values."""
+    name = 'nunique'
+
+    def init(self):
+        return set()
+
+    def update(self, state, value):
+        state.add(value)
+        return state
+
+    def merge(self, state, other):
+        return set(state) | set(other)
+
+    def finalize(self, state):
+        return len(state)
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                states[gid].add(value)
+
+class ValuesAccumulator(Accumulator):
+    """
+    Base for order statistics that need every value: the state is the
+    list of a group's non-None values.
+    """
+    shares_values = True
+
+    def init(self):
+        return []
+
+    def update(self, state, value):
+        state.append(value)
+        return state
+
+    def merge(self, state, other):
+        return state + other
+
+    def update_many(self, states, group_ids, values):
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                states[gid].append(value)
+
+def _quantile(values, q):
+    """Quantile of a non-empty list with linear interpolation."""
+    values = sorted(values)
+    pos = (len(values) - 1) * q
+    lower = int(pos)
+    frac = pos - lower
+    if not frac:
+        return values[lower]
+    return values[lower] + (values[lower + 1] - values[lower]) * frac
+
+class QuantileAccumulator(ValuesAccumulator):
+    """quantile(q) with linear interpolation; 'quantile' by name is q=0.5."""
+    name = 'quantile'
+
+    def __init__(self, q=0.5):
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        self.q = q
+        if q != 0.5:
+            self.name = f"quantile_{q:g}"
+
+    def finalize(self, state):
+        return _quantile(state, self.q) if state else None
+
+class MedianAccumulator(QuantileAccumulator):
+    name = 'median'
+
+    def __init__(self):
+        QuantileAccumulator.__init__(self, 0.5)
+
+class FunctionAccumulator(ValuesAccumulator):
+    """Wraps a plain function applied to the list of a group's values."""
+    def __init__(self, func):
+        self.func = func
+        self.name = getattr(func, '__name__', 'func')
+
+    def finalize(self, state):
+        return self.func(state) if state else None
+
+AGGREGATIONS = {
+    cls.name: cls
+    for cls in (
+        SumAccumulator,
+        CountAccumulator,
+        MinAccumulator,
+        MaxAccumulator,
+        MeanAccumulator,
+        VarAccumulator,
+        StdAccumulator,
+        ProdAccumulator,
+        SizeAccumulator,
+        FirstAccumulator,
+        LastAccumulator,
+        NuniqueAccumulator,
+        QuantileAccumulator,
+        MedianAccumulator,
+    )
+}
+
+def register_aggregation(name, accumulator_cls):
+    """
+    Make an Accumulator subclass available by name to GroupBy.agg,
+    StreamingGroupBy and the other aggregation entry points.
+    """
+    if not (isinstance(accumulator_cls, type) and issubclass(accumulator_cls, Accumulator)):
+        raise TypeError("accumulator_cls must be a subclass of Accumulator")
+    AGGREGATIONS[name] = accumulator_cls
+
+def get_accumulator(func):
+    """
+    Resolve an aggregation name, Accumulator class or instance, or a plain
+    function taking the list of a group's values.
+    """
+    if isinstance(func, Accumulator):
+        return func
+    if isinstance(func, type) and issubclass(func, Accumulator):
+        return func()
+    if callable(func):
+        return FunctionAccumulator(func)
+    if func not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation function '{func}'")
+    return AGGREGATIONS[func]()
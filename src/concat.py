@@ -1,9 +1,40 @@
 from .core import DataFrame
 
-def concat(objs):
+def concat(objs, axis=0, ignore_index=None, keys=None):
+    """
+    Concatenate DataFrames along rows (axis=0) or columns (axis=1).
+
+    Row concatenation is lazy: the result keeps references to each input's
+    column lists (O(number of frames), missing columns read as None) and
+    only flattens them on the first positional access, while iteration
+    such as iter_chunks() or to_csv() walks the pieces directly. The
+    shared lists are copy-on-write, so later in-place changes to an input
+    copy its column first and the result keeps the values it was built
+    from.
+
+    On axis=0 the index is 0..n-1 by default, as it always was, so
+    labels stay unique (e.g. for chunks of one read_csv).
+    ignore_index=False keeps the inputs' indexes concatenated instead,
+    which is also the default when `keys` is given. `keys` labels each
+    input: index labels become (key, label) tuples on axis=0, columns
+    become '<key>_<column>' on axis=1 (where ignore_index=True numbers
+    the columns instead).
+    """
+    objs = list(objs)
     if not objs:
         raise ValueError("No objects to concatenate")
-    
+    if keys is not None:
+        keys = list(keys)
+        if len(keys) != len(objs):
+            raise ValueError(f"Got {len(keys)} keys for {len(objs)} objects")
+
+    if axis in (1, 'columns'):
+        return _concat_columns(objs, bool(ignore_index), keys)
+    if axis not in (0, 'index'):
+        raise ValueError(f"No axis named {axis!r}")
+    if ignore_index is None:
+        ignore_index = keys is None
+
     # 1. Collect all unique columns
     all_columns = []
     seen_columns = set()
@@ -12,24 +43,51 @@ def concat(objs):
             if col not in seen_columns:
                 all_columns.append(col)
                 seen_columns.add(col)
-                
-    # 2. Build Result Data
-    result_data = {col: [] for col in all_columns}
-    
-    for df in objs:
-        current_len = df.shape[0]
-        
-        for col in all_columns:
-            if col in df.columns:
-                # Append existing data
-                col_data = df._data[col]
-                # Ensure we handle slicer logic if df is a view (iloc result)
-                # But currently df._data is the full column list. 
-                # If df is result of iloc slicing, it returns a new DF with sliced lists.
-                # So we can just extend.
-                result_data[col].extend(col_data)
-            else:
-                # Append None for missing columns
-                result_data[col].extend([None] * current_len)
-                
-    return DataFrame(result_data)
+
+    # 2. Reference every input's row blocks (nested concats stay flat)
+    blocks = []
+    for n, df in enumerate(objs):
+        for data, index, length in df._iter_blocks():
+            if keys is not None and not ignore_index:
+                index = [(keys[n], label) for label in index]
+            blocks.append((data, index, length))
+
+    return DataFrame._from_blocks(all_columns, blocks, ignore_index)
+
+def _concat_columns(objs, ignore_index, keys):
+    """
+    Side-by-side concatenation. Frames sharing one index are stitched
+    directly; otherwise rows are aligned on the union of index labels
+    (first-seen order), with None where a frame lacks a label.
+    """
+    from .merge import _gather
+
+    index = objs[0].index
+    aligned = all(df.index == index for df in objs[1:])
+    if not aligned:
+        index = []
+        seen = set()
+        for df in objs:
+            if len(set(df.index)) != len(df.index):
+                raise ValueError("Cannot align frames with duplicate index labels")
+            for label in df.index:
+                if label not in seen:
+                    seen.add(label)
+                    index.append(label)
+
+    result_data = {}
+    for n, df in enumerate(objs):
+        if not aligned:
+            position = {label: i for i, label in enumerate(df.index)}
+            missing = len(df.index)
+            positions = [position.get(label, missing) for label in index]
+        for col, values in df._data.items():
+            if keys is not None:
+                col = f"{keys[n]}_{col}"
+            if col in result_data:
+                raise ValueError(f"Duplicate column '{col}' in axis=1 concat; pass keys=")
+            result_data[col] = values if aligned else _gather(values, positions)
+
+    if ignore_index:
+        result_data = {i: values for i, values in enumerate(result_data.values())}
+    return DataFrame(result_data, index=index)
@@ -1,11 +1,22 @@
-from .series import Series
-from .indexing import _iLocIndexer, _LocIndexer
+from .series import Series, BooleanMask
+from .indexing import _iLocIndexer, _LocIndexer, _AtIndexer, _iAtIndexer, _row_taker, _mask_positions
 
 class DataFrame:
     def __init__(self, data=None, index=None):
+        # Row blocks (columns dict, index list, length) left by concat,
+        # flattened into _data / index on first access; see _flatten.
+        self._blocks = None
+        self._ignore_index = False
+        # Columns whose lists are also referenced by another frame (lazy
+        # concat blocks); copied before the first in-place write.
+        self._shared = set()
+        # Index label -> first position, built on demand for label lookups.
+        self._label_map = None
         self._data = {}
         self._length = 0
         self.index = []
+        # GroupBy key factorizations, reused until the frame is modified.
+        self._grouping_cache = {}
 
         if data is None:
             if index is not None:
@@ -64,17 +75,159 @@ class DataFrame:
                 raise ValueError(f"Index length {len(index)} does not match data length {self._length}")
             self.index = list(index)
 
+    @classmethod
+    def _from_blocks(cls, columns, blocks, ignore_index=False):
+        """
+        A frame backed by row blocks of other frames' column lists, with
+        no copying: columns missing from a block read as None. The lists
+        are only flattened once something needs random access.
+        """
+        df = cls()
+        df._store = dict.fromkeys(columns)
+        df._blocks = blocks
+        df._ignore_index = ignore_index
+        df._length = sum(length for _, _, length in blocks)
+        return df
+
+    def _flatten(self):
+        import itertools
+        blocks = self._blocks
+        chain = itertools.chain.from_iterable
+        self._store = {
+            col: list(chain(
+                data[col] if col in data else itertools.repeat(None, length)
+                for data, _, length in blocks
+            ))
+            for col in self._store
+        }
+        if self._ignore_index:
+            self._index = list(range(self._length))
+        else:
+            self._index = list(chain(index for _, index, _ in blocks))
+        self._blocks = None
+
+    @property
+    def _data(self):
+        if self._blocks is not None:
+            self._flatten()
+        return self._store
+
+    @_data.setter
+    def _data(self, value):
+        self._store = value
+
+    @property
+    def index(self):
+        if self._blocks is not None:
+            self._flatten()
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        if self._blocks is not None:
+            self._flatten()
+        self._index = value
+        self._label_map = None
+
+    def _label_positions(self):
+        """Cached {label: first position} over the index."""
+        if self._label_map is None:
+            index = self.index
+            self._label_map = dict(zip(reversed(index), range(len(index) - 1, -1, -1)))
+        return self._label_map
+
+    def _label_to_positions(self, label):
+        """Every position holding `label`: O(1) when the index is unique."""
+        label_map = self._label_positions()
+        if label not in label_map:
+            raise KeyError(f"Label '{label}' not found in index")
+        if len(label_map) == self._length:
+            return [label_map[label]]
+        return [i for i, x in enumerate(self.index) if x == label]
+
+    def _writable_column(self, col):
+        """
+        The column list itself, for in-place writes: copied first if
+        another frame shares it (copy-on-write).
+        """
+        values = self._data[col]
+        if col in self._shared:
+            values = self._store[col] = list(values)
+            self._shared.discard(col)
+        self._grouping_cache.clear()
+        return values
+
+    def _iter_blocks(self):
+        """(columns dict, index, length) per row block, without flattening."""
+        if self._blocks is not None:
+            if not self._ignore_index:
+                return iter(self._blocks)
+            # The stored block indexes are the inputs'; number rows 0..n-1.
+            blocks = []
+            start = 0
+            for data, _, length in self._blocks:
+                blocks.append((data, list(range(start, start + length)), length))
+                start += length
+            return iter(blocks)
+        # The caller keeps references to these lists (in a dict of its own,
+        # so copy-on-write here does not change what it sees).
+        self._shared.update(self._store)
+        return iter([(dict(self._store), self._index, self._length)])
+
+    def iter_chunks(self):
+        """
+        Yield the frame as DataFrames of its row blocks (one per frame it
+        was concatenated from) without flattening it; a plain frame yields
+        itself. Chunks share the underlying lists (copied on first write).
+        """
+        if self._blocks is None:
+            yield self
+            return
+        for data, index, length in self._iter_blocks():
+            chunk = DataFrame()
+            chunk._store = {
+                col: data[col] if col in data else [None] * length for col in self._store
+            }
+            chunk._index = index
+            chunk._length = length
+            chunk._shared.update(chunk._store)
+            yield chunk
+
+    @classmethod
+    def _from_columns(cls, data, index):
+        """A frame taking ownership of freshly built column lists (no copy)."""
+        df = cls()
+        df._store = data
+        df._index = index
+        df._length = len(index)
+        return df
+
+    def _take(self, positions, columns=None):
+        """
+        New frame of the rows at `positions` (see indexing._row_taker),
+        gathering only `columns` (default: all).
+        """
+        take = _row_taker(positions)
+        data = self._data
+        if columns is None:
+            columns = self.columns
+        else:
+            for col in columns:
+                if col not in data:
+                    raise KeyError(f"Column '{col}' not found")
+        return DataFrame._from_columns({col: take(data[col]) for col in columns}, take(self.index))
+
     @property
     def columns(self):
         """Returns a list of column names."""
-        return list(self._data.keys())
+        return list(self._store.keys())
 
     @property
     def shape(self):
         """Returns a tuple representing the dimensionality of the DataFrame."""
-        if not self._data and self._length == 0:
+        if not self._store and self._length == 0:
             return (0, 0)
-        return (self._length, len(self._data))
+        return (self._length, len(self._store))
 
     @property
     def iloc(self):
@@ -84,9 +237,21 @@ class DataFrame:
     def loc(self):
         return _LocIndexer(self)
 
+    @property
+    def at(self):
+        return _AtIndexer(self)
+
+    @property
+    def iat(self):
+        return _iAtIndexer(self)
+
     def __getitem__(self, item):
         from .series import Series
         
+        # Boolean masks gather their selected positions directly
+        if isinstance(item, BooleanMask):
+            return self._take(_mask_positions(item, self._length))
+
         # Handle Series as indexer (convert to list)
         # Check by type or name to avoid potential circular import/reloading issues during tests
         if isinstance(item, Series) or type(item).__name__ == 'Series':
@@ -106,17 +271,8 @@ class DataFrame:
 
         # 3. List of Booleans: Boolean Indexing
         elif isinstance(item, list) and item and isinstance(item[0], bool):
-            if len(item) != self._length:
-                 raise ValueError(f"Item length {len(item)} does not match DataFrame length {self._length}")
-            
-            new_data = {}
-            for col, values in self._data.items():
-                new_column = [val for val, keep in zip(values, item) if keep]
-                new_data[col] = new_column
-            
-            new_index = [idx for idx, keep in zip(self.index, item) if keep]
-            return DataFrame(new_data, index=new_index)
-        
+            return self._take(_mask_positions(item, self._length))
+
         # 4. Empty list
         elif isinstance(item, list) and not item:
             return DataFrame({}, index=[])
@@ -161,6 +317,8 @@ class DataFrame:
             new_col_data = [value] * target_len
             
         self._data[key] = new_col_data
+        self._shared.discard(key)
+        self._grouping_cache.clear()
 
     def sort_values(self, by, ascending=True, na_position='last'):
         if by not in self._data:
@@ -175,22 +333,24 @@ class DataFrame:
         none_indices = [i for i in indices if col_data[i] is None]
         valid_indices = [i for i in indices if col_data[i] is not None]
         
-        valid_indices.sort(key=lambda i: col_data[i], reverse=not ascending)
+        valid_indices.sort(key=col_data.__getitem__, reverse=not ascending)
         
         if na_position == 'last':
             sorted_indices = valid_indices + none_indices
         else: # first
             sorted_indices = none_indices + valid_indices
             
-        return self.iloc[sorted_indices]
+        return self._take(sorted_indices)
 
     def to_dict(self, orient="records"):
         if orient == "records":
             records = []
+            data = self._data
+            columns = self.columns
             for i in range(self.shape[0]):
                 row = {}
-                for col in self.columns:
-                    row[col] = self._data[col][i]
+                for col in columns:
+                    row[col] = data[col][i]
                 records.append(row)
             return records
         elif orient == "list":
@@ -217,38 +377,39 @@ class DataFrame:
         return DataFrame(new_data)
 
     def dropna(self):
-        # Identify indices to keep
-        keep_indices = []
-        for i in range(self.shape[0]):
-            has_none = False
-            for col in self.columns:
-                if self._data[col][i] is None:
-                    has_none = True
-                    break
-            if not has_none:
-                keep_indices.append(i)
-        
-        # Create new DataFrame with kept rows
-        if not keep_indices:
-            return DataFrame({col: [] for col in self.columns})
-        
-        return self.iloc[keep_indices]
-
-    def to_csv(self, filepath):
+        # Positions holding a None in any column, found column by column
+        dropped = set()
+        for values in self._data.values():
+            if None in values:
+                dropped.update(i for i, val in enumerate(values) if val is None)
+
+        if not dropped:
+            return self._take(range(self._length))
+        return self._take([i for i in range(self._length) if i not in dropped])
+
+    def to_csv(self, filepath, columns=None, sep=',', float_format=None,
+               na_rep='', header=True, mode='w', chunksize=None, compression='infer'):
         from .io import to_csv
-        to_csv(self, filepath)
+        to_csv(self, filepath, columns=columns, sep=sep, float_format=float_format,
+               na_rep=na_rep, header=header, mode=mode, chunksize=chunksize,
+               compression=compression)
 
-    def to_json(self, filepath_or_buffer):
+    def to_json(self, filepath_or_buffer, compression='infer', orient='records', indent=None):
         from .io import to_json
-        to_json(self, filepath_or_buffer)
+        to_json(self, filepath_or_buffer, compression=compression, orient=orient, indent=indent)
 
-    def to_ndjson(self, filepath_or_buffer):
+    def to_ndjson(self, filepath_or_buffer, compression='infer', orient='records'):
         from .io import to_ndjson
-        to_ndjson(self, filepath_or_buffer)
+        to_ndjson(self, filepath_or_buffer, compression=compression, orient=orient)
 
-    def groupby(self, by, as_index=True):
+    def to_sql(self, name, conn, if_exists='fail', chunksize=None, index=False, index_label=None):
+        from .sqlite import to_sql
+        to_sql(self, name, conn, if_exists=if_exists, chunksize=chunksize, index=index,
+               index_label=index_label)
+
+    def groupby(self, by, as_index=True, sort=True, dropna=False, workers=None):
         from .groupby import GroupBy
-        return GroupBy(self, by, as_index=as_index)
+        return GroupBy(self, by, as_index=as_index, sort=sort, dropna=dropna, workers=workers)
 
     def apply(self, func, axis=0):
         if axis == 0:
@@ -290,9 +451,44 @@ class DataFrame:
         else:
              raise ValueError("Axis must be 0 or 1")
 
-    def merge(self, right, on: str, how: str = 'inner'):
+    def merge(self, right, on=None, how: str = 'inner', spill: bool = False, partitions: int = 16,
+              left_on=None, right_on=None, suffixes=('_x', '_y'), algorithm='hash'):
         from .merge import merge
-        return merge(self, right, on, how)
+        return merge(self, right, on, how, spill=spill, partitions=partitions,
+                     left_on=left_on, right_on=right_on, suffixes=suffixes,
+                     algorithm=algorithm)
+
+    def pivot_table(self, index, columns, values=None, aggfunc='mean', fill_value=None,
+                    dropna=True, as_index=True):
+        from .reshape import pivot_table
+        return pivot_table(self, index, columns, values=values, aggfunc=aggfunc,
+                           fill_value=fill_value, dropna=dropna, as_index=as_index)
+
+    def pivot(self, index, columns, values=None):
+        from .reshape import pivot
+        return pivot(self, index, columns, values=values)
+
+    def melt(self, id_vars=None, value_vars=None, var_name='variable', value_name='value'):
+        from .reshape import melt
+        return melt(self, id_vars=id_vars, value_vars=value_vars,
+                    var_name=var_name, value_name=value_name)
+
+    def build_join_index(self, on):
+        from .merge import JoinIndex
+        return JoinIndex(self, on)
+
+    def isin_frame(self, other, on):
+        """BooleanMask: whether each row's `on` key occurs in `other`."""
+        from .merge import _as_key_list, _key_column
+        on_cols = _as_key_list(on)
+        for col in on_cols:
+            if col not in self._data:
+                raise KeyError(f"Column '{col}' not found")
+            if col not in other.columns:
+                raise KeyError(f"Column '{col}' not found in other DataFrame")
+        key_set = set(_key_column(other, on_cols))
+        flags = bytearray(key in key_set for key in _key_column(self, on_cols))
+        return BooleanMask._from_flags(flags, index=self.index)
 
     def drop(self, columns):
         """Return a new DataFrame with specified columns removed."""
@@ -1,114 +1,421 @@
 from .core import DataFrame
+from .indexing import _take
+
+def _normalize_by(by):
+    if isinstance(by, str):
+        return [by]
+    elif isinstance(by, list):
+        return by
+    else:
+        raise TypeError("Group key must be a string or list of strings")
+
+def _normalize_agg_spec(aggs=None, named=None):
+    """
+    Turn {col: func} / {col: [func, ...]} plus named aggregations
+    {output: (col, func)} into a list of (output_name, column, accumulator).
+    A list of functions names its outputs '<col>_<func>'.
+    """
+    from .aggregation import get_accumulator
+
+    if aggs is None and not named:
+        raise TypeError("No aggregations given")
+    if aggs is not None and not isinstance(aggs, dict):
+        raise TypeError("aggs must be a dictionary")
+
+    specs = []
+    for col, funcs in (aggs or {}).items():
+        if isinstance(funcs, (list, tuple)):
+            for func in funcs:
+                acc = get_accumulator(func)
+                name = func if isinstance(func, str) else acc.name
+                specs.append((f"{col}_{name}", col, acc))
+        else:
+            specs.append((col, col, get_accumulator(funcs)))
+
+    for output, spec in (named or {}).items():
+        if not isinstance(spec, tuple) or len(spec) != 2:
+            raise TypeError(f"Named aggregation '{output}' must be a (column, func) tuple")
+        col, func = spec
+        specs.append((output, col, get_accumulator(func)))
+
+    names = [name for name, _, _ in specs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate aggregation output names: {names}")
+    return specs
+
+def _factorize(by_data, key_to_id, keys):
+    """
+    Map each row's group key to a dense group id, registering unseen keys
+    in `key_to_id` / `keys`. Single keys are used as-is, multiple keys as
+    tuples.
+    """
+    group_ids = []
+    append = group_ids.append
+    get = key_to_id.get
+    rows = by_data[0] if len(by_data) == 1 else zip(*by_data)
+    for key in rows:
+        gid = get(key)
+        if gid is None:
+            gid = len(keys)
+            key_to_id[key] = gid
+            keys.append(key)
+        append(gid)
+    return group_ids
+
+def _sort_key(key):
+    return tuple((x is None, x) for x in key)
+
+def _sorted_group_order(by_cols, keys):
+    key_tuples = [(key,) for key in keys] if len(by_cols) == 1 else keys
+    return sorted(range(len(keys)), key=lambda gid: _sort_key(key_tuples[gid]))
+
+def _compute_states(specs, group_ids, n_slots, columns):
+    """
+    Fold each spec's column (from the `columns` dict) into per-group
+    states. Specs on the same column are updated together in one pass
+    over the group ids; a column with a single accumulator uses its
+    update_many fast path.
+    """
+    states_list = [None] * len(specs)
+    by_column = {}
+    for n, (_, col, _) in enumerate(specs):
+        by_column.setdefault(col, []).append(n)
+
+    for col, spec_ids in by_column.items():
+        # One collected value list per column serves every order
+        # statistic / function on it.
+        targets = []
+        shared = None
+        for n in spec_ids:
+            acc = specs[n][2]
+            if acc.shares_values and shared is not None:
+                states_list[n] = shared
+                continue
+            states = [acc.init() for _ in range(n_slots)]
+            if acc.shares_values:
+                shared = states
+            states_list[n] = states
+            targets.append((acc, states))
+
+        values = columns[col]
+        if len(targets) == 1:
+            acc, states = targets[0]
+            acc.update_many(states, group_ids, values)
+            continue
+        updates = [(acc.update, states) for acc, states in targets if acc.skips_none]
+        none_updates = [(acc.update, states) for acc, states in targets if not acc.skips_none]
+        for gid, value in zip(group_ids, values):
+            if value is not None:
+                for update, states in updates:
+                    states[gid] = update(states[gid], value)
+            for update, states in none_updates:
+                states[gid] = update(states[gid], value)
+    return states_list
+
+def _finalize_states(specs, states_list):
+    return [
+        [acc.finalize(state) for state in states]
+        for (_, _, acc), states in zip(specs, states_list)
+    ]
+
+def _build_result(by_cols, keys, names, values_list, as_index, order=None):
+    """
+    Assemble the agg() output frame from finalized per-group values, in
+    `order` (group ids; sorted by key when omitted).
+    With as_index and a single key, the key becomes the index.
+    """
+    key_tuples = [(key,) for key in keys] if len(by_cols) == 1 else keys
+    if order is None:
+        order = _sorted_group_order(by_cols, keys)
+
+    key_as_index = as_index and len(by_cols) == 1
+    result_data = {}
+    if not key_as_index:
+        for i, col in enumerate(by_cols):
+            result_data[col] = [key_tuples[gid][i] for gid in order]
+
+    for name, values in zip(names, values_list):
+        result_data[name] = [values[gid] for gid in order]
+
+    index = [keys[gid] for gid in order] if key_as_index else None
+    return DataFrame(result_data, index=index)
+
+# Frames smaller than this are aggregated in-process even with workers=N.
+_PARALLEL_MIN_ROWS = 100000
+
+def _agg_shard(specs, global_ids, n_shards, columns):
+    """
+    Worker entry point: aggregate one hash shard. Shard s holds the groups
+    with id % n_shards == s, so id // n_shards is a dense local id.
+    """
+    local_ids = [gid // n_shards for gid in global_ids]
+    n_local = max(local_ids) + 1 if local_ids else 0
+    return _finalize_states(specs, _compute_states(specs, local_ids, n_local, columns))
+
+def _parallel_agg_values(specs, group_ids, n_slots, columns, workers):
+    """
+    Finalized per-group values computed by `workers` processes, each given
+    one shard of the groups and only the columns it aggregates.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    shard_positions = [[] for _ in range(workers)]
+    for i, gid in enumerate(group_ids):
+        shard_positions[gid % workers].append(i)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for positions in shard_positions:
+            shard_columns = {col: _take(values, positions) for col, values in columns.items()}
+            futures.append(pool.submit(
+                _agg_shard, specs, _take(group_ids, positions), workers, shard_columns
+            ))
+        shard_results = [future.result() for future in futures]
+
+    # Shards hold disjoint groups and every group id has rows, so shard s
+    # returns exactly the ids s, s + workers, ...: scatter them back.
+    values_list = [[None] * n_slots for _ in specs]
+    for shard, shard_values in enumerate(shard_results):
+        for values, local_values in zip(values_list, shard_values):
+            values[shard::workers] = local_values
+    return values_list
+
+class _Grouping:
+    """
+    Key factorization of a frame: a dense group id per row plus the keys
+    in first-seen order. With dropna, rows whose key contains None share
+    one extra id (== len(keys)) that no output ever reports.
+    Cached on the DataFrame, so it is shared by every GroupBy over the
+    same keys until the frame is modified.
+    """
+    def __init__(self, df, by_cols, dropna):
+        self.by_cols = by_cols
+        self.key_to_id = {}
+        self.keys = []
+        by_data = [df._data[col] for col in by_cols]
+        self.group_ids = _factorize(by_data, self.key_to_id, self.keys)
+        self.has_dropped = False
+        if dropna:
+            self._drop_null_keys()
+        self._sorted_order = None
+
+    def _drop_null_keys(self):
+        single = len(self.by_cols) == 1
+        dropped = [key is None if single else None in key for key in self.keys]
+        if not any(dropped):
+            return
+
+        kept = [key for key, drop in zip(self.keys, dropped) if not drop]
+        null_id = len(kept)
+        remap = []
+        next_id = 0
+        for drop in dropped:
+            if drop:
+                remap.append(null_id)
+            else:
+                remap.append(next_id)
+                next_id += 1
+
+        self.keys = kept
+        self.key_to_id = {key: gid for gid, key in enumerate(kept)}
+        self.group_ids = [remap[gid] for gid in self.group_ids]
+        self.has_dropped = True
+
+    @property
+    def n_slots(self):
+        """Size of per-group state arrays (real groups plus the dropped slot)."""
+        return len(self.keys) + self.has_dropped
+
+    @property
+    def sorted_order(self):
+        if self._sorted_order is None:
+            self._sorted_order = _sorted_group_order(self.by_cols, self.keys)
+        return self._sorted_order
+
+def _get_grouping(df, by_cols, dropna):
+    cache_key = (tuple(by_cols), dropna)
+    grouping = df._grouping_cache.get(cache_key)
+    if grouping is None:
+        grouping = _Grouping(df, by_cols, dropna)
+        df._grouping_cache[cache_key] = grouping
+    return grouping
 
 class GroupBy:
-    def __init__(self, df, by, as_index=True):
+    def __init__(self, df, by, as_index=True, sort=True, dropna=False, workers=None):
         self.df = df
         self.by = by
         self.as_index = as_index
+        self.sort = sort
+        self.dropna = dropna
+        # agg() on frames of _PARALLEL_MIN_ROWS or more hash-partitions the
+        # groups over this many worker processes.
+        self.workers = workers
         
         # Normalize 'by' to always be a list for consistent internal handling
-        if isinstance(by, str):
-            self.by_cols = [by]
-        elif isinstance(by, list):
-            self.by_cols = by
-        else:
-             raise TypeError("Group key must be a string or list of strings")
+        self.by_cols = _normalize_by(by)
             
         for col in self.by_cols:
             if col not in df.columns:
                 raise KeyError(f"Column '{col}' not found")
 
-        # Group indices: {group_key_tuple: [row_idx1, row_idx2, ...]}
-        self.groups = {}
-        
-        # Pre-fetch columns for performance
-        by_data = [df._data[col] for col in self.by_cols]
-        num_rows = df.shape[0]
-        
-        for idx in range(num_rows):
-            # Create a tuple key
-            key = tuple(col_data[idx] for col_data in by_data)
-            
-            if key not in self.groups:
-                self.groups[key] = []
-            self.groups[key].append(idx)
+        # Dense group id per row, computed once (and cached on the frame).
+        # Aggregations scan each column a single time against these ids
+        # instead of keeping an index list per group.
+        self._grouping = _get_grouping(df, self.by_cols, dropna)
+        self._key_to_id = self._grouping.key_to_id
+        self._keys = self._grouping.keys
+        self._group_ids = self._grouping.group_ids
+        self._n_slots = self._grouping.n_slots
+        self._null_id = len(self._keys) if self._grouping.has_dropped else None
 
-    def agg(self, func_dict):
-        """Aggregate using a dictionary mapping columns to functions."""
-        if not isinstance(func_dict, dict):
-            raise TypeError("agg must be called with a dictionary")
-            
-        # Result structure
-        result_data = {col: [] for col in self.by_cols} if not self.as_index or len(self.by_cols) > 1 else {}
-        # If as_index=True and single by col, 'by' col becomes index, not data col.
-        
-        agg_cols = list(func_dict.keys())
-        for col in agg_cols:
-             result_data[col] = []
-             
-        # Sorting keys
-        def safe_key(k):
-            return tuple((x is None, x) for x in k)
-        sorted_keys = sorted(self.groups.keys(), key=safe_key)
-        
-        result_index = []
-        
-        for key in sorted_keys:
-            indices = self.groups[key]
-            
-            # Handle Grouping Keys
-            if not self.as_index or len(self.by_cols) > 1:
-                for i, col in enumerate(self.by_cols):
-                    result_data[col].append(key[i])
-            else:
-                # Single key as index
-                result_index.append(key[0])
-            
-            # Handle Aggregations
-            for col, func_name in func_dict.items():
-                if col not in self.df._data:
-                     # Could raise error or fill None. Pandas raises KeyError usually.
-                     # Let's be strict.
-                     raise KeyError(f"Column '{col}' not found")
-                
-                values = [self.df._data[col][i] for i in indices if self.df._data[col][i] is not None]
-                
-                val = None
-                if func_name == 'count':
-                    # Count includes None? standard pandas count excludes NaN.
-                    # My previous implementation was len(values) where values excluded None. Correct.
-                    val = len(values)
-                elif not values:
-                    val = None
-                elif func_name == 'sum':
-                    val = sum(values)
-                elif func_name == 'mean':
-                    val = sum(values) / len(values)
-                elif func_name == 'min':
-                    val = min(values)
-                elif func_name == 'max':
-                    val = max(values)
-                else:
-                    raise ValueError(f"Unknown aggregation function '{func_name}'")
-                
-                result_data[col].append(val)
-        
-        return DataFrame(result_data, index=result_index if (self.as_index and len(self.by_cols) == 1) else None)
+        # Column(s) picked with g['col'] / g[['a', 'b']]
+        self._selection = None
 
-    def _aggregate(self, func_name):
-        """Helper to aggregate numeric columns."""
-        # Identify numeric columns (excluding 'by' columns)
-        numeric_cols = []
+    @property
+    def ngroups(self):
+        return len(self._keys)
+
+    @property
+    def groups(self):
+        """Group indices: {group_key_tuple: [row_idx1, row_idx2, ...]}"""
+        indices = [[] for _ in range(self._n_slots)]
+        for idx, gid in enumerate(self._group_ids):
+            indices[gid].append(idx)
+        return {key: rows for key, rows in zip(self._key_tuples(), indices)}
+
+    def _key_tuples(self):
+        if len(self.by_cols) == 1:
+            return [(key,) for key in self._keys]
+        return self._keys
+
+    def _result_order(self):
+        """Group ids in output order: sorted keys, or first appearance with sort=False."""
+        if self.sort:
+            return self._grouping.sorted_order
+        return range(len(self._keys))
+
+    def _mask_dropped(self, out):
+        """Blank out rows whose key was dropped (dropna=True)."""
+        null_id = self._null_id
+        if null_id is not None:
+            for i, gid in enumerate(self._group_ids):
+                if gid == null_id:
+                    out[i] = None
+        return out
+
+    def get_group(self, key):
+        """Rows of one group as a DataFrame (key is a tuple for multiple keys)."""
+        gid = self._key_to_id.get(key)
+        if gid is None:
+            raise KeyError(f"Group '{key}' not found")
+        positions = [i for i, g in enumerate(self._group_ids) if g == gid]
+        return self.df._take(positions)
+
+    def __iter__(self):
+        """
+        Yield (key, DataFrame) per group in output order. Row positions are
+        bucketed in one pass; each group's frame is only built when reached.
+        """
+        indices = self.groups
+        key_tuples = self._key_tuples()
+        single = len(self.by_cols) == 1
+        for gid in self._result_order():
+            key = key_tuples[gid]
+            yield (key[0] if single else key), self.df._take(indices[key])
+
+    def __len__(self):
+        return len(self._keys)
+
+    def size(self):
+        """
+        Rows per group: a Series indexed by key for a single key with
+        as_index, otherwise a DataFrame with a 'size' column.
+        """
+        from .series import Series
+        result = self.agg(size=(self.by_cols[0], 'size'))
+        if self.as_index and len(self.by_cols) == 1:
+            return Series(result._data['size'], index=result.index, copy=False)
+        return result
+
+    def __getitem__(self, key):
+        """Select column(s) to operate on, reusing the computed grouping."""
+        cols = [key] if isinstance(key, str) else list(key)
+        for col in cols:
+            if col not in self.df._data:
+                raise KeyError(f"Column '{col}' not found")
+
+        import copy
+        selected = copy.copy(self)
+        selected._selection = key
+        return selected
+
+    def _target_columns(self, numeric_only=False):
+        """Selected columns, or all non-key columns (numeric ones only if asked)."""
+        if self._selection is not None:
+            return [self._selection] if isinstance(self._selection, str) else list(self._selection)
+
+        cols = []
         for col in self.df.columns:
             if col in self.by_cols:
                 continue
-            # Simple check
-            first_val = next((x for x in self.df._data[col] if x is not None), None)
-            if isinstance(first_val, (int, float)):
-                numeric_cols.append(col)
-        
-        # Build func_dict
-        func_dict = {col: func_name for col in numeric_cols}
+            if numeric_only:
+                # Simple check
+                first_val = next((x for x in self.df._data[col] if x is not None), None)
+                if not isinstance(first_val, (int, float)):
+                    continue
+            cols.append(col)
+        return cols
+
+    def _wrap_rowwise(self, results):
+        """Row-aligned results: a Series for a single selected column, else a DataFrame."""
+        from .series import Series
+        if isinstance(self._selection, str):
+            return Series(results[self._selection], index=self.df.index, name=self._selection, copy=False)
+        return DataFrame(results, index=self.df.index)
+
+    def agg(self, func_dict=None, **named):
+        """
+        Aggregate using a dictionary mapping columns to a function or a list
+        of functions, and/or named aggregations: agg(total=('amount', 'sum')).
+        Functions are names from aggregation.AGGREGATIONS, Accumulator
+        classes or instances, or plain functions of a group's value list.
+        """
+        if func_dict is not None and not isinstance(func_dict, dict):
+            raise TypeError("agg must be called with a dictionary")
+
+        specs = _normalize_agg_spec(func_dict, named)
+        for _, col, _ in specs:
+            if col not in self.df._data:
+                raise KeyError(f"Column '{col}' not found")
+
+        # Only the columns being aggregated are touched (or shipped to workers).
+        columns = {col: self.df._data[col] for _, col, _ in specs}
+
+        if self._use_workers(specs):
+            values_list = _parallel_agg_values(
+                specs, self._group_ids, self._n_slots, columns, self.workers
+            )
+        else:
+            states_list = _compute_states(specs, self._group_ids, self._n_slots, columns)
+            values_list = _finalize_states(specs, states_list)
+
+        return _build_result(self.by_cols, self._keys, [name for name, _, _ in specs],
+                             values_list, self.as_index, order=self._result_order())
+
+    def _use_workers(self, specs):
+        """Parallelise only large frames, and only picklable aggregations."""
+        if not self.workers or self.workers < 2 or self.df.shape[0] < _PARALLEL_MIN_ROWS:
+            return False
+        import pickle
+        try:
+            pickle.dumps(specs)
+        except Exception:
+            return False
+        return True
+
+    def _aggregate(self, func_name):
+        """Helper to aggregate numeric (or the selected) columns."""
+        func_dict = {col: func_name for col in self._target_columns(numeric_only=True)}
         return self.agg(func_dict)
 
     def sum(self):
@@ -119,3 +426,299 @@ class GroupBy:
 
     def count(self):
         return self._aggregate('count')
+
+    def min(self):
+        return self._aggregate('min')
+
+    def max(self):
+        return self._aggregate('max')
+
+    def median(self):
+        return self._aggregate('median')
+
+    def std(self):
+        return self._aggregate('std')
+
+    def var(self):
+        return self._aggregate('var')
+
+    def prod(self):
+        return self._aggregate('prod')
+
+    # --- Row-aligned group-wise operations ---
+    # Each returns values aligned to the original rows (same index),
+    # computed in linear passes over the precomputed group ids.
+
+    def transform(self, func):
+        """
+        Broadcast a per-group aggregate back to every row of the group.
+        func is anything agg() accepts: a name such as 'sum' or 'mean', an
+        Accumulator, or a function of the group's non-None value list.
+        """
+        from .aggregation import get_accumulator
+        acc = get_accumulator(func)
+        group_ids = self._group_ids
+        n_groups = self._n_slots
+
+        results = {}
+        for col in self._target_columns():
+            states = [acc.init() for _ in range(n_groups)]
+            acc.update_many(states, group_ids, self.df._data[col])
+            finalized = [acc.finalize(state) for state in states]
+            results[col] = self._mask_dropped([finalized[gid] for gid in group_ids])
+        return self._wrap_rowwise(results)
+
+    def _cumulative(self, op):
+        results = {}
+        n_groups = self._n_slots
+        for col in self._target_columns(numeric_only=True):
+            running = [None] * n_groups
+            out = []
+            append = out.append
+            for gid, value in zip(self._group_ids, self.df._data[col]):
+                if value is None:
+                    append(None)
+                    continue
+                current = running[gid]
+                current = value if current is None else op(current, value)
+                running[gid] = current
+                append(current)
+            results[col] = self._mask_dropped(out)
+        return self._wrap_rowwise(results)
+
+    def cumsum(self):
+        return self._cumulative(lambda x, y: x + y)
+
+    def cumprod(self):
+        return self._cumulative(lambda x, y: x * y)
+
+    def cummax(self):
+        return self._cumulative(lambda x, y: y if y > x else x)
+
+    def cummin(self):
+        return self._cumulative(lambda x, y: y if y < x else x)
+
+    def cumcount(self, ascending=True):
+        """Position of each row within its group (0-based), as a Series."""
+        from .series import Series
+        group_ids = self._group_ids
+        seen = [0] * self._n_slots
+        out = [0] * len(group_ids)
+
+        positions = range(len(group_ids)) if ascending else range(len(group_ids) - 1, -1, -1)
+        for i in positions:
+            gid = group_ids[i]
+            out[i] = seen[gid]
+            seen[gid] += 1
+        return Series(self._mask_dropped(out), index=self.df.index, copy=False)
+
+    def ngroup(self):
+        """Number of each row's group, counting groups in output order."""
+        from .series import Series
+        number = [None] * self._n_slots
+        for n, gid in enumerate(self._result_order()):
+            number[gid] = n
+        return Series([number[gid] for gid in self._group_ids], index=self.df.index, copy=False)
+
+    def shift(self, periods=1, fill_value=None):
+        """Value from `periods` rows earlier in the same group (later if negative)."""
+        group_ids = self._group_ids
+        n = len(group_ids)
+        positions = range(n) if periods >= 0 else range(n - 1, -1, -1)
+        lag = abs(periods)
+
+        results = {}
+        for col in self._target_columns():
+            values = self.df._data[col]
+            history = [[] for _ in range(self._n_slots)]
+            out = [fill_value] * n
+            for i in positions:
+                seen = history[group_ids[i]]
+                if lag == 0:
+                    out[i] = values[i]
+                elif len(seen) >= lag:
+                    out[i] = seen[-lag]
+                seen.append(values[i])
+            results[col] = self._mask_dropped(out)
+        return self._wrap_rowwise(results)
+
+    def diff(self, periods=1):
+        """Difference to the value `periods` rows earlier in the same group."""
+        shifted = self[self._target_columns(numeric_only=True)].shift(periods)
+        results = {}
+        for col in shifted.columns:
+            out = []
+            for value, prev in zip(self.df._data[col], shifted._data[col]):
+                if value is None or prev is None:
+                    out.append(None)
+                    continue
+                try:
+                    out.append(value - prev)
+                except TypeError:
+                    out.append(None)
+            results[col] = out
+        return self._wrap_rowwise(results)
+
+    def rank(self, method='average', ascending=True):
+        """
+        Rank of each value within its group, starting at 1; None stays None.
+        method: 'average', 'min', 'max', 'first' (order of appearance) or
+        'dense'. One sort of all values, then a single pass assigns ranks
+        per group.
+        """
+        if method not in ('average', 'min', 'max', 'first', 'dense'):
+            raise ValueError("method must be 'average', 'min', 'max', 'first' or 'dense'")
+
+        group_ids = self._group_ids
+        n_groups = self._n_slots
+        results = {}
+        for col in self._target_columns(numeric_only=True):
+            values = self.df._data[col]
+            out = [None] * len(values)
+            order = [i for i, value in enumerate(values) if value is not None]
+            # Stable, so ties keep their order of appearance for 'first'.
+            order.sort(key=values.__getitem__, reverse=not ascending)
+
+            counts = [0] * n_groups
+            dense = [0] * n_groups
+            last = [None] * n_groups
+            runs = [[] for _ in range(n_groups)]
+
+            def close_run(gid):
+                run = runs[gid]
+                if not run:
+                    return
+                start = counts[gid]
+                k = len(run)
+                if method == 'first':
+                    for offset, i in enumerate(run, 1):
+                        out[i] = start + offset
+                else:
+                    if method == 'average':
+                        rank = start + (k + 1) / 2
+                    elif method == 'min':
+                        rank = start + 1
+                    elif method == 'max':
+                        rank = start + k
+                    else:
+                        rank = dense[gid]
+                    for i in run:
+                        out[i] = rank
+                counts[gid] = start + k
+                runs[gid] = []
+
+            for i in order:
+                gid = group_ids[i]
+                value = values[i]
+                if runs[gid] and value != last[gid]:
+                    close_run(gid)
+                if not runs[gid]:
+                    dense[gid] += 1
+                    last[gid] = value
+                runs[gid].append(i)
+
+            for gid in range(n_groups):
+                close_run(gid)
+            results[col] = self._mask_dropped(out)
+        return self._wrap_rowwise(results)
+
+def _spec_signature(specs):
+    """
+    What must match for two spec lists' states to merge: output name,
+    column, accumulator type and its parameters (e.g. quantile's q).
+    """
+    return [(name, col, type(acc), vars(acc)) for name, col, acc in specs]
+
+class StreamingGroupBy:
+    """
+    Group-wise aggregation folded chunk by chunk into per-group
+    accumulator states, for data that never fits in one DataFrame.
+
+        sg = StreamingGroupBy('user', {'amount': ['sum', 'mean'], 'ts': 'max'})
+        for chunk in read_csv(path, chunksize=50000):
+            sg.update(chunk)
+        df = sg.result()
+
+    Partial states can be exported with to_state(), rebuilt with
+    from_state() and combined with merge(), so separate workers can
+    aggregate their own inputs.
+    """
+    def __init__(self, by, aggs, as_index=True):
+        self.by_cols = _normalize_by(by)
+        self.as_index = as_index
+        self.aggs = aggs
+        self._specs = _normalize_agg_spec(aggs)
+        self._key_to_id = {}
+        self._keys = []
+        self._states = [[] for _ in self._specs]
+
+    def _grow_states(self):
+        n_groups = len(self._keys)
+        for (_, _, acc), states in zip(self._specs, self._states):
+            for _ in range(n_groups - len(states)):
+                states.append(acc.init())
+
+    def update(self, df):
+        """Fold one DataFrame chunk into the running states."""
+        for col in self.by_cols:
+            if col not in df._data:
+                raise KeyError(f"Column '{col}' not found")
+        for _, col, _ in self._specs:
+            if col not in df._data:
+                raise KeyError(f"Column '{col}' not found")
+
+        by_data = [df._data[col] for col in self.by_cols]
+        group_ids = _factorize(by_data, self._key_to_id, self._keys)
+        self._grow_states()
+
+        for (_, col, acc), states in zip(self._specs, self._states):
+            acc.update_many(states, group_ids, df._data[col])
+        return self
+
+    def merge(self, other):
+        """Combine the partial states of another StreamingGroupBy into this one."""
+        if other.by_cols != self.by_cols or _spec_signature(other._specs) != _spec_signature(self._specs):
+            raise ValueError("Can only merge StreamingGroupBy objects with the same keys and aggregations")
+
+        mapping = _factorize([other._keys], self._key_to_id, self._keys)
+        self._grow_states()
+
+        for (_, _, acc), states, other_states in zip(self._specs, self._states, other._states):
+            for gid, state in zip(mapping, other_states):
+                states[gid] = acc.merge(states[gid], state)
+        return self
+
+    def to_state(self):
+        """Export the partial aggregation as plain lists and dicts."""
+        import copy
+        single = len(self.by_cols) == 1
+        return {
+            'by': list(self.by_cols),
+            'aggs': self.aggs,
+            'as_index': self.as_index,
+            'keys': [[key] if single else list(key) for key in self._keys],
+            'states': copy.deepcopy(self._states),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a StreamingGroupBy from to_state() output (e.g. after JSON)."""
+        import copy
+        obj = cls(state['by'], state['aggs'], as_index=state.get('as_index', True))
+        single = len(obj.by_cols) == 1
+        obj._keys = [key[0] if single else tuple(key) for key in state['keys']]
+        obj._key_to_id = {key: gid for gid, key in enumerate(obj._keys)}
+        obj._states = copy.deepcopy(state['states'])
+        return obj
+
+    def result(self):
+        """Finalize the states into a DataFrame, sorted by group key."""
+        return _build_result(self.by_cols, self._keys, [name for name, _, _ in self._specs],
+                             _finalize_states(self._specs, self._states), self.as_index)
+
+def groupby_stream(chunks, by, aggs, as_index=True):
+    """Aggregate an iterable of DataFrame chunks; see StreamingGroupBy."""
+    sg = StreamingGroupBy(by, aggs, as_index=as_index)
+    for chunk in chunks:
+        sg.update(chunk)
+    return sg.result()
@@ -1,51 +1,299 @@
+import operator
+from .series import Series, BooleanMask
+
+def _row_taker(positions):
+    """
+    Build a function gathering `positions` (a range, slice or sequence of
+    ints, e.g. list/tuple/array) from a column list. Ranges and runs of
+    consecutive positions become slices; anything else a single
+    operator.itemgetter call. Built once per selection and applied to
+    every column, so positions are inspected only once.
+    """
+    if isinstance(positions, slice):
+        return lambda values: values[positions]
+    n = len(positions)
+    if n == 0:
+        return lambda values: []
+
+    # Slicing clamps at the end of the list, so slice-based takers check
+    # their largest position themselves (itemgetter raises on its own).
+    if isinstance(positions, range) and min(positions[0], positions[-1]) >= 0:
+        # Positions are non-negative, so a negative stop only means "to the start".
+        stop = positions.stop if positions.stop >= 0 else None
+        return _slice_taker(slice(positions.start, stop, positions.step),
+                            max(positions[0], positions[-1]))
+    if n == 1:
+        position = positions[0]
+        return lambda values: [values[position]]
+
+    first = positions[0]
+    if (first >= 0 and positions[n - 1] - first == n - 1
+            and list(positions) == list(range(first, first + n))):
+        return _slice_taker(slice(first, first + n), first + n - 1)
+
+    getter = operator.itemgetter(*positions)
+    return lambda values: list(getter(values))
+
+def _slice_taker(rows, last):
+    """Gather the `rows` slice, whose largest position is `last`."""
+    def take(values):
+        if last >= len(values):
+            raise IndexError("DataFrame index out of range")
+        return values[rows]
+    return take
+
+def _take(values, positions):
+    """values at `positions` (see _row_taker)."""
+    return _row_taker(positions)(values)
+
+def _mask_positions(mask, length):
+    """Positions of the True entries of a boolean list, Series or BooleanMask."""
+    import itertools
+    if len(mask) != length:
+        raise ValueError(f"Item length {len(mask)} does not match DataFrame length {length}")
+    if isinstance(mask, BooleanMask):
+        return mask.positions()
+    if isinstance(mask, Series):
+        mask = mask._data
+    return list(itertools.compress(range(length), mask))
+
+def _column_labels(columns, item):
+    """Column names selected by position: int, slice or list of ints."""
+    if isinstance(item, int):
+        return columns[item]
+    if isinstance(item, slice):
+        return columns[item]
+    if isinstance(item, (list, range)):
+        if item and isinstance(item[0], bool):
+            return [col for col, keep in zip(columns, item) if keep]
+        return [columns[i] for i in item]
+    raise TypeError("Invalid column argument for iloc")
+
+def _assign(values, positions, value):
+    """
+    Write `value` (a scalar, or a list with one value per position) into
+    the column list at `positions`, in place.
+    """
+    if isinstance(value, list):
+        if isinstance(positions, range) and positions.step == 1:
+            values[positions.start:positions.stop] = value
+        else:
+            for position, val in zip(positions, value):
+                values[position] = val
+    elif isinstance(positions, range) and positions.step == 1:
+        values[positions.start:positions.stop] = [value] * len(positions)
+    else:
+        for position in positions:
+            values[position] = value
+
+def _set_cells(df, positions, columns, value):
+    """
+    Assign into `columns` (created as None if new) at row `positions`.
+    A list/Series value holds one value per row, or one per column when
+    a single row is set across several columns. Everything is checked
+    before any column is written.
+    """
+    if isinstance(value, (list, tuple, Series)):
+        value = list(value)
+        if len(positions) == 1 and len(columns) > 1:
+            if len(value) != len(columns):
+                raise ValueError(f"Length of values ({len(value)}) does not match "
+                                 f"number of selected columns ({len(columns)})")
+            cell_values = [[val] for val in value]
+        else:
+            if len(value) != len(positions):
+                raise ValueError(f"Length of values ({len(value)}) does not match "
+                                 f"number of selected rows ({len(positions)})")
+            cell_values = [value] * len(columns)
+    else:
+        cell_values = [value] * len(columns)
+
+    for col, col_value in zip(columns, cell_values):
+        if col not in df._data:
+            df[col] = None
+        _assign(df._writable_column(col), positions, col_value)
+
+def _iloc_row_positions(df, rows):
+    """
+    Row positions for iloc assignment, with negative positions resolved
+    and every position bounds-checked.
+    """
+    n = df.shape[0]
+    if isinstance(rows, int):
+        rows = [rows]
+    elif isinstance(rows, slice):
+        return range(*rows.indices(n))
+    elif isinstance(rows, Series):
+        return _mask_positions(rows, n)
+    elif isinstance(rows, list) and rows and isinstance(rows[0], bool):
+        return _mask_positions(rows, n)
+    elif not isinstance(rows, (list, tuple, range)) and not hasattr(rows, 'typecode'):
+        raise TypeError("Invalid argument for iloc")
+
+    # A range lies between its first and last values.
+    if isinstance(rows, range) and (not rows or (0 <= rows[0] < n and 0 <= rows[-1] < n)):
+        return rows
+    positions = [position + n if position < 0 else position for position in rows]
+    for position in positions:
+        if position < 0 or position >= n:
+            raise IndexError("DataFrame index out of range")
+    return positions
+
+def _loc_row_positions(df, rows):
+    """Row positions for loc assignment: label(s), label slice or mask."""
+    if isinstance(rows, Series):
+        return _mask_positions(rows, df.shape[0])
+    if isinstance(rows, list):
+        if rows and isinstance(rows[0], bool):
+            return _mask_positions(rows, df.shape[0])
+        label_map = df._label_positions()
+        positions = []
+        for label in rows:
+            position = label_map.get(label)
+            if position is None:
+                raise KeyError(f"Label '{label}' not found in index")
+            positions.append(position)
+        return positions
+    if isinstance(rows, slice):
+        label_map = df._label_positions()
+        start = 0 if rows.start is None else label_map.get(rows.start)
+        if start is None:
+            raise KeyError(f"Start label '{rows.start}' not found")
+        stop = df.shape[0] if rows.stop is None else label_map.get(rows.stop)
+        if stop is None:
+            raise KeyError(f"Stop label '{rows.stop}' not found")
+        # Label slicing includes stop
+        stop = stop if rows.stop is None else stop + 1
+        return range(start, stop, rows.step or 1)
+    return df._label_to_positions(rows)
+
+class _AtIndexer:
+    """df.at[label, column]: single cell by index label, O(1) for a unique index."""
+    def __init__(self, df):
+        self._df = df
+
+    def _position(self, key):
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("at takes a (label, column) pair")
+        label, col = key
+        if col not in self._df._data:
+            raise KeyError(f"Column '{col}' not found")
+        position = self._df._label_positions().get(label)
+        if position is None:
+            raise KeyError(f"Label '{label}' not found in index")
+        return position, col
+
+    def __getitem__(self, key):
+        position, col = self._position(key)
+        return self._df._data[col][position]
+
+    def __setitem__(self, key, value):
+        position, col = self._position(key)
+        self._df._writable_column(col)[position] = value
+
+class _iAtIndexer:
+    """df.iat[row, column]: single cell by position."""
+    def __init__(self, df):
+        self._df = df
+
+    def _position(self, key):
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise TypeError("iat takes a (row, column) pair of integers")
+        row, col = key
+        if not isinstance(row, int) or not isinstance(col, int):
+            raise TypeError("iat takes a (row, column) pair of integers")
+        n = self._df.shape[0]
+        position = row + n if row < 0 else row
+        if position < 0 or position >= n:
+            raise IndexError("DataFrame index out of range")
+        return position, self._df.columns[col]
+
+    def __getitem__(self, key):
+        position, col = self._position(key)
+        return self._df._data[col][position]
+
+    def __setitem__(self, key, value):
+        position, col = self._position(key)
+        self._df._writable_column(col)[position] = value
+
 class _iLocIndexer:
     def __init__(self, df):
         self._df = df
 
     def __getitem__(self, item):
+        df = self._df
+
+        # 0. 2-D: iloc[rows, cols] gathers only the selected columns
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                raise IndexError("iloc takes at most two indexers")
+            rows, cols = item
+            labels = _column_labels(df.columns, cols)
+            if isinstance(labels, list):
+                return self._get(rows, labels)
+            row = self._get(rows, [labels])
+            if isinstance(row, dict):
+                return row[labels]
+            return Series(row._data[labels], index=row.index, name=labels, copy=False)
+
+        return self._get(item, None)
+
+    def __setitem__(self, item, value):
+        """iloc[rows] = value / iloc[rows, cols] = value, written in place."""
+        df = self._df
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                raise IndexError("iloc takes at most two indexers")
+            rows, cols = item
+            columns = _column_labels(df.columns, cols)
+            if not isinstance(columns, list):
+                columns = [columns]
+        else:
+            rows, columns = item, df.columns
+        _set_cells(df, _iloc_row_positions(df, rows), columns, value)
+
+    def _get(self, item, columns):
+        df = self._df
         # 1. Integer: Return row as dict
         if isinstance(item, int):
-            row = {}
             # Handle negative index
             idx = item
             if idx < 0:
-                idx += self._df.shape[0]
-            
-            if idx < 0 or idx >= self._df.shape[0]:
+                idx += df.shape[0]
+
+            if idx < 0 or idx >= df.shape[0]:
                  raise IndexError("DataFrame index out of range")
 
-            for col, values in self._df._data.items():
-                row[col] = values[idx]
-            return row
+            data = df._data
+            return {col: data[col][idx] for col in (df.columns if columns is None else columns)}
 
-        # 2. Slice: Return new DataFrame
-        elif isinstance(item, slice):
-            new_data = {}
-            for col, values in self._df._data.items():
-                new_data[col] = values[item]
-            
-            # Slice the index as well
-            new_index = self._df.index[item]
-            return self._df.__class__(new_data, index=new_index)
-
-        # 3. List of integers: Return new DataFrame
-        elif isinstance(item, list) and all(isinstance(x, int) for x in item):
-             new_data = {}
-             for col, values in self._df._data.items():
-                 new_column = [values[i] for i in item]
-                 new_data[col] = new_column
-             
-             new_index = [self._df.index[i] for i in item]
-             return self._df.__class__(new_data, index=new_index)
-        
-        else:
+        # 2. Slice / range / positions: Return new DataFrame
+        if isinstance(item, list) and item and isinstance(item[0], bool):
+            item = _mask_positions(item, df.shape[0])
+        elif not isinstance(item, (slice, range, list, tuple)) and not hasattr(item, 'typecode'):
             raise TypeError("Invalid argument for iloc")
+        return df._take(item, columns)
 
 
 class _LocIndexer:
     def __init__(self, df):
         self._df = df
 
+    def __setitem__(self, item, value):
+        """
+        loc[rows] = value / loc[rows, col(s)] = value, written in place;
+        rows are a label, list of labels, label slice or boolean mask.
+        A new column is created (None elsewhere).
+        """
+        df = self._df
+        if isinstance(item, tuple) and len(item) == 2:
+            rows, columns = item
+            if not isinstance(columns, list):
+                columns = [columns]
+        else:
+            rows, columns = item, df.columns
+        _set_cells(df, _loc_row_positions(df, rows), columns, value)
+
     def __getitem__(self, item):
         # 1. Single Label
         if not isinstance(item, (list, slice, bool)):
@@ -75,34 +323,11 @@ class _LocIndexer:
 
         # 2. List of Labels
         elif isinstance(item, list) and not isinstance(item[0], bool):
-            indices = []
-            for label in item:
-                # Find first occurrence for each label? Or strict mapping?
-                # Pandas raises KeyError if any label missing (unless .reindex)
-                # Let's find first index for each label.
-                found = False
-                for i, idx_val in enumerate(self._df.index):
-                    if idx_val == label:
-                        indices.append(i)
-                        found = True
-                        break # Take first match
-                if not found:
-                     raise KeyError(f"Label '{label}' not found in index")
-            
-            return self._df.iloc[indices]
+            return self._df._take(_loc_row_positions(self._df, item))
 
         # 3. Boolean Mask (List of bools)
         elif isinstance(item, list) and item and isinstance(item[0], bool):
-            # Delegate to dataframe boolean indexing logic (which accesses iloc/slices)
-            # DF boolean indexing usually implemented effectively same as loc[bool_mask]
-            
-            # Re-implement or call internal method? 
-            # Boolean logic is: Keep rows where True.
-            if len(item) != len(self._df):
-                 raise ValueError(f"Item length {len(item)} does not match DataFrame length {len(self._df)}")
-            
-            keep_indices = [i for i, keep in enumerate(item) if keep]
-            return self._df.iloc[keep_indices]
+            return self._df._take(_mask_positions(item, self._df.shape[0]))
 
         # 4. Slice
         elif isinstance(item, slice):
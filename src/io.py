@@ -1,7 +1,132 @@
+import codecs
 import csv
+import io
+import itertools
 import os
 from .core import DataFrame
 
+_COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zip': 'zip',
+}
+
+def _infer_compression(filepath_or_buffer, compression):
+    """
+    Resolve compression='infer' from the file extension of a path.
+    Buffers are never inferred; pass an explicit compression for them.
+    """
+    if compression is None:
+        return None
+
+    if compression == 'infer':
+        if isinstance(filepath_or_buffer, str):
+            for ext, name in _COMPRESSION_EXTENSIONS.items():
+                if filepath_or_buffer.lower().endswith(ext):
+                    return name
+        return None
+
+    if compression not in _COMPRESSION_EXTENSIONS.values():
+        raise ValueError(f"Unrecognized compression type: {compression}")
+    return compression
+
+def _zip_member_name(filepath_or_buffer):
+    if isinstance(filepath_or_buffer, str):
+        name = os.path.basename(filepath_or_buffer)
+        if name.lower().endswith('.zip'):
+            name = name[:-4]
+        return name or 'data'
+    return 'data'
+
+def _open_compressed(filepath_or_buffer, mode, compression, closers):
+    """
+    Open a binary (de)compressing stream over a path or binary buffer.
+    The stdlib codecs stream, so nothing is decompressed up front.
+    Enclosing objects that must be closed after the stream (zip
+    archives) are appended to `closers`.
+    """
+    is_path = isinstance(filepath_or_buffer, str)
+    binary_mode = mode + 'b'
+
+    if compression == 'gzip':
+        import gzip
+        if is_path:
+            return gzip.open(filepath_or_buffer, binary_mode)
+        return gzip.GzipFile(fileobj=filepath_or_buffer, mode=binary_mode)
+
+    elif compression == 'bz2':
+        import bz2
+        return bz2.BZ2File(filepath_or_buffer, binary_mode)
+
+    elif compression == 'xz':
+        import lzma
+        return lzma.LZMAFile(filepath_or_buffer, binary_mode)
+
+    # zip
+    import zipfile
+    if mode == 'a':
+        raise ValueError("Appending is not supported for zip archives")
+
+    if mode == 'r':
+        archive = zipfile.ZipFile(filepath_or_buffer)
+        closers.append(archive.close)
+        names = archive.namelist()
+        if len(names) != 1:
+            raise ValueError(f"Expected exactly one file in zip archive, found {len(names)}")
+        return archive.open(names[0])
+
+    archive = zipfile.ZipFile(filepath_or_buffer, 'w', compression=zipfile.ZIP_DEFLATED)
+    closers.append(archive.close)
+    return archive.open(_zip_member_name(filepath_or_buffer), 'w')
+
+class _TextStream:
+    """
+    Context manager yielding a UTF-8 text stream for a path or buffer.
+    Uncompressed buffers are passed through as-is and are never closed here;
+    compressed buffers must be binary.
+    (A plain class rather than contextlib, which is slow to import.)
+    """
+    def __init__(self, filepath_or_buffer, mode='r', compression=None, newline=None):
+        self.filepath_or_buffer = filepath_or_buffer
+        self.mode = mode
+        self.compression = compression
+        self.newline = newline
+        self._closers = []
+
+    def __enter__(self):
+        source = self.filepath_or_buffer
+        if self.compression is None:
+            if not isinstance(source, str):
+                return source
+            f = open(source, self.mode, newline=self.newline, encoding='utf-8')
+            self._closers.append(f.close)
+            return f
+
+        try:
+            binary = _open_compressed(source, self.mode, self.compression, self._closers)
+            self._closers.append(binary.close)
+            text = io.TextIOWrapper(binary, encoding='utf-8', newline=self.newline)
+        except BaseException:
+            self._close()
+            raise
+        # Closed first: flush the text layer, then the codec (a no-op once
+        # the text layer closed it), then any enclosing archive.
+        self._closers.append(text.close)
+        return text
+
+    def __exit__(self, exc_type, exc, tb):
+        self._close()
+        return False
+
+    def _close(self):
+        while self._closers:
+            self._closers.pop()()
+
+def _check_path_exists(filepath_or_buffer):
+    if isinstance(filepath_or_buffer, str) and not os.path.exists(filepath_or_buffer):
+        raise FileNotFoundError(f"File not found: {filepath_or_buffer}")
+
 def _infer_type(value):
     """
     Attempt to convert string value to int, float, or None.
@@ -23,33 +148,35 @@ def _infer_type(value):
 
     return value
 
-def read_csv(filepath_or_buffer, chunksize=None):
+def read_csv(filepath_or_buffer, chunksize=None, compression='infer', where=None):
     """
     Read CSV from filepath or file-like object.
     If chunksize is set, returns a generator yielding DataFrames.
+    compression may be 'infer' (from the file extension), None, 'gzip',
+    'bz2', 'xz' or 'zip'; compressed buffers must be opened in binary mode.
+    where= filters rows before they are type-converted and packed into a
+    DataFrame; see _compile_where for the accepted forms.
     """
-    if isinstance(filepath_or_buffer, str):
-        if not os.path.exists(filepath_or_buffer):
-            raise FileNotFoundError(f"File not found: {filepath_or_buffer}")
-        
-        if chunksize is None:
-            with open(filepath_or_buffer, mode='r', newline='', encoding='utf-8') as f:
-                return _read_csv_from_file_obj(f)
-        else:
-            return _read_csv_chunks_from_path(filepath_or_buffer, chunksize)
+    compression = _infer_compression(filepath_or_buffer, compression)
+    _check_path_exists(filepath_or_buffer)
+    predicate = _compile_where(where, convert=_infer_type)
+    where_columns = list(where) if isinstance(where, dict) else None
+
+    if chunksize is None:
+        with _TextStream(filepath_or_buffer, 'r', compression, newline='') as f:
+            return _read_csv_from_file_obj(f, predicate, where_columns)
     else:
-        # Assume it's a file-like object
-        if chunksize is None:
-            return _read_csv_from_file_obj(filepath_or_buffer)
-        else:
-            return _read_csv_chunks(filepath_or_buffer, chunksize)
+        return _read_csv_chunks_from_source(filepath_or_buffer, chunksize, compression,
+                                            predicate, where_columns)
 
-def _read_csv_chunks_from_path(filepath, chunksize):
-    with open(filepath, mode='r', newline='', encoding='utf-8') as f:
-        yield from _read_csv_chunks(f, chunksize)
+def _read_csv_chunks_from_source(filepath_or_buffer, chunksize, compression=None, predicate=None,
+                                 where_columns=None):
+    with _TextStream(filepath_or_buffer, 'r', compression, newline='') as f:
+        yield from _read_csv_chunks(f, chunksize, predicate, where_columns)
+
+def _read_csv_chunks(f, chunksize, predicate=None, where_columns=None):
+    reader = _csv_rows(f, predicate, where_columns)
 
-def _read_csv_chunks(f, chunksize):
-    reader = csv.DictReader(f)
     chunk = []
     for row in reader:
         processed_row = {k: _infer_type(v) for k, v in row.items()}
@@ -61,9 +188,9 @@ def _read_csv_chunks(f, chunksize):
     if chunk:
         yield DataFrame(chunk)
 
-def _read_csv_from_file_obj(f):
+def _read_csv_from_file_obj(f, predicate=None, where_columns=None):
     # Use DictReader to handle headers automatically
-    reader = csv.DictReader(f)
+    reader = _csv_rows(f, predicate, where_columns)
     
     # Read all rows and infer types
     data = []
@@ -73,136 +200,778 @@ def _read_csv_from_file_obj(f):
         
     return DataFrame(data)
 
-def to_csv(df, filepath_or_buffer):
+class _InferringRow:
+    """Read-only view of a raw CSV row that type-converts fields on access."""
+    __slots__ = ('_raw',)
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __getitem__(self, key):
+        return _infer_type(self._raw[key])
+
+    def __contains__(self, key):
+        return key in self._raw
+
+    def get(self, key, default=None):
+        if key not in self._raw:
+            return default
+        return _infer_type(self._raw[key])
+
+def _make_condition(condition):
+    """
+    Test for one where= condition. Equality and membership tests that
+    raise TypeError (e.g. an unhashable value) count as False; errors
+    from a callable condition propagate.
+    """
+    if callable(condition):
+        return condition
+    if isinstance(condition, (set, frozenset, list, tuple)):
+        allowed = set(condition)
+
+        def test(value):
+            try:
+                return value in allowed
+            except TypeError:
+                return False
+        return test
+
+    def test(value):
+        try:
+            return value == condition
+        except TypeError:
+            return False
+    return test
+
+def _compile_where(where, convert=None, path_sep=None):
+    """
+    Turn a where= option into a predicate over a raw parsed row.
+
+    `where` is either a callable receiving the row, or a dict of
+    {column: condition} that must all hold, where a condition is a
+    callable on the value, a set/list/tuple of allowed values, or a
+    value to compare for equality. `convert` is applied only to the
+    tested fields (CSV strings); with `path_sep`, dict keys may be nested
+    paths into the record.
+    """
+    if where is None:
+        return None
+
+    if callable(where):
+        if convert is None:
+            return where
+        return lambda row: where(_InferringRow(row))
+
+    if not isinstance(where, dict):
+        raise TypeError("where must be a callable or a dict of {column: condition}")
+
+    checks = []
+    for col, condition in where.items():
+        if path_sep and path_sep in col:
+            path = col.split(path_sep)
+            getter = lambda row, path=path: _get_path(row, path)
+        else:
+            getter = lambda row, col=col: row.get(col)
+        checks.append((getter, _make_condition(condition)))
+
+    def predicate(row):
+        for getter, test in checks:
+            value = getter(row)
+            if convert is not None and value is not None:
+                value = convert(value)
+            if not test(value):
+                return False
+        return True
+
+    return predicate
+
+def _csv_rows(f, predicate=None, where_columns=None):
+    """
+    DictReader over `f`, filtered by `predicate`. The `where_columns` of
+    a where= dict must be in the header (a typo would filter out every row).
+    """
+    reader = csv.DictReader(f)
+    if where_columns and reader.fieldnames is not None:
+        missing = [col for col in where_columns if col not in reader.fieldnames]
+        if missing:
+            raise KeyError(f"where= columns not found in CSV header: {missing}")
+    if predicate is not None:
+        reader = filter(predicate, reader)
+    return reader
+
+def to_csv(df, filepath_or_buffer, columns=None, sep=',', float_format=None,
+           na_rep='', header=True, mode='w', chunksize=None, compression='infer'):
     """
     Write DataFrame to CSV filepath or file-like object.
+    Rows are streamed to the writer in batches of `chunksize` rows, so no
+    per-row copy of the whole frame is ever built.
+    mode='a' appends to an existing file (pass header=False for the
+    chunks after the first). Appending to gzip/bz2/xz adds a new stream
+    member, which the readers handle transparently.
     """
-    if isinstance(filepath_or_buffer, str):
-        with open(filepath_or_buffer, mode='w', newline='', encoding='utf-8') as f:
-            _to_csv_to_file_obj(df, f)
+    if mode not in ('w', 'a'):
+        raise ValueError("mode must be 'w' or 'a'")
+
+    compression = _infer_compression(filepath_or_buffer, compression)
+    with _TextStream(filepath_or_buffer, mode, compression, newline='') as f:
+        _to_csv_to_file_obj(df, f, columns, sep, float_format, na_rep, header, chunksize)
+
+_CSV_WRITE_CHUNKSIZE = 10000
+
+def _iter_row_batches(df, columns, batch_size):
+    """
+    Yield lists of row tuples zipped straight off the column lists (of
+    each concatenated piece, so lazily concatenated frames are never
+    flattened); only one batch is alive at a time.
+    """
+    rows = itertools.chain.from_iterable(
+        zip(*[chunk._data[col] for col in columns]) for chunk in df.iter_chunks()
+    )
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def _make_csv_formatter(float_format, na_rep):
+    """
+    Build a per-cell formatter, or return None when csv.writer can take
+    values as they are (it already writes None as an empty field).
+    """
+    if float_format is None and na_rep == '':
+        return None
+
+    if float_format is None:
+        format_float = None
+    elif callable(float_format):
+        format_float = float_format
+    elif isinstance(float_format, str):
+        format_float = lambda x: float_format % x
     else:
-        _to_csv_to_file_obj(df, filepath_or_buffer)
+        raise TypeError("float_format must be a format string or a callable")
 
-def _to_csv_to_file_obj(df, f):
-    # Get column names
-    fieldnames = df.columns
-    
-    # Prepare data for writing: None -> ""
-    rows_to_write = []
-    
-    # Iterate row by row
-    num_rows = df.shape[0]
-    for i in range(num_rows):
-        row = {}
-        for col in fieldnames:
-            val = df._data[col][i]
-            if val is None:
-                row[col] = ""
-            else:
-                row[col] = val
-        rows_to_write.append(row)
-
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows_to_write)
+    def formatter(val):
+        if val is None:
+            return na_rep
+        if format_float is not None and isinstance(val, float):
+            return format_float(val)
+        return val
+
+    return formatter
+
+def _to_csv_to_file_obj(df, f, columns=None, sep=',', float_format=None,
+                        na_rep='', header=True, chunksize=None):
+    if columns is None:
+        columns = df.columns
+    else:
+        if isinstance(columns, str):
+            columns = [columns]
+        for col in columns:
+            if col not in df._data:
+                raise KeyError(f"Column '{col}' not found")
+
+    if chunksize is None:
+        chunksize = _CSV_WRITE_CHUNKSIZE
+    elif chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+
+    writer = csv.writer(f, delimiter=sep)
+
+    if header is True:
+        writer.writerow(columns)
+    elif isinstance(header, list):
+        if len(header) != len(columns):
+            raise ValueError(f"Writing {len(columns)} cols but got {len(header)} aliases")
+        writer.writerow(header)
+
+    if not columns:
+        return
+
+    formatter = _make_csv_formatter(float_format, na_rep)
+
+    for batch in _iter_row_batches(df, columns, chunksize):
+        if formatter is not None:
+            batch = [[formatter(val) for val in row] for row in batch]
+        writer.writerows(batch)
 
 import json
 
-def read_json(filepath_or_buffer):
+_JSON_READ_BUFFER_SIZE = 65536
+
+# A value cut off by the buffer edge fails to decode within its last few
+# characters (a partial literal, number or \uXXXX escape is at most this
+# long), or at the opening quote of an unterminated string.
+_JSON_MAX_CUT_TOKEN = 6
+
+def read_json(filepath_or_buffer, compression='infer', chunksize=None, record_path=None):
     """
     Read JSON from filepath or file-like object.
-    Expects a list of records.
+    Expects a list of records, or an object wrapping one under
+    `record_path` (a key or list of keys, e.g. 'data' for {"data": [...]}).
+    If chunksize is set, the array is scanned incrementally and a
+    generator yielding DataFrames of `chunksize` records is returned.
     """
-    if isinstance(filepath_or_buffer, str):
-        if not os.path.exists(filepath_or_buffer):
-            raise FileNotFoundError(f"File not found: {filepath_or_buffer}")
+    if isinstance(record_path, str):
+        record_path = [record_path]
+
+    compression = _infer_compression(filepath_or_buffer, compression)
+    _check_path_exists(filepath_or_buffer)
 
-        with open(filepath_or_buffer, 'r', encoding='utf-8') as f:
-            return _read_json_from_file_obj(f)
+    if chunksize is None:
+        with _TextStream(filepath_or_buffer, 'r', compression) as f:
+            return _read_json_from_file_obj(f, record_path)
     else:
-        return _read_json_from_file_obj(filepath_or_buffer)
+        return _read_json_chunks_from_source(filepath_or_buffer, chunksize, compression, record_path)
+
+def _read_json_chunks_from_source(filepath_or_buffer, chunksize, compression=None, record_path=None):
+    with _TextStream(filepath_or_buffer, 'r', compression) as f:
+        yield from _read_json_chunks(f, chunksize, record_path)
 
-def _read_json_from_file_obj(f):
+def _read_json_from_file_obj(f, record_path=None):
     data = json.load(f)
-    
+
+    for key in record_path or []:
+        if not isinstance(data, dict) or key not in data:
+            raise KeyError(f"Record path key '{key}' not found")
+        data = data[key]
+
     if not isinstance(data, list):
          raise TypeError("JSON content must be a list of records")
 
     return DataFrame(data)
 
-def to_json(df, filepath_or_buffer):
+def _read_json_chunks(f, chunksize, record_path=None):
+    scanner = _JSONArrayScanner(f)
+    builder = _RecordColumnBuilder(record_kind='JSON array element')
+    chunk = []
+    for record in scanner.iter_records(record_path):
+        chunk.append(record)
+        if len(chunk) >= chunksize:
+            builder.append_records(chunk)
+            chunk = []
+            yield builder.flush()
+
+    if chunk:
+        builder.append_records(chunk)
+        yield builder.flush()
+
+class _JSONArrayScanner:
+    """
+    Incrementally walks a JSON document over a sliding text buffer,
+    decoding one array element at a time with JSONDecoder.raw_decode.
+    """
+    def __init__(self, f, buffer_size=_JSON_READ_BUFFER_SIZE):
+        self.f = f
+        self.buffer_size = buffer_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size=None):
+        """Read more text into the buffer. Returns False at end of input."""
+        if self.eof:
+            return False
+        data = self.f.read(size or self.buffer_size)
+        if not data:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the buffer only holds unread text.
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            buf = self.buf
+            pos = self.pos
+            while pos < len(buf) and buf[pos] in ' \t\n\r':
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        char = self._peek()
+        if not char or char not in chars:
+            found = repr(char) if char else 'end of input'
+            raise ValueError(f"Malformed JSON: expected one of {chars!r}, found {found}")
+        self.pos += 1
+        return char
+
+    def _decode(self):
+        """Decode the next complete JSON value, reading more text as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Read more only for a value possibly cut off by the buffer
+                # edge; an error earlier in the buffer is final.
+                cut = (e.pos >= len(self.buf) - _JSON_MAX_CUT_TOKEN
+                       or e.msg.startswith('Unterminated string'))
+                if not cut or not self._fill(max(self.buffer_size, len(self.buf))):
+                    raise
+                continue
+            # A number cut by the buffer edge ('4' of '4.5e3') still decodes,
+            # so only accept it once a non-number character follows.
+            buf = self.buf
+            tail = end
+            while tail < len(buf) and buf[tail] in '0123456789.eE+-':
+                tail += 1
+            if tail == len(buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _seek_record_path(self, record_path):
+        for key in record_path:
+            self._expect('{')
+            while True:
+                if self._peek() == '}':
+                    raise KeyError(f"Record path key '{key}' not found")
+                name = self._decode()
+                self._expect(':')
+                if name == key:
+                    break
+                self._decode()
+                if self._expect(',}') == '}':
+                    raise KeyError(f"Record path key '{key}' not found")
+
+    def iter_records(self, record_path=None):
+        if record_path:
+            self._seek_record_path(record_path)
+
+        if self._peek() != '[':
+            raise TypeError("JSON content must be a list of records")
+        self.pos += 1
+
+        if self._peek() != ']':
+            while True:
+                yield self._decode()
+                if self._expect(',]') == ']':
+                    break
+        else:
+            self.pos += 1
+
+        # Under a record_path the enclosing object goes on after the array.
+        if not record_path and self._peek():
+            raise ValueError("Malformed JSON: extra data after the closing ']'")
+
+_JSON_WRITE_CHUNKSIZE = 10000
+
+_JSON_ORIENTS = ('records', 'columns', 'split', 'values')
+
+def to_json(df, filepath_or_buffer, compression='infer', orient='records', indent=None):
     """
     Write DataFrame to JSON filepath or file-like object.
-    Writes as a list of records.
+    orient='records' writes a list of row objects, 'columns' an object of
+    {column: {index: value}}, 'split' an object of columns/index/data and
+    'values' a list of row arrays.
+    Output is compact and streamed in row batches; passing `indent`
+    pretty-prints instead, which builds the whole document in memory.
     """
-    if isinstance(filepath_or_buffer, str):
-        with open(filepath_or_buffer, 'w', encoding='utf-8') as f:
-            _to_json_to_file_obj(df, f)
+    if orient not in _JSON_ORIENTS:
+        raise ValueError(f"orient must be one of {_JSON_ORIENTS}")
+
+    compression = _infer_compression(filepath_or_buffer, compression)
+    with _TextStream(filepath_or_buffer, 'w', compression) as f:
+        _to_json_to_file_obj(df, f, orient, indent)
+
+_COMPACT_SEPARATORS = (',', ':')
+
+def _dumps_compact(obj):
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS)
+
+def _write_json_batches(f, encoded_batches):
+    """
+    Write the bodies of JSON containers encoded batch by batch as one
+    container: the brackets of each batch are stripped and the bodies
+    joined with commas.
+    """
+    first = True
+    for encoded in encoded_batches:
+        body = encoded[1:-1]
+        if not body:
+            continue
+        if not first:
+            f.write(',')
+        f.write(body)
+        first = False
+
+def _to_json_to_file_obj(df, f, orient='records', indent=None):
+    columns = df.columns
+
+    if indent is not None:
+        if orient == 'records':
+            obj = df.to_dict(orient='records')
+        elif orient == 'values':
+            obj = [list(row) for row in df.to_records()]
+        elif orient == 'split':
+            obj = {'columns': columns, 'index': df.index,
+                   'data': [list(row) for row in df.to_records()]}
+        else:
+            obj = {col: dict(zip(df.index, df._data[col])) for col in columns}
+        json.dump(obj, f, indent=indent)
+        return
+
+    batches = _iter_row_batches(df, columns, _JSON_WRITE_CHUNKSIZE)
+
+    if orient == 'records':
+        f.write('[')
+        _write_json_batches(f, (
+            _dumps_compact([dict(zip(columns, row)) for row in batch]) for batch in batches
+        ))
+        f.write(']')
+
+    elif orient == 'values':
+        f.write('[')
+        _write_json_batches(f, (_dumps_compact(batch) for batch in batches))
+        f.write(']')
+
+    elif orient == 'split':
+        f.write('{"columns":' + _dumps_compact(columns))
+        f.write(',"index":' + _dumps_compact(df.index))
+        f.write(',"data":[')
+        _write_json_batches(f, (_dumps_compact(batch) for batch in batches))
+        f.write(']}')
+
     else:
-        _to_json_to_file_obj(df, filepath_or_buffer)
+        # columns: one object per column, each streamed in index batches.
+        index = df.index
+        step = _JSON_WRITE_CHUNKSIZE
+        f.write('{')
+        for i, col in enumerate(columns):
+            if i:
+                f.write(',')
+            values = df._data[col]
+            f.write(_dumps_compact(col) + ':{')
+            _write_json_batches(f, (
+                _dumps_compact(dict(zip(index[start:start + step], values[start:start + step])))
+                for start in range(0, len(values), step)
+            ))
+            f.write('}')
+        f.write('}')
 
-def _to_json_to_file_obj(df, f):
-    records = df.to_dict(orient='records')
-    json.dump(records, f, indent=4)
+_NDJSON_BATCH_LINES = 10000
 
-def read_ndjson(filepath_or_buffer, chunksize=None):
+_SCHEMA_EVOLUTION_POLICIES = ('add', 'ignore', 'raise')
+
+def read_ndjson(filepath_or_buffer, chunksize=None, compression='infer', columns=None,
+                flatten=False, sep='.', schema_evolution='add', where=None):
     """
     Read NDJSON (Newline Delimited JSON) from filepath or file-like object.
     Each line is a separate JSON object.
     If chunksize is set, returns a generator yielding DataFrames.
+
+    Lines are decoded a batch at a time and appended straight into column
+    lists. The schema is fixed by `columns` or else by the first batch;
+    keys first seen later are handled by `schema_evolution`:
+    'add' (new column, earlier rows None), 'ignore' (dropped) or 'raise'.
+    With flatten=True nested objects become `sep`-joined columns
+    ('a.b.c'), and `columns` may name such nested paths.
+    where= filters decoded records before they reach the column builders
+    (a callable gets the raw, unflattened record); chunks then count
+    kept rows.
     """
-    if isinstance(filepath_or_buffer, str):
-        if not os.path.exists(filepath_or_buffer):
-            raise FileNotFoundError(f"File not found: {filepath_or_buffer}")
+    if schema_evolution not in _SCHEMA_EVOLUTION_POLICIES:
+        raise ValueError(f"schema_evolution must be one of {_SCHEMA_EVOLUTION_POLICIES}")
 
-        if chunksize is None:
-            with open(filepath_or_buffer, 'r', encoding='utf-8') as f:
-                return _read_ndjson_from_file_obj(f)
-        else:
-            return _read_ndjson_chunks_from_path(filepath_or_buffer, chunksize)
+    compression = _infer_compression(filepath_or_buffer, compression)
+    _check_path_exists(filepath_or_buffer)
+
+    predicate = _compile_where(where, path_sep=sep if flatten else None)
+    builder_args = (columns, flatten, sep, schema_evolution, predicate)
+    if chunksize is None:
+        with _TextStream(filepath_or_buffer, 'r', compression) as f:
+            return _read_ndjson_from_file_obj(f, *builder_args)
     else:
-        if chunksize is None:
-             return _read_ndjson_from_file_obj(filepath_or_buffer)
+        return _read_ndjson_chunks_from_source(filepath_or_buffer, chunksize, compression, builder_args)
+
+def _read_ndjson_chunks_from_source(filepath_or_buffer, chunksize, compression=None, builder_args=()):
+    with _TextStream(filepath_or_buffer, 'r', compression) as f:
+        yield from _read_ndjson_chunks(f, chunksize, *builder_args)
+
+def _decode_ndjson_batch(lines):
+    """Decode many NDJSON lines with a single json.loads call."""
+    try:
+        records = json.loads('[' + ','.join(lines) + ']')
+    except json.JSONDecodeError:
+        # Re-decode line by line so the error points at the bad line.
+        records = [json.loads(line) for line in lines]
+
+    if len(records) != len(lines):
+        raise ValueError("Each NDJSON line must hold exactly one JSON value")
+    return records
+
+def _flatten_record(record, sep, prefix=''):
+    flat = {}
+    for key, value in record.items():
+        name = prefix + key
+        if isinstance(value, dict) and value:
+            flat.update(_flatten_record(value, sep, name + sep))
         else:
-             return _read_ndjson_chunks(filepath_or_buffer, chunksize)
+            flat[name] = value
+    return flat
 
-def _read_ndjson_chunks_from_path(filepath, chunksize):
-    with open(filepath, 'r', encoding='utf-8') as f:
-         yield from _read_ndjson_chunks(f, chunksize)
+def _get_path(record, path):
+    for key in path:
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+    return record
 
-def _read_ndjson_chunks(f, chunksize):
-    chunk = []
+class _RecordColumnBuilder:
+    """
+    Accumulates decoded records (NDJSON lines or JSON array elements,
+    named by `record_kind` in errors) as column lists under a fixed
+    schema, then hands them out as a DataFrame chunk.
+    """
+    def __init__(self, columns=None, flatten=False, sep='.', schema_evolution='add', predicate=None,
+                 record_kind='NDJSON line'):
+        if isinstance(columns, str):
+            columns = [columns]
+
+        self.flatten = flatten
+        self.schema_evolution = schema_evolution
+        self.projected = columns is not None
+        self.schema_fixed = self.projected
+        self.length = 0
+        self.data = {col: [] for col in columns} if self.projected else {}
+
+        # Nested paths are resolved directly, without flattening whole records.
+        if self.projected and flatten:
+            self.paths = {col: col.split(sep) for col in columns}
+        else:
+            self.paths = None
+        self.sep = sep
+        self.predicate = predicate
+        self.record_kind = record_kind
+
+    def append_lines(self, lines):
+        self.append_records(_decode_ndjson_batch(lines))
+
+    def append_records(self, records):
+        for record in records:
+            if not isinstance(record, dict):
+                raise TypeError(f"Each {self.record_kind} must be a JSON object")
+
+        if self.predicate is not None:
+            records = [r for r in records if self.predicate(r)]
+        if not records:
+            return
+
+        if self.paths is not None:
+            for col, path in self.paths.items():
+                self.data[col].extend([_get_path(r, path) for r in records])
+            self.length += len(records)
+            return
+
+        if self.flatten:
+            records = [_flatten_record(r, self.sep) for r in records]
+
+        if not self.projected:
+            self._evolve_schema(records)
+
+        for col, values in self.data.items():
+            values.extend([r.get(col) for r in records])
+        self.length += len(records)
+
+    def _evolve_schema(self, records):
+        new_keys = set().union(*records).difference(self.data)
+        if not new_keys:
+            self.schema_fixed = True
+            return
+
+        if self.schema_fixed:
+            if self.schema_evolution == 'ignore':
+                return
+            if self.schema_evolution == 'raise':
+                raise ValueError(f"Unexpected columns not in schema: {sorted(new_keys, key=str)}")
+
+        # Keep first-seen key order for the new columns.
+        for record in records:
+            for key in record:
+                if key in new_keys and key not in self.data:
+                    self.data[key] = [None] * self.length
+        self.schema_fixed = True
+
+    def flush(self, limit=None):
+        """Emit the buffered rows (at most `limit`) as a DataFrame."""
+        if limit is None or limit >= self.length:
+            df = DataFrame(self.data)
+            self.data = {col: [] for col in self.data}
+            self.length = 0
+            return df
+
+        df = DataFrame({col: values[:limit] for col, values in self.data.items()})
+        self.data = {col: values[limit:] for col, values in self.data.items()}
+        self.length -= limit
+        return df
+
+def _read_ndjson_chunks(f, chunksize, columns=None, flatten=False, sep='.',
+                       schema_evolution='add', predicate=None):
+    builder = _RecordColumnBuilder(columns, flatten, sep, schema_evolution, predicate)
+    lines = []
     for line in f:
         line = line.strip()
         if line:
-            chunk.append(json.loads(line))
-        
-        if len(chunk) >= chunksize:
-            yield DataFrame(chunk)
-            chunk = []
-            
-    if chunk:
-        yield DataFrame(chunk)
+            lines.append(line)
 
-def _read_ndjson_from_file_obj(f):
-    data = []
+        if len(lines) >= chunksize:
+            builder.append_lines(lines)
+            lines = []
+            # Filtering can leave a short batch; keep chunks full-sized.
+            while builder.length >= chunksize:
+                yield builder.flush(chunksize)
+
+    if lines:
+        builder.append_lines(lines)
+    while builder.length >= chunksize:
+        yield builder.flush(chunksize)
+    if builder.length:
+        yield builder.flush()
+
+def _read_ndjson_from_file_obj(f, columns=None, flatten=False, sep='.',
+                               schema_evolution='add', predicate=None):
+    builder = _RecordColumnBuilder(columns, flatten, sep, schema_evolution, predicate)
+    lines = []
     for line in f:
         line = line.strip()
         if line:
-            data.append(json.loads(line))
-    return DataFrame(data)
+            lines.append(line)
+            if len(lines) >= _NDJSON_BATCH_LINES:
+                builder.append_lines(lines)
+                lines = []
 
-def to_ndjson(df, filepath_or_buffer):
+    builder.append_lines(lines)
+    return builder.flush()
+
+def to_ndjson(df, filepath_or_buffer, compression='infer', orient='records'):
     """
     Write DataFrame to NDJSON filepath or file-like object.
+    Each line is a row object, or a row array with orient='values'.
     """
-    if isinstance(filepath_or_buffer, str):
-        with open(filepath_or_buffer, 'w', encoding='utf-8') as f:
-            _to_ndjson_to_file_obj(df, f)
-    else:
-         _to_ndjson_to_file_obj(df, filepath_or_buffer)
+    if orient not in ('records', 'values'):
+        raise ValueError("orient must be 'records' or 'values' for NDJSON")
+
+    compression = _infer_compression(filepath_or_buffer, compression)
+    with _TextStream(filepath_or_buffer, 'w', compression) as f:
+        _to_ndjson_to_file_obj(df, f, orient)
+
+def _to_ndjson_to_file_obj(df, f, orient='records'):
+    columns = df.columns
+    dumps = _dumps_compact
+    for batch in _iter_row_batches(df, columns, _JSON_WRITE_CHUNKSIZE):
+        if orient == 'records':
+            lines = [dumps(dict(zip(columns, row))) for row in batch]
+        else:
+            lines = [dumps(row) for row in batch]
+        f.write('\n'.join(lines))
+        f.write('\n')
+
+_ASYNC_CHUNKSIZE = 10000
+
+async def _aiter_line_batches(source):
+    """
+    Re-split an async iterable of bytes or str pieces into lists of text
+    lines (without line endings), one list per incoming piece. Pieces need
+    not be line aligned, so asyncio.StreamReader lines and raw HTTP body
+    chunks both work.
+    """
+    if not hasattr(source, '__aiter__'):
+        raise TypeError("source must be an async iterable of bytes or str")
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    async for piece in source:
+        if isinstance(piece, (bytes, bytearray)):
+            piece = decoder.decode(piece)
+        if not piece:
+            continue
+        lines = (pending + piece).split('\n')
+        pending = lines.pop()
+        if lines:
+            yield lines
+
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield [pending]
+
+def _parse_csv_records(records, fieldnames):
+    reader = csv.DictReader(records, fieldnames=fieldnames)
+    return DataFrame([{k: _infer_type(v) for k, v in row.items()} for row in reader])
+
+async def read_csv_async(source, chunksize=_ASYNC_CHUNKSIZE):
+    """
+    Read CSV from an async iterable of bytes or str (e.g. an
+    asyncio.StreamReader or an HTTP response body).
+    Returns an async generator yielding DataFrames of up to `chunksize`
+    rows, so download and parsing overlap.
+    """
+    fieldnames = None
+    records = []
+    # Physical lines of a record whose quoted field spans a line break.
+    partial = []
+    partial_quotes = 0
+
+    async for lines in _aiter_line_batches(source):
+        for line in lines:
+            partial.append(line)
+            partial_quotes += line.count('"')
+            # An odd quote count means a quoted field is still open.
+            if partial_quotes % 2:
+                continue
+
+            record = '\n'.join(partial) if len(partial) > 1 else line
+            partial = []
+            partial_quotes = 0
+            if not record.strip('\r'):
+                continue
+
+            if fieldnames is None:
+                fieldnames = next(csv.reader([record]))
+                continue
+
+            records.append(record)
+            if len(records) >= chunksize:
+                yield _parse_csv_records(records, fieldnames)
+                records = []
+
+    if partial:
+        if fieldnames is None:
+            fieldnames = next(csv.reader(['\n'.join(partial)]))
+        else:
+            records.append('\n'.join(partial))
+
+    if records:
+        yield _parse_csv_records(records, fieldnames)
+
+async def read_ndjson_async(source, chunksize=_ASYNC_CHUNKSIZE, columns=None,
+                            flatten=False, sep='.', schema_evolution='add'):
+    """
+    Read NDJSON from an async iterable of bytes or str.
+    Returns an async generator yielding DataFrames of up to `chunksize`
+    rows. Options match read_ndjson.
+    """
+    if schema_evolution not in _SCHEMA_EVOLUTION_POLICIES:
+        raise ValueError(f"schema_evolution must be one of {_SCHEMA_EVOLUTION_POLICIES}")
+
+    builder = _RecordColumnBuilder(columns, flatten, sep, schema_evolution)
+    pending = []
+    async for lines in _aiter_line_batches(source):
+        for line in lines:
+            line = line.strip()
+            if line:
+                pending.append(line)
+            if len(pending) >= chunksize:
+                builder.append_lines(pending)
+                pending = []
+                yield builder.flush()
 
-def _to_ndjson_to_file_obj(df, f):
-    records = df.to_dict(orient='records')
-    for record in records:
-        f.write(json.dumps(record) + '\n')
+    if pending:
+        builder.append_lines(pending)
+        yield builder.flush()
@@ -1,134 +1,593 @@
 from .core import DataFrame
 
-def merge(left, right, on, how='inner'):
-    # Normalize 'on' to always be a list
+_HOW = ('inner', 'left', 'right', 'outer', 'semi', 'anti')
+
+def _as_key_list(on):
     if isinstance(on, str):
-        on_cols = [on]
+        return [on]
     elif isinstance(on, list):
-        on_cols = on
+        return on
     else:
         raise TypeError("Merge key must be a string or list of strings")
 
-    for col in on_cols:
+def _resolve_keys(on, left_on, right_on):
+    """(left key columns, right key columns) from on= or left_on=/right_on=."""
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise ValueError("Pass either 'on' or 'left_on' and 'right_on', not both")
+        on_cols = _as_key_list(on)
+        return on_cols, on_cols
+    if left_on is None or right_on is None:
+        raise ValueError("Must pass 'on' or both 'left_on' and 'right_on'")
+    left_cols = _as_key_list(left_on)
+    right_cols = _as_key_list(right_on)
+    if len(left_cols) != len(right_cols):
+        raise ValueError("left_on and right_on must have the same length")
+    return left_cols, right_cols
+
+def _key_column(df, cols):
+    """Join keys of every row: raw values for one key, tuples for several."""
+    if len(cols) == 1:
+        return df._data[cols[0]]
+    return list(zip(*[df._data[col] for col in cols]))
+
+def _build_key_map(keys):
+    """
+    Hash table over join keys: key -> row position when every key is
+    unique (the usual lookup-table case), else key -> list of positions.
+    Returns (map, unique).
+    """
+    n = len(keys)
+    key_map = dict(zip(keys, range(n)))
+    if len(key_map) == n:
+        return key_map, True
+
+    key_map = {}
+    for j, key in enumerate(keys):
+        positions = key_map.get(key)
+        if positions is None:
+            key_map[key] = [j]
+        else:
+            positions.append(j)
+    return key_map, False
+
+def _probe_key_map(left_keys, key_map, unique, n_right, how):
+    """
+    Probe a right-side key map with the left keys, in left row order.
+    A unique map is probed with a single comprehension.
+    """
+    keep_left = how in ('left', 'outer')
+    get = key_map.get
+
+    if unique:
+        probe = [get(key, n_right) for key in left_keys]
+        if keep_left:
+            return list(range(len(left_keys))), probe
+        left_pos = [i for i, j in enumerate(probe) if j != n_right]
+        return left_pos, [j for j in probe if j != n_right]
+
+    left_pos = []
+    right_pos = []
+    for i, key in enumerate(left_keys):
+        positions = get(key)
+        if positions is None:
+            if keep_left:
+                left_pos.append(i)
+                right_pos.append(n_right)
+        elif len(positions) == 1:
+            left_pos.append(i)
+            right_pos.append(positions[0])
+        else:
+            left_pos.extend([i] * len(positions))
+            right_pos.extend(positions)
+    return left_pos, right_pos
+
+def _probe_left(left_keys, right_keys, how):
+    """
+    Hash the (smaller) left keys and probe with the right ones, bucketing
+    matches per left row so the output comes out in left row order.
+    """
+    n_left = len(left_keys)
+    n_right = len(right_keys)
+
+    left_map = {}
+    for i, key in enumerate(left_keys):
+        positions = left_map.get(key)
+        if positions is None:
+            left_map[key] = [i]
+        else:
+            positions.append(i)
+
+    matches = [[] for _ in range(n_left)]
+    get = left_map.get
+    for j, key in enumerate(right_keys):
+        positions = get(key)
+        if positions is not None:
+            for i in positions:
+                matches[i].append(j)
+
+    keep_left = how in ('left', 'outer')
+    left_pos = []
+    right_pos = []
+    for i, right_matches in enumerate(matches):
+        if right_matches:
+            left_pos.extend([i] * len(right_matches))
+            right_pos.extend(right_matches)
+        elif keep_left:
+            left_pos.append(i)
+            right_pos.append(n_right)
+    return left_pos, right_pos
+
+def _join_positions(left_keys, right_keys, how):
+    """
+    Row positions of every output row in each input, in output order:
+    matches in left row order (unmatched left rows inline for left/outer),
+    then unmatched right rows for right/outer. A missing side is encoded
+    as the position one past its last row.
+    """
+    if len(left_keys) < len(right_keys):
+        left_pos, right_pos = _probe_left(left_keys, right_keys, how)
+    else:
+        key_map, unique = _build_key_map(right_keys)
+        left_pos, right_pos = _probe_key_map(left_keys, key_map, unique, len(right_keys), how)
+
+    if how in ('right', 'outer'):
+        _append_right_only(left_pos, right_pos, left_keys, right_keys)
+    return left_pos, right_pos
+
+def _append_right_only(left_pos, right_pos, left_keys, right_keys):
+    """Add the right rows whose key never occurs on the left."""
+    left_key_set = set(left_keys)
+    unmatched = [j for j, key in enumerate(right_keys) if key not in left_key_set]
+    left_pos.extend([len(left_keys)] * len(unmatched))
+    right_pos.extend(unmatched)
+
+class JoinIndex:
+    """
+    Hash table over a frame's join key(s), built once and reused by every
+    merge(left, index, how=...), so each probe only hashes the left side.
+    Picklable, so it can be cached and reloaded instead of rebuilt.
+    Rebuild it after modifying the frame.
+    """
+    def __init__(self, df, on):
+        self.on = _as_key_list(on)
+        for col in self.on:
+            if col not in df.columns:
+                raise KeyError(f"Column '{col}' not found")
+        self.frame = df
+        self.keys = _key_column(df, self.on)
+        self.key_map, self.unique = _build_key_map(self.keys)
+
+    def __contains__(self, key):
+        return key in self.key_map
+
+    def __repr__(self):
+        return f"JoinIndex(on={self.on}, rows={len(self.keys)}, keys={len(self.key_map)})"
+
+def _sort_merge_positions(left_keys, right_keys, how, multi):
+    """
+    Join positions from a two-pointer merge over key-sorted rows, in key
+    order. Already-sorted sides (the usual case for time-series exports)
+    are walked as-is; unsorted ones are argsorted first. None keys sort
+    last and match each other, as in the hash join.
+    """
+    n_left = len(left_keys)
+    n_right = len(right_keys)
+    keep_left = how in ('left', 'outer')
+    keep_right = how in ('right', 'outer')
+
+    if _has_null_key(left_keys, multi) or _has_null_key(right_keys, multi):
+        # Make None orderable (last) on both sides.
+        from .groupby import _sort_key
+        if multi:
+            left_keys = [_sort_key(key) for key in left_keys]
+            right_keys = [_sort_key(key) for key in right_keys]
+        else:
+            left_keys = [(key is None, key) for key in left_keys]
+            right_keys = [(key is None, key) for key in right_keys]
+
+    left_order, left_sorted = _sorted_keys(left_keys)
+    right_order, right_sorted = _sorted_keys(right_keys)
+
+    left_pos = []
+    right_pos = []
+    i = j = 0
+    while i < n_left and j < n_right:
+        left_key = left_sorted[i]
+        right_key = right_sorted[j]
+        if left_key < right_key:
+            if keep_left:
+                left_pos.append(left_order[i])
+                right_pos.append(n_right)
+            i += 1
+        elif right_key < left_key:
+            if keep_right:
+                left_pos.append(n_left)
+                right_pos.append(right_order[j])
+            j += 1
+        else:
+            i_end = i + 1
+            while i_end < n_left and left_sorted[i_end] == left_key:
+                i_end += 1
+            j_end = j + 1
+            while j_end < n_right and right_sorted[j_end] == right_key:
+                j_end += 1
+            run = right_order[j:j_end]
+            for k in range(i, i_end):
+                left_pos.extend([left_order[k]] * len(run))
+                right_pos.extend(run)
+            i, j = i_end, j_end
+
+    if keep_left and i < n_left:
+        left_pos.extend(left_order[i:])
+        right_pos.extend([n_right] * (n_left - i))
+    if keep_right and j < n_right:
+        left_pos.extend([n_left] * (n_right - j))
+        right_pos.extend(right_order[j:])
+    return left_pos, right_pos
+
+def _has_null_key(keys, multi):
+    if multi:
+        return any(None in key for key in keys)
+    return None in keys
+
+def _sorted_keys(keys):
+    """(row order, keys in that order); already-sorted keys are not copied."""
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        return range(len(keys)), keys
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return order, [keys[k] for k in order]
+
+def _key_filter_positions(left_keys, key_set, keep):
+    """Left row positions whose key is (keep=True) or is not in `key_set`."""
+    if keep:
+        return [i for i, key in enumerate(left_keys) if key in key_set]
+    return [i for i, key in enumerate(left_keys) if key not in key_set]
+
+def _gatherer(positions, missing):
+    """
+    Function gathering `positions` from a column list of length
+    `missing`; that one-past-the-end position gives None. Built once per
+    side and applied to every column, writing straight into the output.
+    """
+    from .indexing import _row_taker
+    if missing not in positions:
+        return _row_taker(positions)
+    return lambda values: [values[i] if i != missing else None for i in positions]
+
+def _gather(values, positions):
+    """values[i] for every position; the one-past-the-end position gives None."""
+    return _gatherer(positions, len(values))(values)
+
+def _coalesce(left_values, right_values, left_pos, right_pos):
+    """A key column taken from the left, or from the right for right-only rows."""
+    n_left = len(left_values)
+    return [left_values[i] if i != n_left else right_values[j] for i, j in zip(left_pos, right_pos)]
+
+def _output_columns(left_columns, right_columns, shared_keys, skip_right, suffixes):
+    """
+    (output name, side, source column) for each result column: left
+    columns then right columns (less `skip_right` and `shared_keys`,
+    which are coalesced into the left one), suffixing other overlaps.
+    """
+    overlap_cols = (set(left_columns) & set(right_columns)) - set(shared_keys) - set(skip_right)
+    left_suffix, right_suffix = suffixes
+
+    columns = []
+    for col in left_columns:
+        name = f"{col}{left_suffix}" if col in overlap_cols else col
+        columns.append((name, 'left', col))
+    for col in right_columns:
+        if col in shared_keys or col in skip_right:
+            continue
+        name = f"{col}{right_suffix}" if col in overlap_cols else col
+        columns.append((name, 'right', col))
+    return columns
+
+def _assemble(left, right, left_pos, right_pos, shared_keys, skip_right, suffixes):
+    """Gather the output frame laid out by _output_columns."""
+    take_left = _gatherer(left_pos, left.shape[0])
+    take_right = _gatherer(right_pos, right.shape[0])
+    result_data = {}
+    for name, side, col in _output_columns(left.columns, right.columns, shared_keys,
+                                           skip_right, suffixes):
+        if side == 'right':
+            result_data[name] = take_right(right._data[col])
+        elif col in shared_keys:
+            result_data[name] = _coalesce(left._data[col], right._data[col], left_pos, right_pos)
+        else:
+            result_data[name] = take_left(left._data[col])
+    return DataFrame._from_columns(result_data, list(range(len(left_pos))))
+
+def merge(left, right, on=None, how='inner', spill=False, partitions=16,
+          left_on=None, right_on=None, suffixes=('_x', '_y'), algorithm='hash'):
+    """
+    Join two DataFrames on key column(s) with a hash join.
+
+    The join first computes, for every output row, its position in each
+    input (hashing the smaller side), then gathers each output column in
+    one pass. Keys named the same on both sides are coalesced into one
+    column; other overlapping columns get `suffixes`.
+
+    how='semi' / 'anti' keep the left rows whose key does / does not
+    occur on the right: only a set of right keys is built, no right
+    columns are copied and rows are never duplicated.
+
+    algorithm='sort_merge' finds the positions with a linear two-pointer
+    merge instead, building no hash table; inputs already sorted on the
+    key are not re-sorted. Output rows then come in key order.
+
+    `right` may be a JoinIndex, whose prebuilt hash table is probed
+    directly; `on` then defaults to the index's key columns.
+
+    spill=True runs a grace hash join instead (see merge_chunks): both
+    sides are hash-partitioned to temporary files and joined partition by
+    partition, so the hash table only ever holds one partition. Output
+    rows are then grouped by partition rather than in left order.
+    """
+    index = None
+    if isinstance(right, JoinIndex):
+        if spill or algorithm != 'hash':
+            raise ValueError("A JoinIndex is only used by the in-memory hash join")
+        index = right
+        right = index.frame
+        if on is None and right_on is None:
+            right_on = index.on
+            if left_on is None:
+                left_on = index.on
+
+    if spill:
+        from .concat import concat
+        chunks = list(merge_chunks([left], [right], on, how=how, partitions=partitions,
+                                   left_on=left_on, right_on=right_on, suffixes=suffixes))
+        if chunks:
+            return concat(chunks, ignore_index=True)
+        if how in ('semi', 'anti'):
+            return DataFrame({col: [] for col in left.columns})
+        left_cols, right_cols = _resolve_keys(on, left_on, right_on)
+        shared_keys = [l for l, r in zip(left_cols, right_cols) if l == r]
+        columns = _output_columns(left.columns, right.columns, shared_keys, (), suffixes)
+        return DataFrame({name: [] for name, _, _ in columns})
+
+    left_cols, right_cols = _resolve_keys(on, left_on, right_on)
+    if index is not None and right_cols != index.on:
+        raise ValueError(f"JoinIndex is built on {index.on}, not {right_cols}")
+
+    for col in left_cols:
         if col not in left.columns:
             raise KeyError(f"Column '{col}' not found in left DataFrame")
+    for col in right_cols:
         if col not in right.columns:
             raise KeyError(f"Column '{col}' not found in right DataFrame")
 
-    if how not in ('inner', 'left', 'right', 'outer'):
-        raise ValueError("Only 'inner', 'left', 'right', 'outer' merge types are supported")
-
-    # 1. Build Hash Map from Right DataFrame
-    # right_map: {key_tuple: [row_idx1, row_idx2, ...]}
-    right_map = {}
-    
-    # Pre-fetch right columns
-    right_on_data = [right._data[col] for col in on_cols]
-    
-    for idx in range(right.shape[0]):
-        key = tuple(col_data[idx] for col_data in right_on_data)
-        if key not in right_map:
-            right_map[key] = []
-        right_map[key].append(idx)
-
-    # 2. Determine Result Columns and handle suffixes
-    # Identify overlapping columns (excluding join keys)
-    overlap_cols = set(left.columns) & set(right.columns) - set(on_cols)
-    
-    new_columns = {} # {new_col_name: source_col_name (or None for suffixes)}
-    
-    # Add left columns
-    for col in left.columns:
-        if col in on_cols:
-            new_columns[col] = ('left', col)
-        elif col in overlap_cols:
-            new_columns[f"{col}_x"] = ('left', col)
-        else:
-            new_columns[col] = ('left', col)
-            
-    # Add right columns
-    for col in right.columns:
-        if col in on_cols:
-            continue # Already handled (from left)
-        elif col in overlap_cols:
-            new_columns[f"{col}_y"] = ('right', col)
-        else:
-            new_columns[col] = ('right', col)
-
-    # Initialize result data structure
-    result_data = {col: [] for col in new_columns}
-    
-    # Track visited right indices for right/outer join
-    visited_right_indices = set()
-
-    # 3. Probe Left DataFrame and Build Result
-    left_on_data = [left._data[col] for col in on_cols]
-    
-    # For 'right' join optimization:
-    # If strictly right join, we could just iterate right and probe left map.
-    # But current structure (left probe right map) is good for left/inner/outer.
-    # 'Right' join can be viewed as: match generic (inner part) + unmatched right.
-    # But standard left-probe loop doesn't easily capture unmatched right unless we do full outer approach.
-    # Implementing generic "Outer" logic handles match + left_unmatched + right_unmatched.
-    # Inner: match only.
-    # Left: match + left_unmatched.
-    # Right: match + right_unmatched.
-    # Outer: all.
-    
-    # NOTE: If 'right' join, we strictly only care about right rows.
-    # If we iterate left rows, we might process rows that shouldn't exist in right join (left unmatched).
-    # So if 'right', we should SKIP left unmatched.
-    
-    for left_idx in range(left.shape[0]):
-        key = tuple(col_data[left_idx] for col_data in left_on_data)
-        right_indices = right_map.get(key, [])
-
-        if not right_indices:
-            if how == 'inner' or how == 'right':
+    if how not in _HOW:
+        raise ValueError(f"Unsupported merge type '{how}', expected one of {_HOW}")
+    if not isinstance(suffixes, (tuple, list)) or len(suffixes) != 2:
+        raise ValueError("suffixes must be a pair of strings")
+
+    left_keys = _key_column(left, left_cols)
+    right_keys = index.keys if index is not None else _key_column(right, right_cols)
+    if how in ('semi', 'anti'):
+        key_set = index.key_map if index is not None else set(right_keys)
+        positions = _key_filter_positions(left_keys, key_set, how == 'semi')
+        take = _gatherer(positions, left.shape[0])
+        return DataFrame._from_columns(
+            {col: take(values) for col, values in left._data.items()},
+            list(range(len(positions))),
+        )
+
+    if index is not None:
+        left_pos, right_pos = _probe_key_map(left_keys, index.key_map, index.unique,
+                                             len(right_keys), how)
+        if how in ('right', 'outer'):
+            _append_right_only(left_pos, right_pos, left_keys, right_keys)
+    elif algorithm == 'hash':
+        left_pos, right_pos = _join_positions(left_keys, right_keys, how)
+    elif algorithm == 'sort_merge':
+        left_pos, right_pos = _sort_merge_positions(left_keys, right_keys, how, len(left_cols) > 1)
+    else:
+        raise ValueError("algorithm must be 'hash' or 'sort_merge'")
+
+    # Key columns with the same name on both sides become one column.
+    shared_keys = [l for l, r in zip(left_cols, right_cols) if l == r]
+    return _assemble(left, right, left_pos, right_pos, shared_keys, (), suffixes)
+
+def _asof_match(values, right_values, right_order, direction, tolerance, allow_exact_matches):
+    """
+    Right position matched to each of `values`, or None. `right_values`
+    are sorted and `right_order` holds their row positions.
+    """
+    from bisect import bisect_left, bisect_right
+
+    backward = bisect_right if allow_exact_matches else bisect_left
+    forward = bisect_left if allow_exact_matches else bisect_right
+    n = len(right_values)
+
+    matches = []
+    for value in values:
+        if value is None:
+            matches.append(None)
+            continue
+
+        best = None
+        if direction != 'forward':
+            k = backward(right_values, value) - 1
+            if k >= 0:
+                best = k
+        if direction != 'backward':
+            k = forward(right_values, value)
+            if k < n and (best is None or right_values[k] - value < value - right_values[best]):
+                best = k
+
+        if best is not None and tolerance is not None and abs(value - right_values[best]) > tolerance:
+            best = None
+        matches.append(None if best is None else right_order[best])
+    return matches
+
+def merge_asof(left, right, on, by=None, direction='backward', tolerance=None,
+               allow_exact_matches=True, suffixes=('_x', '_y')):
+    """
+    Attach to each left row the right row with the nearest `on` value:
+    the last one at or before it ('backward'), the first at or after it
+    ('forward') or the closer of the two ('nearest', ties go backward).
+    With `by`, only rows with equal `by` values match. `tolerance` caps
+    the allowed distance. Left rows keep their order; the right side
+    need not be sorted.
+    """
+    if not isinstance(on, str):
+        raise TypeError("merge_asof key must be a single column name")
+    by_cols = _as_key_list(by) if by is not None else []
+    for col in [on] + by_cols:
+        if col not in left.columns:
+            raise KeyError(f"Column '{col}' not found in left DataFrame")
+        if col not in right.columns:
+            raise KeyError(f"Column '{col}' not found in right DataFrame")
+    if direction not in ('backward', 'forward', 'nearest'):
+        raise ValueError("direction must be 'backward', 'forward' or 'nearest'")
+    # Compare with a zero of the tolerance's own type (e.g. timedelta).
+    if tolerance is not None and tolerance < tolerance - tolerance:
+        raise ValueError("tolerance must be non-negative")
+
+    # Right rows with a usable key, sorted by it within each `by` group.
+    right_on = right._data[on]
+    groups = {}
+    if by_cols:
+        right_by = _key_column(right, by_cols)
+        for j, value in enumerate(right_on):
+            if value is not None:
+                groups.setdefault(right_by[j], []).append(j)
+    else:
+        groups[None] = [j for j, value in enumerate(right_on) if value is not None]
+    for key, positions in groups.items():
+        positions.sort(key=right_on.__getitem__)
+        groups[key] = (positions, [right_on[j] for j in positions])
+
+    n_left = left.shape[0]
+    n_right = right.shape[0]
+    left_on = left._data[on]
+    right_pos = [n_right] * n_left
+    if by_cols:
+        left_by = _key_column(left, by_cols)
+        left_groups = {}
+        for i, key in enumerate(left_by):
+            left_groups.setdefault(key, []).append(i)
+    else:
+        left_groups = {None: range(n_left)}
+
+    for key, positions in left_groups.items():
+        group = groups.get(key)
+        if group is None:
+            continue
+        right_order, right_values = group
+        matches = _asof_match([left_on[i] for i in positions], right_values, right_order,
+                              direction, tolerance, allow_exact_matches)
+        for i, j in zip(positions, matches):
+            if j is not None:
+                right_pos[i] = j
+
+    return _assemble(left, right, range(n_left), right_pos, (), [on] + by_cols, suffixes)
+
+_MERGE_CHUNKSIZE = 10000
+
+def _partition_to_spill(chunks, on_cols, partitions, temp_dir):
+    """
+    Hash-partition the rows of an iterable of DataFrames into one spill
+    file per partition. Returns (columns, spill files), or (None, None)
+    for no chunks.
+    """
+    from .spill import _open_spill_file, _write_spill, _SPILL_BATCH_ROWS
+
+    columns = None
+    files = []
+    buffers = [[] for _ in range(partitions)]
+    try:
+        for chunk in chunks:
+            if columns is None:
+                columns = chunk.columns
+                for col in on_cols:
+                    if col not in chunk._data:
+                        raise KeyError(f"Column '{col}' not found")
+                files = [_open_spill_file(temp_dir) for _ in range(partitions)]
+                positions = [columns.index(col) for col in on_cols]
+            elif set(chunk.columns) != set(columns):
+                raise ValueError(f"Chunk columns {chunk.columns} do not match {columns}")
+
+            rows = zip(*[chunk._data[col] for col in columns])
+            if len(positions) == 1:
+                i = positions[0]
+                for row in rows:
+                    buffers[hash(row[i]) % partitions].append(row)
+            else:
+                for row in rows:
+                    buffers[hash(tuple(row[i] for i in positions)) % partitions].append(row)
+
+            for p, buffer in enumerate(buffers):
+                if len(buffer) >= _SPILL_BATCH_ROWS:
+                    _write_spill(files[p], buffer)
+                    buffers[p] = []
+
+        for p, buffer in enumerate(buffers):
+            if buffer:
+                _write_spill(files[p], buffer)
+    except BaseException:
+        for f in files:
+            f.close()
+        raise
+
+    return columns, files
+
+def merge_chunks(left_chunks, right_chunks, on=None, how='inner', partitions=16,
+                 chunksize=_MERGE_CHUNKSIZE, temp_dir=None, left_on=None, right_on=None,
+                 suffixes=('_x', '_y')):
+    """
+    Grace hash join over iterables of DataFrame chunks.
+
+    Both inputs are hash-partitioned on the key into `partitions` spill
+    files; each partition pair is then loaded and joined with merge(), so
+    peak memory is roughly one partition of each side plus its result.
+    Yields result DataFrames of up to `chunksize` rows, grouped by
+    partition (not in input order).
+    """
+    left_cols, right_cols = _resolve_keys(on, left_on, right_on)
+
+    if how not in _HOW:
+        raise ValueError(f"Unsupported merge type '{how}', expected one of {_HOW}")
+    if partitions < 1:
+        raise ValueError("partitions must be a positive integer")
+
+    return _merge_chunks(left_chunks, right_chunks, left_cols, right_cols, how, partitions,
+                         chunksize, temp_dir, suffixes)
+
+def _merge_chunks(left_chunks, right_chunks, left_cols, right_cols, how, partitions,
+                  chunksize, temp_dir, suffixes):
+    from .spill import _iter_spill
+    from .sqlite import _rows_to_frame
+
+    left_columns, left_files = _partition_to_spill(left_chunks, left_cols, partitions, temp_dir)
+    try:
+        right_columns, right_files = _partition_to_spill(right_chunks, right_cols, partitions, temp_dir)
+    except BaseException:
+        for f in left_files or []:
+            f.close()
+        raise
+
+    if left_columns is None or right_columns is None:
+        for f in (left_files or []) + (right_files or []):
+            f.close()
+        raise ValueError("merge_chunks needs at least one chunk on each side")
+
+    try:
+        for p in range(partitions):
+            left_part = _rows_to_frame(left_columns, list(_iter_spill(left_files[p])))
+            right_part = _rows_to_frame(right_columns, list(_iter_spill(right_files[p])))
+            if not left_part.shape[0] and not right_part.shape[0]:
                 continue
-            elif how == 'left' or how == 'outer':
-                # Add row with None for right columns
-                for new_col, (source, orig_col) in new_columns.items():
-                    if source == 'left':
-                        result_data[new_col].append(left._data[orig_col][left_idx])
-                    else: # right
-                        result_data[new_col].append(None)
-        else:
-            # Match found
-            for right_idx in right_indices:
-                visited_right_indices.add(right_idx)
-                for new_col, (source, orig_col) in new_columns.items():
-                    if source == 'left':
-                         result_data[new_col].append(left._data[orig_col][left_idx])
-                    else: # right
-                         result_data[new_col].append(right._data[orig_col][right_idx])
-    
-    # 4. Handle Unmatched Right Rows (for Right and Outer joins)
-    if how == 'right' or how == 'outer':
-        # Find indices in right that were not visited
-        all_right_indices = set(range(right.shape[0]))
-        unmatched_right_indices = sorted(list(all_right_indices - visited_right_indices))
-        
-        for right_idx in unmatched_right_indices:
-            for new_col, (source, orig_col) in new_columns.items():
-                if source == 'right':
-                    result_data[new_col].append(right._data[orig_col][right_idx])
-                elif source == 'left':
-                    # If this is a join key column, we might be able to fill it from right data!
-                    # "On" columns are mapped from 'left' in new_columns logic above: new_columns[col] = ('left', col)
-                    # So 'left' source logic handles the key column in result.
-                    # But for unmatched RIGHT row, we don't have a left row.
-                    # HOWEVER, we DO have the value in the right row for the key column.
-                    # Is orig_col (from left) name same as right? Yes, 'on' cols must exist in both.
-                    
-                    # Check if this result column corresponds to an 'on' column
-                    # The mapping above used key 'col' -> ('left', col).
-                    # Check if 'new_col' (the key in result) is in 'on_cols'.
-                    if new_col in on_cols:
-                         # Fill from right data
-                         result_data[new_col].append(right._data[new_col][right_idx])
-                    else:
-                         # Truly left-only column -> None
-                         result_data[new_col].append(None)
-
-    return DataFrame(result_data)
+
+            result = merge(left_part, right_part, how=how, left_on=left_cols,
+                           right_on=right_cols, suffixes=suffixes)
+            left_part = right_part = None
+            for start in range(0, result.shape[0], chunksize):
+                yield result.iloc[start:start + chunksize]
+    finally:
+        for f in left_files + right_files:
+            f.close()
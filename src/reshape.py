@@ -0,0 +1,164 @@
+from .core import DataFrame
+from .series import Series
+
+def _as_list(cols, what):
+    if cols is None:
+        return []
+    if isinstance(cols, str):
+        return [cols]
+    if isinstance(cols, list):
+        return cols
+    raise TypeError(f"{what} must be a string or list of strings")
+
+def _column_label(key, n_cols):
+    """Output column name for a column key: the value itself, or '_'-joined."""
+    if n_cols == 1:
+        return key[0]
+    return '_'.join(str(x) for x in key)
+
+def _pivot(df, index, columns, values, aggfunc, fill_value, dropna, as_index, unique=False):
+    """
+    Shared pivot_table/pivot body: one hash-aggregation pass keyed by
+    (row key, column key), then scatter each cell into per-column output
+    buffers.
+    """
+    from .groupby import _get_grouping, _compute_states, _finalize_states, _sort_key
+    from .aggregation import get_accumulator
+
+    index_cols = _as_list(index, "index")
+    column_cols = _as_list(columns, "columns")
+    if not index_cols:
+        raise ValueError("pivot requires at least one index column")
+    if not column_cols:
+        raise ValueError("pivot requires at least one columns column")
+    by_cols = index_cols + column_cols
+    for col in by_cols:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found")
+
+    if values is None and isinstance(aggfunc, dict):
+        value_cols = list(aggfunc)
+    elif values is None:
+        value_cols = [col for col in df.columns if col not in by_cols]
+    else:
+        value_cols = _as_list(values, "values")
+    for col in value_cols:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found")
+
+    if isinstance(aggfunc, dict):
+        missing = [col for col in value_cols if col not in aggfunc]
+        if missing:
+            raise KeyError(f"No aggfunc given for values: {missing}")
+        specs = [(col, col, get_accumulator(aggfunc[col])) for col in value_cols]
+    else:
+        acc = get_accumulator(aggfunc)
+        specs = [(col, col, acc) for col in value_cols]
+
+    # Cell ids: one dense id per distinct (row key, column key).
+    grouping = _get_grouping(df, by_cols, dropna)
+    if unique and len(grouping.keys) != len(grouping.group_ids):
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+    columns_data = {col: df._data[col] for col in value_cols}
+    values_list = _finalize_states(
+        specs, _compute_states(specs, grouping.group_ids, grouping.n_slots, columns_data)
+    )
+
+    # Split cell keys into row / column keys and give each a sorted position.
+    n_index = len(index_cols)
+    cell_keys = grouping.keys
+    row_keys = sorted({key[:n_index] for key in cell_keys}, key=_sort_key)
+    col_keys = sorted({key[n_index:] for key in cell_keys}, key=_sort_key)
+    row_pos = {key: i for i, key in enumerate(row_keys)}
+    col_pos = {key: i for i, key in enumerate(col_keys)}
+    cell_rows = [row_pos[key[:n_index]] for key in cell_keys]
+    cell_cols = [col_pos[key[n_index:]] for key in cell_keys]
+
+    key_as_index = as_index and n_index == 1
+    result_data = {}
+    if not key_as_index:
+        for i, col in enumerate(index_cols):
+            result_data[col] = [key[i] for key in row_keys]
+
+    n_rows = len(row_keys)
+    for (name, _, _), cell_values in zip(specs, values_list):
+        buffers = [[fill_value] * n_rows for _ in col_keys]
+        for cid, (r, c) in enumerate(zip(cell_rows, cell_cols)):
+            value = cell_values[cid]
+            if value is not None:
+                buffers[c][r] = value
+        for key, buffer in zip(col_keys, buffers):
+            label = _column_label(key, len(column_cols))
+            if len(specs) > 1:
+                label = f"{name}_{label}"
+            result_data[label] = buffer
+
+    index = [key[0] for key in row_keys] if key_as_index else None
+    return DataFrame(result_data, index=index)
+
+def pivot_table(df, index, columns, values=None, aggfunc='mean', fill_value=None,
+                dropna=True, as_index=True):
+    """
+    Aggregate `values` into a wide table: one row per `index` key, one
+    column per distinct `columns` key (named '<value>_<key>' when several
+    value columns are pivoted). `aggfunc` is any groupby aggregation, or
+    a {value_column: func} dict. Missing cells get `fill_value`.
+    """
+    return _pivot(df, index, columns, values, aggfunc, fill_value, dropna, as_index)
+
+def pivot(df, index, columns, values=None):
+    """Reshape without aggregating; each (index, columns) pair must be unique."""
+    return _pivot(df, index, columns, values, 'first', None, False, True, unique=True)
+
+def crosstab(index, columns, values=None, aggfunc=None, fill_value=0):
+    """
+    Frequency table of two Series/lists (or `aggfunc` of `values` per
+    cell when given).
+    """
+    if (values is None) != (aggfunc is None):
+        raise ValueError("values and aggfunc must be given together")
+
+    def _name(obj, default):
+        return obj.name if isinstance(obj, Series) and obj.name is not None else default
+
+    row_name = _name(index, 'row_0')
+    col_name = _name(columns, 'col_0')
+    if row_name == col_name:
+        col_name = 'col_0' if row_name != 'col_0' else 'col_1'
+    data = {row_name: list(index), col_name: list(columns)}
+    if values is None:
+        # 'size' counts every row in the cell, whatever the values are.
+        data['__values__'] = data[row_name]
+        aggfunc = 'size'
+    else:
+        data['__values__'] = list(values)
+    return _pivot(DataFrame(data), row_name, col_name, '__values__', aggfunc, fill_value, True, True)
+
+def melt(df, id_vars=None, value_vars=None, var_name='variable', value_name='value'):
+    """
+    Unpivot wide to long: one row per (input row, value column), with the
+    column name in `var_name` and its value in `value_name`.
+    """
+    id_cols = _as_list(id_vars, "id_vars")
+    if value_vars is None:
+        value_cols = [col for col in df.columns if col not in id_cols]
+    else:
+        value_cols = _as_list(value_vars, "value_vars")
+    for col in id_cols + value_cols:
+        if col not in df.columns:
+            raise KeyError(f"Column '{col}' not found")
+    for name in (var_name, value_name):
+        if name in id_cols:
+            raise ValueError(f"'{name}' is already an id_vars column")
+
+    n = df._length
+    k = len(value_cols)
+    result_data = {col: df._data[col] * k for col in id_cols}
+    variable = []
+    value = []
+    for col in value_cols:
+        variable.extend([col] * n)
+        value.extend(df._data[col])
+    result_data[var_name] = variable
+    result_data[value_name] = value
+    return DataFrame(result_data)
@@ -1,3 +1,6 @@
+import itertools
+import operator
+
 class Series:
     def __init__(self, data: list, index=None, name: str = None, copy: bool = True):
         if not isinstance(data, list):
@@ -23,7 +26,15 @@ class Series:
             new_index = self.index[item]
             return Series(new_data, index=new_index, name=self.name)
             
-        # 2. Boolean Indexing (List of bools): Return filtered Series
+        # 2. Boolean Indexing (mask or list of bools): Return filtered Series
+        if isinstance(item, BooleanMask):
+            if len(item) != len(self._data):
+                raise ValueError(f"Item length {len(item)} does not match Series length {len(self._data)}")
+            from .indexing import _take
+            positions = item.positions()
+            return Series(_take(self._data, positions), index=_take(self.index, positions),
+                          name=self.name, copy=False)
+
         if isinstance(item, list) and item and isinstance(item[0], bool):
             if len(item) != len(self._data):
                 raise ValueError(f"Item length {len(item)} does not match Series length {len(self._data)}")
@@ -42,7 +53,6 @@ class Series:
         return f"Series({self._data}, index={self.index}{name_str})"
 
     def _compare(self, other, op):
-        result = []
         is_series = isinstance(other, Series)
         
         if is_series:
@@ -50,23 +60,25 @@ class Series:
                 raise ValueError("Can only compare identically-labeled Series objects")
             if self.index != other.index:
                 raise ValueError("Index mismatch: Align indices manually before operations.")
+            pairs = zip(self._data, other._data)
+        else:
+            pairs = zip(self._data, itertools.repeat(other))
 
-        for i, x in enumerate(self._data):
-            if x is None:
-                result.append(False) 
-                continue
-            
-            if is_series:
-                 val = other._data[i]
-            else:
-                 val = other
-
-            try:
-                res = op(x, val)
-                result.append(res)
-            except TypeError:
-                result.append(False)
-        return Series(result, index=self.index, name=self.name)
+        # None (on the left) and incomparable values compare False.
+        try:
+            flags = bytearray(x is not None and op(x, val) for x, val in pairs)
+        except (TypeError, ValueError):
+            flags = bytearray(len(self._data))
+            values = other._data if is_series else itertools.repeat(other)
+            for i, (x, val) in enumerate(zip(self._data, values)):
+                if x is None:
+                    continue
+                try:
+                    if op(x, val):
+                        flags[i] = 1
+                except TypeError:
+                    pass
+        return BooleanMask._from_flags(flags, index=self.index, name=self.name)
 
     def _arithmetic_op(self, other, op):
         result = []
@@ -78,14 +90,10 @@ class Series:
             if self.index != other.index:
                 raise ValueError("Index mismatch: Align indices manually before operations.")
         
-        for i in range(len(self._data)):
-            val1 = self._data[i]
-            
-            if is_series:
-                val2 = other._data[i]
-            else:
-                val2 = other
-                
+        # Read _data once: on a BooleanMask it unpacks the bits per access.
+        values = self._data
+        others = other._data if is_series else itertools.repeat(other, len(values))
+        for val1, val2 in zip(values, others):
             if val1 is None or val2 is None:
                 result.append(None)
             else:
@@ -110,29 +118,48 @@ class Series:
         return self._arithmetic_op(other, lambda x, y: x / y)
 
     def __eq__(self, other):
-        return self._compare(other, lambda x, y: x == y)
+        return self._compare(other, operator.eq)
 
     def __ne__(self, other):
-        return self._compare(other, lambda x, y: x != y)
+        return self._compare(other, operator.ne)
 
     def __lt__(self, other):
-        return self._compare(other, lambda x, y: x < y)
+        return self._compare(other, operator.lt)
 
     def __le__(self, other):
-        return self._compare(other, lambda x, y: x <= y)
+        return self._compare(other, operator.le)
 
     def __gt__(self, other):
-        return self._compare(other, lambda x, y: x > y)
+        return self._compare(other, operator.gt)
 
     def __ge__(self, other):
-        return self._compare(other, lambda x, y: x >= y)
+        return self._compare(other, operator.ge)
 
     def isin(self, values):
         """Check if elements are in values."""
         # optimize with set
         if not isinstance(values, set):
             values = set(values)
-        return Series([x in values for x in self._data], index=self.index, name=self.name)
+        flags = bytearray(x in values for x in self._data)
+        return BooleanMask._from_flags(flags, index=self.index, name=self.name)
+
+    def _as_mask(self):
+        if isinstance(self, BooleanMask):
+            return self
+        return BooleanMask._from_flags(bytearray(bool(x) for x in self._data),
+                                       index=self.index, name=self.name)
+
+    def __and__(self, other):
+        return self._as_mask() & other
+
+    def __or__(self, other):
+        return self._as_mask() | other
+
+    def __xor__(self, other):
+        return self._as_mask() ^ other
+
+    def __invert__(self):
+        return ~self._as_mask()
 
     def apply(self, func):
         """Apply function to each element safely."""
@@ -216,7 +243,19 @@ class StringMethods:
     def replace(self, old, new):
         return self._str_op(lambda x: x.replace(old, new))
 
-    def contains(self, pat):
+    def contains(self, pat, na=None):
+        """
+        Whether each string contains `pat`. Missing values stay None,
+        unless `na` gives the boolean to use for them, in which case the
+        result is a BooleanMask.
+        """
+        if na is not None:
+            flags = bytearray(
+                (pat in x) if isinstance(x, str) else (x is None and bool(na))
+                for x in self._series._data
+            )
+            return BooleanMask._from_flags(flags, index=self._series.index, name=self._series.name)
+
         result = []
         for x in self._series._data:
             if x is None:
@@ -227,3 +266,110 @@ class StringMethods:
                 continue
             result.append(pat in x)
         return Series(result, index=self._series.index, name=self._series.name)
+
+
+# bytes.translate tables between one-byte-per-row 0/1 flags and '0'/'1' text
+_FLAGS_TO_TEXT = bytes.maketrans(b'\x00\x01', b'01')
+_TEXT_TO_FLAGS = bytes.maketrans(b'01', b'\x00\x01')
+
+class BooleanMask(Series):
+    """
+    A boolean Series packed into the bits of a Python int (bit i is row
+    i), as returned by comparisons, isin() and str.contains(na=...).
+    &, |, ^ and ~ are single big-int operations, so combining filters
+    over n rows touches n / 8 bytes; the index is shared with the source,
+    not copied. Behaves like a Series of Python bools everywhere else.
+    """
+    def __init__(self, bits, length, index=None, name=None):
+        self._bits = bits
+        self._length = length
+        self._packed = None
+        self.name = name
+        if index is None:
+            index = list(range(length))
+        elif len(index) != length:
+            raise ValueError(f"Index length {len(index)} must match data length {length}")
+        self.index = index
+
+    @classmethod
+    def _from_flags(cls, flags, index=None, name=None):
+        """Pack a bytearray of 0/1 per row."""
+        length = len(flags)
+        bits = int(flags.translate(_FLAGS_TO_TEXT)[::-1], 2) if length else 0
+        return cls(bits, length, index=index, name=name)
+
+    @classmethod
+    def from_bools(cls, values, index=None, name=None):
+        return cls._from_flags(bytearray(bool(x) for x in values), index=index, name=name)
+
+    def _unpacked(self):
+        """One byte (0 or 1) per row."""
+        if not self._length:
+            return b''
+        text = format(self._bits, f'0{self._length}b')[::-1].encode('ascii')
+        return text.translate(_TEXT_TO_FLAGS)
+
+    @property
+    def _data(self):
+        return [bool(flag) for flag in self._unpacked()]
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return map(bool, self._unpacked())
+
+    def __getitem__(self, item):
+        if isinstance(item, int):
+            i = item + self._length if item < 0 else item
+            if i < 0 or i >= self._length:
+                raise IndexError("BooleanMask index out of range")
+            if self._packed is None:
+                self._packed = self._bits.to_bytes((self._length + 7) // 8, 'little')
+            return bool(self._packed[i >> 3] >> (i & 7) & 1)
+        return super().__getitem__(item)
+
+    def positions(self):
+        """Row positions of the True entries (for gathers)."""
+        return list(itertools.compress(range(self._length), self._unpacked()))
+
+    def _other_bits(self, other):
+        if not isinstance(other, Series):
+            other = BooleanMask.from_bools(other)
+        elif not isinstance(other, BooleanMask):
+            other = other._as_mask()
+        if len(other) != self._length:
+            raise ValueError("Can only combine masks of the same length")
+        if other.index is not self.index and other.index != self.index:
+            raise ValueError("Index mismatch: Align indices manually before operations.")
+        return other._bits
+
+    def __and__(self, other):
+        return BooleanMask(self._bits & self._other_bits(other), self._length, self.index, self.name)
+
+    def __or__(self, other):
+        return BooleanMask(self._bits | self._other_bits(other), self._length, self.index, self.name)
+
+    def __xor__(self, other):
+        return BooleanMask(self._bits ^ self._other_bits(other), self._length, self.index, self.name)
+
+    def __invert__(self):
+        return BooleanMask(self._bits ^ ((1 << self._length) - 1), self._length, self.index, self.name)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def any(self):
+        return self._bits != 0
+
+    def all(self):
+        return self._bits == (1 << self._length) - 1
+
+    def sum(self):
+        """Number of True entries (popcount)."""
+        return bin(self._bits).count('1')
+
+    def __repr__(self):
+        name_str = f", name='{self.name}'" if self.name else ""
+        return f"BooleanMask({self._data}, index={self.index}{name_str})"
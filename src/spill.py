@@ -0,0 +1,170 @@
+import itertools
+import sys
+from .sqlite import _rows_to_frame
+
+_SPILL_BATCH_ROWS = 10000
+
+_DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+def _open_spill_file(temp_dir=None):
+    import tempfile
+    return tempfile.TemporaryFile(dir=temp_dir)
+
+def _write_spill(f, rows):
+    """Append row tuples to a spill file as pickled batches."""
+    import pickle
+    for start in range(0, len(rows), _SPILL_BATCH_ROWS):
+        pickle.dump(rows[start:start + _SPILL_BATCH_ROWS], f, pickle.HIGHEST_PROTOCOL)
+
+def _iter_spill(f):
+    """Stream row tuples back from a spill file, one batch in memory at a time."""
+    import pickle
+    f.seek(0)
+    while True:
+        try:
+            batch = pickle.load(f)
+        except EOFError:
+            return
+        yield from batch
+
+def _estimate_row_bytes(rows, sample_size=100):
+    """Rough in-memory size of one row tuple, from a sample of rows."""
+    sample = rows[:sample_size]
+    if not sample:
+        return 1
+    total = 0
+    for row in sample:
+        total += sys.getsizeof(row) + sum(sys.getsizeof(val) for val in row)
+    return max(1, total // len(sample))
+
+def _chunk_rows(df, columns):
+    """Row tuples of a chunk in `columns` order; columns must match."""
+    if set(df.columns) != set(columns):
+        raise ValueError(f"Chunk columns {df.columns} do not match {columns}")
+    return list(zip(*[df._data[col] for col in columns]))
+
+def _make_sort_key(positions, none_low):
+    """Key over row tuples that orders None before (none_low) or after values."""
+    if len(positions) == 1:
+        i = positions[0]
+        if none_low:
+            return lambda row: (row[i] is not None, row[i])
+        return lambda row: (row[i] is None, row[i])
+
+    if none_low:
+        return lambda row: tuple((row[i] is not None, row[i]) for i in positions)
+    return lambda row: tuple((row[i] is None, row[i]) for i in positions)
+
+def external_sort(chunks, by, ascending=True, na_position='last', memory_limit=None,
+                  chunksize=10000, output=None, output_format=None, temp_dir=None):
+    """
+    Sort an iterable of DataFrame chunks that together may not fit in memory.
+
+    Rows are buffered until their estimated size exceeds `memory_limit`
+    bytes (64 MB by default), then sorted and spilled to a temporary file
+    as a run of pickled row batches. The runs are k-way merged with
+    heapq.merge, so only one batch per run is held at a time.
+
+    Returns a generator of sorted DataFrames of `chunksize` rows, or, when
+    `output` is a path, writes the sorted rows there as CSV or NDJSON
+    (from `output_format` or the file extension) and returns None.
+    """
+    if isinstance(by, str):
+        by = [by]
+    if not isinstance(ascending, bool):
+        directions = set(ascending)
+        if len(directions) != 1:
+            raise ValueError("external_sort supports a single sort direction for all keys")
+        ascending = directions.pop()
+    if na_position not in ('first', 'last'):
+        raise ValueError("na_position must be 'first' or 'last'")
+    if memory_limit is None:
+        memory_limit = _DEFAULT_MEMORY_LIMIT
+
+    if output is not None:
+        output_format = _resolve_output_format(output, output_format)
+
+    sorted_chunks = _external_sort_chunks(
+        iter(chunks), by, not ascending, na_position, memory_limit, chunksize, temp_dir
+    )
+    if output is None:
+        return sorted_chunks
+    _write_sorted_output(sorted_chunks, output, output_format)
+
+def _resolve_output_format(output, output_format):
+    from .io import _COMPRESSION_EXTENSIONS
+
+    if output_format is None:
+        name = output.lower()
+        for ext in _COMPRESSION_EXTENSIONS:
+            if name.endswith(ext):
+                name = name[:-len(ext)]
+        if name.endswith('.csv'):
+            output_format = 'csv'
+        elif name.endswith(('.ndjson', '.jsonl')):
+            output_format = 'ndjson'
+    if output_format not in ('csv', 'ndjson'):
+        raise ValueError("output_format must be 'csv' or 'ndjson'")
+    return output_format
+
+def _write_sorted_output(sorted_chunks, output, output_format):
+    from .io import _infer_compression, _TextStream, _to_csv_to_file_obj, _to_ndjson_to_file_obj
+
+    compression = _infer_compression(output, 'infer')
+    newline = '' if output_format == 'csv' else None
+    with _TextStream(output, 'w', compression, newline=newline) as f:
+        for i, chunk in enumerate(sorted_chunks):
+            if output_format == 'csv':
+                _to_csv_to_file_obj(chunk, f, header=(i == 0))
+            else:
+                _to_ndjson_to_file_obj(chunk, f)
+
+def _external_sort_chunks(chunks, by, reverse, na_position, memory_limit, chunksize, temp_dir):
+    import heapq
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    columns = first.columns
+    for col in by:
+        if col not in first._data:
+            raise KeyError(f"Column '{col}' not found")
+
+    none_low = (na_position == 'first') != reverse
+    key = _make_sort_key([columns.index(col) for col in by], none_low)
+
+    buffer = []
+    max_rows = None
+    runs = []
+    try:
+        for chunk in itertools.chain([first], chunks):
+            buffer.extend(_chunk_rows(chunk, columns))
+            if max_rows is None and buffer:
+                max_rows = max(1, memory_limit // _estimate_row_bytes(buffer))
+            if max_rows is not None and len(buffer) >= max_rows:
+                buffer.sort(key=key, reverse=reverse)
+                run = _open_spill_file(temp_dir)
+                runs.append(run)
+                _write_spill(run, buffer)
+                buffer = []
+
+        buffer.sort(key=key, reverse=reverse)
+        if runs:
+            if buffer:
+                run = _open_spill_file(temp_dir)
+                runs.append(run)
+                _write_spill(run, buffer)
+                buffer = []
+            rows = heapq.merge(*[_iter_spill(run) for run in runs], key=key, reverse=reverse)
+        else:
+            # Everything fit in memory: no spill, no merge.
+            rows = iter(buffer)
+
+        while True:
+            batch = list(itertools.islice(rows, chunksize))
+            if not batch:
+                break
+            yield _rows_to_frame(columns, batch)
+    finally:
+        for run in runs:
+            run.close()
@@ -0,0 +1,157 @@
+from .core import DataFrame
+from .io import _iter_row_batches
+
+_SQL_CHUNKSIZE = 10000
+
+_SQLITE_TYPES = {
+    bool: 'INTEGER',
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+    bytes: 'BLOB',
+}
+
+def _quote_identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+def _column_type(values):
+    """
+    Declared SQLite type for a column, or '' (no affinity) when the values
+    are mixed, so SQLite stores every value exactly as given.
+    """
+    types = set(map(type, values))
+    types.discard(type(None))
+    if types <= {bool, int}:
+        return 'INTEGER' if types else ''
+    if len(types) == 1:
+        return _SQLITE_TYPES.get(types.pop(), '')
+    return ''
+
+def _table_exists(conn, name):
+    cursor = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    )
+    return cursor.fetchone() is not None
+
+def to_sql(df, name, conn, if_exists='fail', chunksize=None, index=False, index_label=None):
+    """
+    Write DataFrame to a table through a sqlite3 connection.
+    Rows are inserted with executemany in batches of `chunksize` inside a
+    single transaction, which is rolled back on error.
+    if_exists: 'fail' (raise ValueError), 'replace' (drop and recreate)
+    or 'append'. index=True also writes the index as a first column named
+    `index_label` (default 'index'), which must not clash with a column.
+    """
+    if if_exists not in ('fail', 'replace', 'append'):
+        raise ValueError("if_exists must be 'fail', 'replace' or 'append'")
+    if chunksize is None:
+        chunksize = _SQL_CHUNKSIZE
+
+    if index:
+        label = 'index' if index_label is None else index_label
+        if label in df.columns:
+            raise ValueError(f"Index label '{label}' is already a column; pass another index_label")
+        columns = [label] + df.columns
+        df = df.assign(**{label: df.index})
+    else:
+        columns = df.columns
+    if not columns:
+        raise ValueError("Cannot write a DataFrame without columns to SQL")
+
+    table = _quote_identifier(name)
+    exists = _table_exists(conn, name)
+    if exists and if_exists == 'fail':
+        raise ValueError(f"Table '{name}' already exists")
+
+    with conn:
+        if exists and if_exists == 'replace':
+            conn.execute(f"DROP TABLE {table}")
+            exists = False
+
+        if not exists:
+            column_defs = ', '.join(
+                f"{_quote_identifier(col)} {_column_type(df._data[col])}".rstrip()
+                for col in columns
+            )
+            conn.execute(f"CREATE TABLE {table} ({column_defs})")
+
+        insert = "INSERT INTO {} ({}) VALUES ({})".format(
+            table,
+            ', '.join(_quote_identifier(col) for col in columns),
+            ', '.join('?' * len(columns)),
+        )
+        for batch in _iter_row_batches(df, columns, chunksize):
+            conn.executemany(insert, batch)
+
+def _result_columns(cursor):
+    if cursor.description is None:
+        return []
+    columns = [desc[0] for desc in cursor.description]
+    if len(set(columns)) != len(columns):
+        raise ValueError(f"Duplicate column names in query result: {columns}. Alias them in the query.")
+    return columns
+
+def _rows_to_frame(columns, rows):
+    if not rows:
+        return DataFrame({col: [] for col in columns})
+    return DataFrame({col: list(values) for col, values in zip(columns, zip(*rows))})
+
+def read_sql(query, conn, params=None, chunksize=None):
+    """
+    Run a query through a sqlite3 (or any DB-API) connection and return the
+    result as a DataFrame. If chunksize is set, returns a generator yielding
+    DataFrames built from fetchmany batches.
+    """
+    cursor = conn.execute(query, params or ())
+    try:
+        columns = _result_columns(cursor)
+    except ValueError:
+        # Release the statement so the connection stays usable.
+        cursor.close()
+        raise
+
+    if chunksize is None:
+        try:
+            return _rows_to_frame(columns, cursor.fetchall())
+        finally:
+            cursor.close()
+    else:
+        return _read_sql_chunks(cursor, columns, chunksize)
+
+def _read_sql_chunks(cursor, columns, chunksize):
+    try:
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield _rows_to_frame(columns, rows)
+    finally:
+        cursor.close()
+
+def sql(query, database=':memory:', params=None, **frames):
+    """
+    Run a SQL query over DataFrames passed as keyword arguments, e.g.
+    sql("SELECT * FROM a JOIN b USING (id)", a=df1, b=df2).
+    Frames are bulk loaded into a SQLite database (in memory by default,
+    or at the `database` path to work out of core) and the result is
+    returned as a DataFrame. The loaded tables are dropped again before
+    returning; a frame whose name is already a table in the database
+    raises ValueError rather than replacing it. 'database' and 'params'
+    cannot be used as frame names.
+    """
+    import sqlite3
+
+    conn = sqlite3.connect(database)
+    loaded = []
+    try:
+        for name, df in frames.items():
+            to_sql(df, name, conn)
+            loaded.append(name)
+        return read_sql(query, conn, params)
+    finally:
+        try:
+            with conn:
+                for name in loaded:
+                    conn.execute(f"DROP TABLE {_quote_identifier(name)}")
+        finally:
+            conn.close()
@@ -32,3 +32,80 @@ def test_concat_outer():
 def test_concat_empty_list():
     with pytest.raises(ValueError):
         concat([])
+
+def test_concat_is_lazy_until_positional_access(tmp_path):
+    chunks = [DataFrame({'A': [i, i + 1]}, index=['a', 'b']) for i in (0, 10, 20)]
+    chunks.append(DataFrame({'B': ['x']}, index=['c']))
+    # Nested concats reference the original pieces, not a flattened copy.
+    res = concat([concat(chunks[:2], ignore_index=False), chunks[2], chunks[3]],
+                 ignore_index=False)
+
+    assert res._blocks is not None and len(res._blocks) == 4
+    assert res.shape == (7, 2)
+    assert [len(chunk.index) for chunk in res.iter_chunks()] == [2, 2, 2, 1]
+
+    path = tmp_path / "out.csv"
+    res.to_csv(str(path))
+    assert res._blocks is not None
+    assert path.read_text().splitlines()[-1] == ',x'
+
+    assert list(res['A']) == [0, 1, 10, 11, 20, 21, None]
+    assert res.index == ['a', 'b', 'a', 'b', 'a', 'b', 'c']
+    assert res._blocks is None
+
+def test_concat_ignore_index_and_keys():
+    df1 = DataFrame({'A': [1, 2]}, index=['x', 'y'])
+    df2 = DataFrame({'A': [3]}, index=['x'])
+
+    assert concat([df1, df2], ignore_index=True).index == [0, 1, 2]
+    res = concat([df1, df2], keys=['jan', 'feb'])
+    assert res.index == [('jan', 'x'), ('jan', 'y'), ('feb', 'x')]
+
+def test_concat_default_index_stays_unique():
+    import io
+    from src import read_csv
+    chunks = list(read_csv(io.StringIO("v\n10\n11\n12\n13\n14\n"), chunksize=2))
+    assert [chunk.index for chunk in chunks] == [[0, 1], [0, 1], [0]]
+
+    # As before the lazy concat, the result is numbered 0..n-1.
+    res = concat(chunks)
+    assert res.index == [0, 1, 2, 3, 4]
+    assert res.at[3, 'v'] == 13
+    assert res.loc[4] == {'v': 14}
+
+    # Keeping the chunk indexes repeats labels: at reads the first match,
+    # loc returns every match.
+    kept = concat(chunks, ignore_index=False)
+    assert kept.index == [0, 1, 0, 1, 0]
+    assert kept.at[0, 'v'] == 10
+    assert list(kept.loc[0]['v']) == [10, 12, 14]
+
+def test_nested_concat_keeps_inner_ignore_index():
+    a = DataFrame({'A': [1]}, index=['a'])
+    b = DataFrame({'A': [2]}, index=['b'])
+    c = DataFrame({'A': [3]}, index=['d'])
+    inner = concat([a, b], ignore_index=True)
+
+    assert concat([inner, c], ignore_index=False).index == [0, 1, 'd']
+    assert concat([inner, c], keys=['in', 'c']).index == [('in', 0), ('in', 1), ('c', 'd')]
+    assert [chunk.index for chunk in inner.iter_chunks()] == [[0], [1]]
+
+def test_concat_axis_1():
+    left = DataFrame({'A': [1, 2]}, index=['x', 'y'])
+    right = DataFrame({'B': [3, 4]}, index=['x', 'y'])
+    res = concat([left, right], axis=1)
+    assert res.to_dict(orient='list') == {'A': [1, 2], 'B': [3, 4]}
+
+    other = DataFrame({'A': [5, 6]}, index=['y', 'z'])
+    with pytest.raises(ValueError):
+        concat([left, other], axis=1)
+
+    res = concat([left, other], axis=1, keys=['l', 'r'])
+    assert res.index == ['x', 'y', 'z']
+    assert res.to_dict(orient='list') == {'l_A': [1, 2, None], 'r_A': [None, 5, 6]}
+
+def test_concat_does_not_see_later_input_writes():
+    a = DataFrame({'A': [1, 2]})
+    res = concat([a, DataFrame({'A': [3]})])
+    a.iloc[0, 0] = 99
+    assert list(res['A']) == [1, 2, 3]
@@ -188,3 +188,98 @@ def test_apply_axis1_preserves_index():
     assert res.index == ['x', 'y', 'z']
     assert res[0] == 5
     assert res[2] == 9
+
+def test_iloc_take_kernel_positions():
+    from array import array
+    df = DataFrame({'a': [0, 1, 2, 3, 4], 'b': list('vwxyz')}, index=list('pqrst'))
+
+    assert df.iloc[range(1, 4)].index == ['q', 'r', 's']
+    assert list(df.iloc[range(4, -1, -2)]['a']) == [4, 2, 0]
+    assert list(df.iloc[array('l', [3, 0, 3])]['b']) == ['y', 'v', 'y']
+    assert list(df.iloc[[True, False, True, False, False]]['a']) == [0, 2]
+
+    # Gathered columns are independent of the source.
+    part = df.iloc[[0, 1, 2]]
+    part['a'] = [9, 9, 9]
+    assert df['a'][0] == 0
+
+    # Positions past the end raise, whichever gather path they take.
+    for rows in ([3, 4, 5], range(3, 9), [4, 5, 3]):
+        with pytest.raises(IndexError):
+            df.iloc[rows]
+
+def test_iloc_rows_and_columns():
+    df = DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6], 'c': [7, 8, 9]}, index=['x', 'y', 'z'])
+
+    sub = df.iloc[[2, 0], [0, 2]]
+    assert sub.columns == ['a', 'c']
+    assert sub.index == ['z', 'x']
+    assert list(sub['c']) == [9, 7]
+
+    assert df.iloc[1, 1] == 5
+    assert df.iloc[0, [1, 2]] == {'b': 4, 'c': 7}
+    col = df.iloc[1:, 2]
+    assert list(col) == [8, 9] and col.index == ['y', 'z']
+
+def test_at_iat_read_and_write_in_place():
+    df = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']}, index=['p', 'q', 'r'])
+    column = df._data['a']
+
+    assert df.at['q', 'b'] == 'y'
+    assert df.iat[2, 0] == 3 and df.iat[-1, 1] == 'z'
+
+    df.at['q', 'a'] = 20
+    df.iat[0, 0] = 10
+    assert df._data['a'] is column
+    assert list(df['a']) == [10, 20, 3]
+
+    with pytest.raises(KeyError):
+        df.at['missing', 'a']
+    with pytest.raises(IndexError):
+        df.iat[3, 0]
+
+def test_loc_iloc_setitem():
+    df = DataFrame({'a': [1, 2, 3, 4], 'b': [0, 0, 0, 0]}, index=['w', 'x', 'y', 'z'])
+
+    df.loc[df['a'] > 2, 'b'] = 1
+    assert list(df['b']) == [0, 0, 1, 1]
+    df.loc[['w', 'y'], 'flag'] = True
+    assert list(df['flag']) == [True, None, True, None]
+    df.loc['x':'y', 'a'] = [20, 30]
+    assert list(df['a']) == [1, 20, 30, 4]
+
+    df.iloc[[0, 3], [0, 1]] = -1
+    assert df.iloc[0] == {'a': -1, 'b': -1, 'flag': True}
+    df.iloc[1:3, 1] = Series([5, 6])
+    assert list(df['b']) == [-1, 5, 6, -1]
+    with pytest.raises(ValueError):
+        df.iloc[0:2, 0] = [1, 2, 3]
+
+def test_setitem_checks_everything_before_writing():
+    df = DataFrame({'a': list(range(10)), 'b': ['s'] * 10, 'c': [1] * 10})
+
+    with pytest.raises(IndexError):
+        df.iloc[[0, 99], 0] = 5
+    with pytest.raises(ValueError):
+        df.loc[[0, 1], ['a', 'new']] = [1, 2, 3]
+    assert df['a'][0] == 0 and df.columns == ['a', 'b', 'c']
+
+    df.iloc[[-1, 0], 0] = [90, 10]
+    assert df['a'][0] == 10 and df['a'][9] == 90
+
+    # A single row across several columns takes one value per column.
+    df.iloc[0] = [1, 'x', 0]
+    assert df.iloc[0] == {'a': 1, 'b': 'x', 'c': 0}
+    df.loc[3, ['b', 'c']] = ['y', 7]
+    assert df.iloc[3] == {'a': 3, 'b': 'y', 'c': 7}
+
+def test_in_place_writes_copy_shared_columns_and_reset_groupings():
+    from src import concat
+    left = DataFrame({'k': ['a', 'b'], 'v': [1, 2]})
+    combined = concat([left, DataFrame({'k': ['a'], 'v': [3]})])
+
+    assert left.groupby('k').sum()['v'][0] == 1
+    left.at[0, 'k'] = 'b'
+    # The pending concat still sees the old values; groupings are rebuilt.
+    assert list(combined['k']) == ['a', 'b', 'a']
+    assert list(left.groupby('k').sum()['v']) == [3]
@@ -77,9 +77,8 @@ def test_ndjson_io(tmp_path):
     
     buffer.seek(0)
     content = buffer.getvalue()
-    # NDJSON should have separate objects per line
-    assert '{"a": 1, "b": "x"}' in content
-    assert '{"a": 2, "b": "y"}' in content
+    # NDJSON should have separate compact objects per line
+    assert content == '{"a":1,"b":"x"}\n{"a":2,"b":"y"}\n'
     
     buffer.seek(0)
     df_stream = read_ndjson(buffer)
@@ -120,3 +119,251 @@ def test_read_ndjson_chunking():
     assert chunks[0].iloc[0]['a'] == 1
     assert chunks[0].iloc[1]['a'] == 2
     assert chunks[1].iloc[0]['a'] == 3
+
+def test_to_csv_options():
+    import io
+    df = DataFrame({'a': [1.5, None, 3.25], 'b': ['x', 'y', 'z'], 'c': [1, 2, 3]})
+    buffer = io.StringIO()
+    df.to_csv(buffer, columns=['c', 'a'], sep=';', float_format='%.1f', na_rep='NA')
+
+    lines = buffer.getvalue().splitlines()
+    assert lines == ['c;a', '1;1.5', '2;NA', '3;3.2']
+
+def test_to_csv_append_chunks(tmp_path):
+    path = str(tmp_path / "chunks.csv")
+    csv_content = "a,b\n1,x\n2,y\n3,z\n4,w\n5,v\n"
+
+    import io
+    for i, chunk in enumerate(read_csv(io.StringIO(csv_content), chunksize=2)):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), chunksize=1)
+
+    df_read = read_csv(path)
+    assert df_read.shape == (5, 2)
+    assert list(df_read['a']) == [1, 2, 3, 4, 5]
+    assert df_read.iloc[4]['b'] == 'v'
+
+@pytest.mark.parametrize("ext", [".gz", ".bz2", ".xz", ".zip"])
+def test_compression_infer_roundtrip(tmp_path, ext):
+    df = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+
+    csv_path = str(tmp_path / ("test.csv" + ext))
+    df.to_csv(csv_path)
+    chunks = list(read_csv(csv_path, chunksize=2))
+    assert [c.shape for c in chunks] == [(2, 2), (1, 2)]
+    assert chunks[1].iloc[0]['b'] == 'z'
+
+    ndjson_path = str(tmp_path / ("test.ndjson" + ext))
+    df.to_ndjson(ndjson_path)
+    assert read_ndjson(ndjson_path).shape == (3, 2)
+
+    json_path = str(tmp_path / ("test.json" + ext))
+    df.to_json(json_path)
+    assert read_json(json_path).iloc[2]['a'] == 3
+
+def test_compression_explicit_buffer():
+    import io
+    import gzip
+    df = DataFrame({'a': [1, 2]})
+    buffer = io.BytesIO()
+    df.to_ndjson(buffer, compression='gzip')
+
+    assert gzip.decompress(buffer.getvalue()) == b'{"a":1}\n{"a":2}\n'
+
+    buffer.seek(0)
+    df_read = read_ndjson(buffer, compression='gzip')
+    assert df_read.iloc[1]['a'] == 2
+
+    with pytest.raises(ValueError):
+        read_csv(io.BytesIO(b''), compression='rar')
+
+def test_text_stream_closes_codec_when_wrapping_fails(tmp_path, monkeypatch):
+    import gzip
+    from src import io as lp_io
+    opened = []
+
+    def open_compressed(*args):
+        opened.append(gzip.open(str(tmp_path / "out.gz"), 'wb'))
+        return opened[-1]
+
+    monkeypatch.setattr(lp_io, '_open_compressed', open_compressed)
+    with pytest.raises(ValueError):
+        with lp_io._TextStream('out.gz', 'w', 'gzip', newline='bad'):
+            pass
+    assert opened[0].closed
+
+def test_read_ndjson_projection_and_flatten():
+    import io
+    content = (
+        '{"id": 1, "user": {"name": "a", "geo": {"country": "KR"}}, "extra": true}\n'
+        '{"id": 2, "user": {"name": "b"}}\n'
+    )
+    df = read_ndjson(io.StringIO(content), columns=['id', 'user.geo.country'], flatten=True)
+    assert df.columns == ['id', 'user.geo.country']
+    assert list(df['user.geo.country']) == ['KR', None]
+
+    flat = read_ndjson(io.StringIO(content), flatten=True)
+    assert flat.columns == ['id', 'user.name', 'user.geo.country', 'extra']
+    assert flat.iloc[1]['user.name'] == 'b'
+
+def test_read_ndjson_schema_evolution():
+    import io
+    content = '{"a": 1}\n{"a": 2}\n{"a": 3, "b": "new"}\n'
+
+    chunks = list(read_ndjson(io.StringIO(content), chunksize=2))
+    assert chunks[1].columns == ['a', 'b']
+    assert chunks[1].iloc[0]['b'] == 'new'
+
+    ignored = list(read_ndjson(io.StringIO(content), chunksize=2, schema_evolution='ignore'))
+    assert ignored[1].columns == ['a']
+
+    with pytest.raises(ValueError):
+        list(read_ndjson(io.StringIO(content), chunksize=2, schema_evolution='raise'))
+
+def test_read_json_chunksize_streaming():
+    import io
+    import json
+    records = [{'a': i, 'b': 'x' * (i % 7), 'n': i * 1.5} for i in range(25)]
+    content = json.dumps(records, indent=2)
+
+    chunks = list(read_json(io.StringIO(content), chunksize=10))
+    assert [c.shape[0] for c in chunks] == [10, 10, 5]
+    assert chunks[2].iloc[4]['a'] == 24
+    assert chunks[1].iloc[0]['n'] == 15.0
+
+    # A tiny buffer forces values to straddle buffer refills.
+    from src.io import _JSONArrayScanner
+    scanner = _JSONArrayScanner(io.StringIO(content), buffer_size=7)
+    assert list(scanner.iter_records()) == records
+
+def test_read_json_chunks_reject_malformed_input():
+    import io
+    from src.io import _JSONArrayScanner
+
+    with pytest.raises(ValueError, match="extra data"):
+        list(read_json(io.StringIO('[{"a": 1}] x'), chunksize=2))
+    with pytest.raises(TypeError, match="JSON array element"):
+        list(read_json(io.StringIO('[{"a": 1}, 2]'), chunksize=2))
+
+    # A bad element fails without reading the rest of the input.
+    content = '[{"a": 1}, {"a": nope}, ' + ', '.join(['{"a": 2}'] * 10000) + ']'
+    f = io.StringIO(content)
+    with pytest.raises(ValueError):
+        list(_JSONArrayScanner(f, buffer_size=64).iter_records())
+    assert f.tell() < 1000
+
+def test_read_json_record_path():
+    import io
+    content = '{"meta": {"page": [1, 2]}, "data": [{"a": 1}, {"a": 2}, {"a": 3}], "next": null}'
+
+    chunks = list(read_json(io.StringIO(content), chunksize=2, record_path='data'))
+    assert [c.shape for c in chunks] == [(2, 1), (1, 1)]
+
+    df = read_json(io.StringIO(content), record_path='data')
+    assert list(df['a']) == [1, 2, 3]
+
+    with pytest.raises(KeyError):
+        list(read_json(io.StringIO(content), chunksize=2, record_path='missing'))
+
+def test_to_json_orients():
+    import io
+    import json
+    df = DataFrame({'a': [1, 2], 'b': ['x', None]})
+
+    def dump(**kwargs):
+        buffer = io.StringIO()
+        df.to_json(buffer, **kwargs)
+        return buffer.getvalue()
+
+    records = dump()
+    assert records == '[{"a":1,"b":"x"},{"a":2,"b":null}]'
+    assert json.loads(dump(orient='values')) == [[1, 'x'], [2, None]]
+    assert json.loads(dump(orient='split')) == {
+        'columns': ['a', 'b'], 'index': [0, 1], 'data': [[1, 'x'], [2, None]]
+    }
+    assert json.loads(dump(orient='columns')) == {'a': {'0': 1, '1': 2}, 'b': {'0': 'x', '1': None}}
+    assert json.loads(dump(orient='split', indent=2)) == json.loads(dump(orient='split'))
+
+    with pytest.raises(ValueError):
+        dump(orient='table')
+
+def test_to_ndjson_values_orient():
+    import io
+    df = DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    buffer = io.StringIO()
+    df.to_ndjson(buffer, orient='values')
+    assert buffer.getvalue() == '[1,"x"]\n[2,"y"]\n'
+
+def test_read_async_from_stream_reader():
+    import asyncio
+    from src import read_csv_async, read_ndjson_async
+
+    async def feed(pieces):
+        reader = asyncio.StreamReader()
+        for piece in pieces:
+            reader.feed_data(piece)
+        reader.feed_eof()
+        return reader
+
+    async def collect(agen):
+        return [chunk async for chunk in agen]
+
+    async def main():
+        # Pieces split mid-row and mid-multibyte character, plus a quoted newline.
+        csv_bytes = 'a,b\n1,"x\ny"\n2,\xe9\n3,z\n'.encode('utf-8')
+        csv_reader = await feed([csv_bytes[:9], csv_bytes[9:18], csv_bytes[18:]])
+        csv_chunks = await collect(read_csv_async(csv_reader, chunksize=2))
+
+        ndjson_reader = await feed([b'{"a": 1}\n{"a"', b': 2}\n{"a": 3}'])
+        ndjson_chunks = await collect(read_ndjson_async(ndjson_reader, chunksize=2))
+        return csv_chunks, ndjson_chunks
+
+    csv_chunks, ndjson_chunks = asyncio.run(main())
+
+    assert [c.shape for c in csv_chunks] == [(2, 2), (1, 2)]
+    assert csv_chunks[0].iloc[0]['b'] == 'x\ny'
+    assert csv_chunks[0].iloc[1]['b'] == '\xe9'
+    assert csv_chunks[1].iloc[0]['a'] == 3
+
+    assert [c.shape for c in ndjson_chunks] == [(2, 1), (1, 1)]
+    assert ndjson_chunks[1].iloc[0]['a'] == 3
+
+def test_read_csv_where():
+    import io
+    content = "level,code,msg\nINFO,1,a\nERROR,2,b\nINFO,3,c\nERROR,4,d\nERROR,x,e\n"
+
+    chunks = list(read_csv(io.StringIO(content), chunksize=2, where={'level': 'ERROR'}))
+    assert [c.shape[0] for c in chunks] == [2, 1]
+    assert list(chunks[0]['code']) == [2, 4]
+
+    # Tested columns are converted first.
+    df = read_csv(io.StringIO(content), where={'code': lambda v: isinstance(v, int) and v > 2})
+    assert list(df['msg']) == ['c', 'd']
+    df = read_csv(io.StringIO(content), where={'code': {2, 'x'}})
+    assert list(df['msg']) == ['b', 'e']
+
+    # Errors in a condition are not mistaken for a non-match.
+    with pytest.raises(TypeError):
+        read_csv(io.StringIO(content), where={'code': lambda v: v > 2})
+    # A misspelt column raises instead of filtering out every row.
+    with pytest.raises(KeyError):
+        list(read_csv(io.StringIO(content), chunksize=10, where={'lvl': 'ERROR'}))
+    with pytest.raises(KeyError):
+        read_csv(io.StringIO(content), where={'lvl': 'ERROR'})
+
+    df = read_csv(io.StringIO(content), where=lambda row: row['code'] in (1, 'x'))
+    assert list(df['msg']) == ['a', 'e']
+
+def test_read_ndjson_where():
+    import io
+    content = ''.join(
+        '{"id": %d, "ctx": {"user": "%s"}}\n' % (i, 'bob' if i % 3 == 0 else 'amy')
+        for i in range(10)
+    )
+
+    chunks = list(read_ndjson(io.StringIO(content), chunksize=2, flatten=True,
+                              where={'ctx.user': {'bob'}}))
+    assert [c.shape[0] for c in chunks] == [2, 2]
+    assert [c.iloc[0]['id'] for c in chunks] == [0, 6]
+
+    df = read_ndjson(io.StringIO(content), where=lambda rec: rec['id'] >= 8)
+    assert list(df['id']) == [8, 9]
@@ -1,5 +1,5 @@
 import pytest
-from src import DataFrame, Series
+from src import DataFrame, Series, merge, merge_asof, JoinIndex
 
 def test_merge_right():
     df1 = DataFrame({'key': ['a', 'b'], 'val1': [1, 2]})
@@ -97,3 +97,325 @@ def test_groupby_as_index_false():
     assert res.index == [0, 1] # RangeIndex
     assert res['A'][0] == 'bar'
     assert res['B'][0] == 2
+
+def _sorted_rows(df, cols):
+    rows = zip(*[df[c] for c in cols])
+    return sorted(rows, key=lambda r: tuple((x is None, x) for x in r))
+
+@pytest.mark.parametrize("how", ['inner', 'left', 'right', 'outer'])
+def test_merge_spill_matches_in_memory(how):
+    left = DataFrame({'k': [1, 2, 2, 3, None, 5], 'lv': ['a', 'b', 'c', 'd', 'e', 'f']})
+    right = DataFrame({'k': [2, 3, 3, 4, None], 'rv': [20, 30, 31, 40, 0]})
+
+    expected = merge(left, right, on='k', how=how)
+    spilled = left.merge(right, on='k', how=how, spill=True, partitions=3)
+
+    cols = ['k', 'lv', 'rv']
+    assert spilled.shape == expected.shape
+    assert _sorted_rows(spilled, cols) == _sorted_rows(expected, cols)
+
+def test_merge_spill_without_matches_has_merge_columns():
+    left = DataFrame({'k': [1, 2], 'v': ['a', 'b']})
+    right = DataFrame({'k': [3], 'v': [30]})
+
+    empty = merge(left, right, on='k', spill=True)
+    assert empty.columns == merge(left, right, on='k').columns == ['k', 'v_x', 'v_y']
+    assert empty.shape == (0, 3)
+    assert merge(left, right, on='k', how='semi', spill=True).columns == ['k', 'v']
+
+def test_merge_chunks_streams_result():
+    from src import merge_chunks
+    left_chunks = [DataFrame({'id': list(range(i, i + 50)), 'x': [i] * 50}) for i in range(0, 200, 50)]
+    right_chunks = [DataFrame({'id': list(range(0, 200, 2)), 'y': list(range(100))})]
+
+    out = list(merge_chunks(iter(left_chunks), iter(right_chunks), on='id', partitions=4, chunksize=10))
+    assert all(c.shape[0] <= 10 for c in out)
+    ids = sorted(i for c in out for i in c['id'])
+    assert ids == list(range(0, 200, 2))
+
+def test_groupby_multi_key_single_pass():
+    df = DataFrame({
+        'A': ['x', 'y', 'x', 'x', None],
+        'B': [1, 1, 2, 1, 1],
+        'V': [1, 2, 3, None, 5],
+    })
+    g = df.groupby(['A', 'B'])
+    assert g.ngroups == 4
+    assert g.groups[('x', 1)] == [0, 3]
+
+    res = g.agg({'V': 'sum'})
+    assert list(res['A']) == ['x', 'x', 'y', None]
+    assert list(res['B']) == [1, 2, 1, 1]
+    assert list(res['V']) == [1, 3, 2, 5]
+
+    counts = g.count()
+    assert list(counts['V']) == [1, 1, 1, 1]
+
+def test_groupby_agg_registry_and_named(monkeypatch):
+    import statistics
+    from src import Accumulator, register_aggregation
+    from src import aggregation
+
+    class RangeAccumulator(Accumulator):
+        def update(self, state, value):
+            return [value, value] if state is None else [min(state[0], value), max(state[1], value)]
+
+        def merge(self, state, other):
+            if state is None or other is None:
+                return state or other
+            return [min(state[0], other[0]), max(state[1], other[1])]
+
+        def finalize(self, state):
+            return None if state is None else state[1] - state[0]
+
+    # Register into a copy so 'spread' does not outlive this test.
+    monkeypatch.setattr(aggregation, 'AGGREGATIONS', dict(aggregation.AGGREGATIONS))
+    register_aggregation('spread', RangeAccumulator)
+
+    df = DataFrame({
+        'k': ['a', 'a', 'b', 'a', 'b'],
+        'v': [4, 1, 2, None, 2],
+        'w': ['x', 'y', 'x', 'x', 'z'],
+    })
+    res = df.groupby('k').agg(
+        {'v': ['median', 'std', 'prod', 'spread'], 'w': ['nunique', 'first', 'last']},
+        total=('v', 'sum'),
+        rows=('v', 'size'),
+        top=('v', max),
+    )
+
+    a = res.loc['a']
+    assert a['v_median'] == 2.5
+    assert a['v_std'] == statistics.stdev([4, 1])
+    assert a['v_prod'] == 4
+    assert a['v_spread'] == 3
+    assert a['w_nunique'] == 2
+    assert a['w_first'] == 'x'
+    assert a['w_last'] == 'x'
+    assert a['total'] == 5
+    assert a['rows'] == 3
+    assert a['top'] == 4
+
+    b = res.loc['b']
+    assert b['v_std'] == 0
+    assert b['w_nunique'] == 2
+
+    with pytest.raises(ValueError):
+        df.groupby('k').agg({'v': 'mode'})
+
+def test_groupby_function_agg_on_all_none_group():
+    df = DataFrame({'k': ['a', 'b', 'a', 'b'], 'v': [3, None, 5, None]})
+    g = df.groupby('k')
+    res = g.agg({'v': max})
+    assert res.loc['a']['v'] == 5
+    assert res.loc['b']['v'] is None
+    assert list(g['v'].transform(max)) == [5, None, 5, None]
+
+def test_groupby_rowwise_operations():
+    df = DataFrame({
+        'user': ['u1', 'u2', 'u1', 'u1', 'u2', 'u1'],
+        'amount': [10, 5, 30, None, 5, 20],
+        'ts': [1, 2, 3, 4, 6, 9],
+    })
+    g = df.groupby('user')
+
+    share = df['amount'] / g['amount'].transform('sum')
+    assert share[0] == 10 / 60
+    assert share[3] is None
+
+    sums = g.transform('sum')
+    assert sums.columns == ['amount', 'ts']
+    assert list(sums['ts']) == [17, 8, 17, 17, 8, 17]
+
+    assert list(g['amount'].cumsum()) == [10, 5, 40, None, 10, 60]
+    assert list(g.cumcount()) == [0, 0, 1, 2, 1, 3]
+    assert list(g.cumcount(ascending=False)) == [3, 1, 2, 1, 0, 0]
+    assert list(g.ngroup()) == [0, 1, 0, 0, 1, 0]
+
+    assert list(g['ts'].shift()) == [None, None, 1, 3, 2, 4]
+    assert list(g['ts'].shift(-1)) == [3, 6, 4, 9, None, None]
+    assert list(g['ts'].diff()) == [None, None, 2, 1, 4, 5]
+
+    assert list(g['amount'].rank()) == [1, 1.5, 3, None, 1.5, 2]
+    assert list(g['amount'].rank(method='min', ascending=False)) == [3, 1, 1, None, 1, 2]
+    assert list(g['amount'].rank(method='first')) == [1, 1, 3, None, 2, 2]
+    assert list(g['amount'].rank(method='dense')) == [1, 1, 3, None, 1, 2]
+
+def test_groupby_sort_dropna_and_group_access():
+    df = DataFrame({'k': ['b', 'a', None, 'b', 'a', 'b'], 'v': [1, 2, 3, 4, 5, 6]})
+
+    unsorted = df.groupby('k', sort=False).sum()
+    assert unsorted.index == ['b', 'a', None]
+
+    g = df.groupby('k', dropna=True)
+    assert g.sum().index == ['a', 'b']
+    assert list(g['v'].cumsum()) == [1, 2, None, 5, 7, 11]
+
+    sizes = g.size()
+    assert isinstance(sizes, Series)
+    assert sizes.index == ['a', 'b']
+    assert list(sizes) == [2, 3]
+    assert list(df.groupby('k', as_index=False).size()['size']) == [2, 3, 1]
+
+    assert list(g.get_group('b')['v']) == [1, 4, 6]
+    with pytest.raises(KeyError):
+        g.get_group(None)
+
+    assert [(key, list(part['v'])) for key, part in g] == [('a', [2, 5]), ('b', [1, 4, 6])]
+
+def test_groupby_grouping_cached_until_modified():
+    df = DataFrame({'k': ['x', 'y', 'x'], 'v': [1, 2, 3]})
+    g1 = df.groupby('k')
+    g2 = df.groupby('k')
+    assert g1._grouping is g2._grouping
+    g1.sum()
+    assert g1._grouping._sorted_order is not None
+
+    df['k'] = ['y', 'y', 'y']
+    g3 = df.groupby('k')
+    assert g3._grouping is not g1._grouping
+    assert g3.ngroups == 1
+
+def test_groupby_workers_matches_serial(monkeypatch):
+    import src.groupby
+    monkeypatch.setattr(src.groupby, '_PARALLEL_MIN_ROWS', 0)
+
+    df = DataFrame({
+        'k': [i % 7 for i in range(200)],
+        'j': [None if i % 11 == 0 else i % 3 for i in range(200)],
+        'v': [float(i) for i in range(200)],
+    })
+    aggs = {'v': ['sum', 'mean', 'median', 'max']}
+
+    for by in ('k', ['k', 'j']):
+        serial = df.groupby(by, as_index=False).agg(aggs)
+        parallel = df.groupby(by, as_index=False, workers=3).agg(aggs)
+        assert parallel.to_dict(orient='list') == serial.to_dict(orient='list')
+
+    # Unpicklable functions fall back to in-process aggregation.
+    res = df.groupby('k', workers=3).agg({'v': lambda values: len(values)})
+    assert list(res['v']) == [29, 29, 29, 29, 28, 28, 28]
+
+def test_merge_left_on_right_on_and_suffixes():
+    orders = DataFrame({'cust': [1, 2, 1, 3], 'name': ['o1', 'o2', 'o3', 'o4']})
+    customers = DataFrame({'id': [1, 2], 'name': ['ann', 'bob']})
+
+    res = merge(orders, customers, left_on='cust', right_on='id', how='left',
+                suffixes=('_order', '_customer'))
+    assert res.columns == ['cust', 'name_order', 'id', 'name_customer']
+    assert list(res['id']) == [1, 2, 1, None]
+    assert list(res['name_customer']) == ['ann', 'bob', 'ann', None]
+
+    with pytest.raises(ValueError):
+        merge(orders, customers, on='name', left_on='cust', right_on='id')
+
+
+def test_merge_smaller_left_keeps_left_order():
+    # Left is hashed here (it is smaller), output must still follow left rows.
+    left = DataFrame({'k': [3, 1, 2, 9], 'a': ['x', 'y', 'z', 'w']})
+    right = DataFrame({'k': [1, 2, 1, 3, 4, 5, 6], 'b': list(range(7))})
+
+    res = left.merge(right, on='k', how='outer')
+    assert list(res['k']) == [3, 1, 1, 2, 9, 4, 5, 6]
+    assert list(res['a']) == ['x', 'y', 'y', 'z', 'w', None, None, None]
+    assert list(res['b']) == [3, 0, 2, 1, None, 4, 5, 6]
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_sort_merge_matches_hash_join(how):
+    left = DataFrame({'k': [1, 2, 2, 4, None], 'a': [10, 20, 21, 40, 50]})
+    right = DataFrame({'k': [5, 2, None, 1, 2], 'b': ['e', 'b', 'n', 'a', 'c']})
+
+    res = merge(left, right, on='k', how=how, algorithm='sort_merge')
+    expected = merge(left, right, on='k', how=how)
+    rows = lambda df: sorted(map(repr, zip(*[df[c] for c in df.columns])))
+    assert res.columns == expected.columns
+    assert rows(res) == rows(expected)
+    # Output follows key order, None last.
+    keys = [k for k in res['k'] if k is not None]
+    assert keys == sorted(keys)
+
+
+def test_merge_asof_directions_by_and_tolerance():
+    events = DataFrame({'t': [1, 5, 10, 3, None], 'sym': ['a', 'a', 'b', 'b', 'a']})
+    prices = DataFrame({'t': [0, 4, 9, 2, 6], 'sym': ['a', 'a', 'b', 'b', 'a'],
+                        'price': [10, 11, 20, 21, 12]})
+
+    res = merge_asof(events, prices, on='t', by='sym')
+    assert res.columns == ['t', 'sym', 'price']
+    assert list(res['price']) == [10, 11, 20, 21, None]
+
+    res = merge_asof(events, prices, on='t', by='sym', direction='forward')
+    assert list(res['price']) == [11, 12, None, 20, None]
+
+    # Ties in 'nearest' go backward; tolerance drops distant matches.
+    res = merge_asof(events, prices, on='t', by='sym', direction='nearest', tolerance=0.5)
+    assert list(res['price']) == [None, None, None, None, None]
+    res = merge_asof(events, prices, on='t', by='sym', direction='nearest')
+    assert list(res['price']) == [10, 11, 20, 21, None]
+
+    exact = DataFrame({'t': [4, 9]})
+    assert list(merge_asof(exact, prices, on='t')['price']) == [11, 20]
+    res = merge_asof(exact, prices, on='t', allow_exact_matches=False)
+    assert list(res['price']) == [21, 12]
+
+def test_merge_asof_datetime_keys_with_timedelta_tolerance():
+    from datetime import datetime, timedelta
+    t0 = datetime(2024, 1, 1, 9, 30)
+    trades = DataFrame({'t': [t0 + timedelta(seconds=s) for s in (3, 20)]})
+    quotes = DataFrame({'t': [t0, t0 + timedelta(seconds=10)], 'bid': [99.5, 99.7]})
+
+    res = merge_asof(trades, quotes, on='t', tolerance=timedelta(seconds=5))
+    assert list(res['bid']) == [99.5, None]
+    with pytest.raises(ValueError):
+        merge_asof(trades, quotes, on='t', tolerance=timedelta(seconds=-1))
+
+
+def test_semi_anti_merge_and_isin_frame():
+    events = DataFrame({'user': [1, 2, 3, 2, None], 'v': [10, 20, 30, 40, 50]})
+    # Duplicate keys on the right must not duplicate left rows.
+    seen = DataFrame({'user': [2, 2, None], 'extra': ['a', 'b', 'c']})
+
+    res = merge(events, seen, on='user', how='semi')
+    assert res.columns == ['user', 'v']
+    assert list(res['v']) == [20, 40, 50]
+
+    res = events.merge(seen, on='user', how='anti')
+    assert res.to_dict(orient='list') == {'user': [1, 3], 'v': [10, 30]}
+
+    mask = events.isin_frame(seen, on='user')
+    assert list(mask) == [False, True, False, True, True]
+    assert list(events[mask]['v']) == [20, 40, 50]
+
+    with pytest.raises(ValueError):
+        merge(events, seen, on='user', how='cross')
+
+
+def test_join_index_reused_across_chunks():
+    import pickle
+
+    dim = DataFrame({'id': [1, 2, 3], 'label': ['a', 'b', 'c']})
+    index = pickle.loads(pickle.dumps(dim.build_join_index('id')))
+    assert 2 in index and 9 not in index
+
+    chunks = [DataFrame({'id': [3, 9], 'v': [1, 2]}), DataFrame({'id': [1], 'v': [3]})]
+    for chunk in chunks:
+        for how in ('inner', 'left', 'right', 'outer', 'semi', 'anti'):
+            expected = merge(chunk, dim, on='id', how=how)
+            assert merge(chunk, index, how=how).to_dict(orient='list') == expected.to_dict(orient='list')
+
+    events = DataFrame({'dim_id': [2, 2, 5]})
+    res = merge(events, JoinIndex(dim, on='id'), left_on='dim_id', how='left')
+    assert list(res['label']) == ['b', 'b', None]
+
+    with pytest.raises(ValueError):
+        merge(events, index, on='dim_id')
+
+def test_groupby_agg_several_specs_on_one_column():
+    df = DataFrame({'k': ['a', 'b', 'a', 'a'], 'v': [4, None, 1, None]})
+    res = df.groupby('k').agg({'v': ['sum', 'mean', 'size', 'count', 'median', max]})
+    a = res.loc['a']
+    assert (a['v_sum'], a['v_mean'], a['v_size'], a['v_count'], a['v_median'], a['v_max']) == \
+        (5, 2.5, 3, 2, 2.5, 4)
+    b = res.loc['b']
+    assert (b['v_sum'], b['v_size'], b['v_count'], b['v_max']) == (None, 1, 0, None)
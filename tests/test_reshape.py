@@ -0,0 +1,56 @@
+import pytest
+from src import DataFrame, Series, pivot_table, crosstab, melt
+
+
+@pytest.fixture
+def sales():
+    return DataFrame({
+        'region': ['east', 'east', 'west', 'west', 'east', None],
+        'month': ['jan', 'feb', 'jan', 'jan', 'jan', 'feb'],
+        'units': [1, 2, 3, 4, 5, 6],
+        'price': [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+    })
+
+
+def test_pivot_table_single_pass(sales):
+    res = sales.pivot_table(index='region', columns='month', values='units', aggfunc='sum')
+    assert res.index == ['east', 'west']
+    assert res.columns == ['feb', 'jan']
+    assert list(res['jan']) == [6, 7]
+    # Missing cells get fill_value; rows with a None key are dropped.
+    assert list(res['feb']) == [2, None]
+
+    res = pivot_table(sales, index='region', columns='month',
+                      aggfunc={'units': 'max', 'price': 'mean'}, fill_value=0, as_index=False)
+    assert res.columns == ['region', 'units_feb', 'units_jan', 'price_feb', 'price_jan']
+    assert list(res['units_jan']) == [5, 4]
+    assert list(res['price_jan']) == [30.0, 35.0]
+    assert list(res['price_feb']) == [20.0, 0]
+
+
+def test_pivot_requires_unique_pairs(sales):
+    df = DataFrame({'d': [1, 1, 2], 'k': ['a', 'b', 'a'], 'v': [10, 20, 30]})
+    res = df.pivot(index='d', columns='k', values='v')
+    assert res.to_dict(orient='list') == {'a': [10, 30], 'b': [20, None]}
+    with pytest.raises(ValueError):
+        sales.pivot(index='region', columns='month', values='units')
+
+
+def test_crosstab_and_melt():
+    res = crosstab(Series(['a', 'a', 'b'], name='x'), ['u', 'v', 'u'])
+    assert res.index == ['a', 'b']
+    assert res.to_dict(orient='list') == {'u': [1, 1], 'v': [1, 0]}
+
+    res = crosstab(['a', 'a', 'b'], ['u', 'u', 'u'], values=[1, 2, 3], aggfunc='sum')
+    assert list(res['u']) == [3, 3]
+
+    wide = DataFrame({'id': [1, 2], 'a': [10, 20], 'b': [30, 40]})
+    long = melt(wide, id_vars='id')
+    assert long.to_dict(orient='list') == {
+        'id': [1, 2, 1, 2],
+        'variable': ['a', 'a', 'b', 'b'],
+        'value': [10, 20, 30, 40],
+    }
+    assert wide.melt(id_vars=['id'], value_vars=['b'], value_name='n').to_dict(orient='list') == {
+        'id': [1, 2], 'variable': ['b', 'b'], 'n': [30, 40],
+    }
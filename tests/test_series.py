@@ -96,3 +96,49 @@ def test_dataframe_getitem_returns_copy():
     
     # The DataFrame should NOT be affected, preserving rectangular structure
     assert len(df._data["A"]) == 3, "DataFrame column access returned a view, enabling length mutations"
+
+def test_boolean_mask_combinators():
+    from src.series import BooleanMask
+    s = Series([1, 5, None, 8, 3], index=list('abcde'))
+    big = s > 2
+    odd = s.isin([1, 3, 5])
+
+    assert isinstance(big, BooleanMask)
+    assert list(big) == [False, True, False, True, True]
+    assert big[1] is True and big[-1] is True and big[2] is False
+    assert list(big & odd) == [False, True, False, False, True]
+    assert list(big | odd) == [True, True, False, True, True]
+    assert list(big ^ odd) == [True, False, False, True, False]
+    assert list(~big) == [True, False, True, False, False]
+    assert (big & odd).index == ['a', 'b', 'c', 'd', 'e']
+
+    assert big.sum() == 3 and big.any() and not big.all()
+    assert (big | ~big).all() and not (big & ~big).any()
+    assert big.positions() == [1, 3, 4]
+    assert list(s[big & odd]) == [5, 3]
+    assert (s[big & odd]).index == ['b', 'e']
+
+    with pytest.raises(ValueError):
+        big & Series([True, False])
+
+def test_masks_filter_frames_and_str_contains_na():
+    df = DataFrame({'name': ['ann', 'bob', None, 'abe'], 'age': [31, 25, 40, 19]})
+    mask = df['name'].str.contains('a', na=False) & (df['age'] > 20)
+    assert list(df[mask]['age']) == [31]
+    assert list(df[~mask]['name']) == ['bob', None, 'abe']
+
+    # Without na= missing values stay None; & treats them as False.
+    loose = df['name'].str.contains('b')
+    assert loose[2] is None
+    assert list(loose & (df['age'] < 30)) == [False, True, False, True]
+
+def test_mask_arithmetic():
+    s = Series([3, 7, None, 9])
+    assert list((s > 5) * 1) == [0, 1, 0, 1]
+
+    df = DataFrame({'price': [2.5, 4.0, 1.0], 'qty': [1, 0, 3]})
+    assert list(df['price'] * (df['qty'] > 0)) == [2.5, 0.0, 1.0]
+
+    # One unpack per operation, not one per row.
+    big = Series(list(range(20000))) > 9999
+    assert sum(big * 1) == 10000
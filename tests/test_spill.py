@@ -0,0 +1,44 @@
+import random
+import pytest
+from src import DataFrame, external_sort, read_csv, read_ndjson
+
+def _random_chunks(n_chunks=5, rows=40, seed=7):
+    rng = random.Random(seed)
+    chunks = []
+    for c in range(n_chunks):
+        keys = [rng.choice([None, rng.randint(0, 50)]) if rng.random() < 0.1 else rng.randint(0, 50)
+                for _ in range(rows)]
+        chunks.append(DataFrame({'k': keys, 'seq': list(range(c * rows, (c + 1) * rows))}))
+    return chunks
+
+def test_external_sort_spills_and_merges():
+    chunks = _random_chunks()
+    rows = [(k, s) for c in chunks for k, s in zip(c['k'], c['seq'])]
+    expected = sorted([r for r in rows if r[0] is not None]) + [r for r in rows if r[0] is None]
+
+    # A tiny memory limit forces one run per chunk.
+    out = list(external_sort(chunks, by='k', memory_limit=1, chunksize=30))
+    assert [c.shape[0] for c in out] == [30] * 6 + [20]
+
+    result = [(k, s) for c in out for k, s in zip(c['k'], c['seq'])]
+    # Stable: ties keep their input order.
+    assert result == expected
+
+    desc = list(external_sort(chunks, by=['k'], ascending=False, na_position='first', memory_limit=1))
+    keys = [k for c in desc for k in c['k']]
+    n_none = sum(k is None for k in keys)
+    assert keys[:n_none] == [None] * n_none
+    assert keys[n_none:] == sorted(keys[n_none:], reverse=True)
+
+def test_external_sort_to_file(tmp_path):
+    chunks = _random_chunks(n_chunks=3)
+    csv_path = str(tmp_path / "sorted.csv.gz")
+    assert external_sort(chunks, by='seq', ascending=False, output=csv_path) is None
+    assert list(read_csv(csv_path)['seq']) == list(range(119, -1, -1))
+
+    ndjson_path = str(tmp_path / "sorted.ndjson")
+    external_sort(chunks, by='seq', output=ndjson_path, memory_limit=1)
+    assert list(read_ndjson(ndjson_path)['seq']) == list(range(120))
+
+    with pytest.raises(ValueError):
+        external_sort(chunks, by='seq', output=str(tmp_path / "sorted.txt"))
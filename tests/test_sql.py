@@ -0,0 +1,67 @@
+import sqlite3
+import pytest
+from src import DataFrame, read_sql, sql
+
+def test_to_sql_read_sql_roundtrip():
+    conn = sqlite3.connect(':memory:')
+    df = DataFrame({'id': [1, 2, 3], 'name': ['a', None, 'c'], 'score': [1.5, 2.0, None]})
+    df.to_sql('t', conn)
+
+    res = read_sql("SELECT * FROM t ORDER BY id", conn)
+    assert res.columns == ['id', 'name', 'score']
+    assert list(res['name']) == ['a', None, 'c']
+    assert res.iloc[2]['score'] is None
+
+    with pytest.raises(ValueError):
+        df.to_sql('t', conn)
+
+    df.to_sql('t', conn, if_exists='append', chunksize=2)
+    assert read_sql("SELECT COUNT(*) AS n FROM t", conn).iloc[0]['n'] == 6
+
+    df.to_sql('t', conn, if_exists='replace')
+    chunks = list(read_sql("SELECT id FROM t WHERE id > ?", conn, params=(1,), chunksize=1))
+    assert [c.iloc[0]['id'] for c in chunks] == [2, 3]
+
+def test_sql_over_frames():
+    orders = DataFrame({'user_id': [1, 1, 2, 3], 'amount': [10, 20, 5, 7]})
+    users = DataFrame({'user_id': [1, 2], 'name': ['amy', 'bob']})
+
+    res = sql(
+        "SELECT u.name, SUM(o.amount) AS total FROM orders o "
+        "JOIN users u ON u.user_id = o.user_id GROUP BY u.name ORDER BY u.name",
+        orders=orders, users=users,
+    )
+    assert res.columns == ['name', 'total']
+    assert list(res['total']) == [30, 5]
+
+    with pytest.raises(ValueError):
+        sql("SELECT * FROM a JOIN b", a=orders, b=orders)
+
+def test_to_sql_index_label_and_sql_keeps_existing_tables(tmp_path):
+    conn = sqlite3.connect(':memory:')
+    df = DataFrame({'index': [7, 8], 'v': ['a', 'b']}, index=['x', 'y'])
+    with pytest.raises(ValueError):
+        df.to_sql('t', conn, index=True)
+    df.to_sql('t', conn, index=True, index_label='key')
+    res = read_sql("SELECT * FROM t", conn)
+    assert res.columns == ['key', 'index', 'v']
+    assert list(res['key']) == ['x', 'y']
+
+    path = str(tmp_path / "work.db")
+    disk = sqlite3.connect(path)
+    df.to_sql('keep', disk)
+    disk.close()
+    with pytest.raises(ValueError):
+        sql("SELECT * FROM keep", database=path, keep=DataFrame({'v': [1]}))
+    assert list(sql("SELECT v FROM keep", database=path)['v']) == ['a', 'b']
+
+def test_sql_twice_on_one_database_file(tmp_path):
+    path = str(tmp_path / "work.db")
+    df = DataFrame({'v': [1, 2, 3]})
+    for _ in range(2):
+        res = sql("SELECT SUM(v) AS total FROM t", database=path, t=df)
+        assert res.iloc[0]['total'] == 6
+
+    conn = sqlite3.connect(path)
+    assert read_sql("SELECT name FROM sqlite_master", conn).shape[0] == 0
+    conn.close()
@@ -0,0 +1,73 @@
+import json
+import statistics
+import pytest
+from src import DataFrame, StreamingGroupBy, groupby_stream
+
+def _chunks():
+    return [
+        DataFrame({'k': ['a', 'b', 'a'], 'v': [1, 2, 3]}),
+        DataFrame({'k': ['b', 'a', None], 'v': [4, None, 6]}),
+        DataFrame({'k': ['c', 'a'], 'v': [7, 8]}),
+    ]
+
+def test_groupby_stream_aggregations():
+    res = groupby_stream(_chunks(), 'k', {'v': ['sum', 'count', 'min', 'max', 'mean', 'var']})
+
+    assert res.index == ['a', 'b', 'c', None]
+    row_a = res.loc['a']
+    assert row_a['v_sum'] == 12
+    assert row_a['v_count'] == 3
+    assert row_a['v_min'] == 1
+    assert row_a['v_max'] == 8
+    assert row_a['v_mean'] == 4
+    assert row_a['v_var'] == pytest.approx(statistics.variance([1, 3, 8]))
+    assert res.loc['c']['v_var'] is None
+
+def test_streaming_groupby_merge_serialised_states():
+    chunks = _chunks()
+    aggs = {'v': ['mean', 'std']}
+
+    # Two "workers" aggregate disjoint chunks and ship states as JSON.
+    worker_1 = StreamingGroupBy(['k'], aggs, as_index=False).update(chunks[0])
+    worker_2 = StreamingGroupBy(['k'], aggs, as_index=False)
+    worker_2.update(chunks[1]).update(chunks[2])
+
+    combined = StreamingGroupBy.from_state(json.loads(json.dumps(worker_1.to_state())))
+    combined.merge(StreamingGroupBy.from_state(json.loads(json.dumps(worker_2.to_state()))))
+    res = combined.result()
+
+    single = StreamingGroupBy(['k'], aggs, as_index=False)
+    for chunk in chunks:
+        single.update(chunk)
+    expected = single.result()
+
+    assert list(res['k']) == ['a', 'b', 'c', None]
+    assert list(res['v_mean']) == list(expected['v_mean'])
+    assert res.iloc[0]['v_std'] == pytest.approx(statistics.stdev([1, 3, 8]))
+    assert res.iloc[1]['v_std'] == pytest.approx(expected.iloc[1]['v_std'])
+
+    with pytest.raises(ValueError):
+        combined.merge(StreamingGroupBy('k', {'v': 'sum'}))
+
+def test_accumulator_requires_update_and_merge():
+    from src import Accumulator
+
+    class NoMerge(Accumulator):
+        def update(self, state, value):
+            return value
+
+    with pytest.raises(TypeError):
+        NoMerge()
+
+def test_streaming_groupby_merge_rejects_other_aggregations():
+    from src.aggregation import QuantileAccumulator
+    chunk = _chunks()[0]
+
+    summed = StreamingGroupBy('k', {'v': 'sum'}).update(chunk)
+    with pytest.raises(ValueError):
+        summed.merge(StreamingGroupBy('k', {'v': 'max'}).update(chunk))
+
+    high = StreamingGroupBy('k', {'v': QuantileAccumulator(0.9)}).update(chunk)
+    with pytest.raises(ValueError):
+        high.merge(StreamingGroupBy('k', {'v': QuantileAccumulator(0.1)}).update(chunk))
+    high.merge(StreamingGroupBy('k', {'v': QuantileAccumulator(0.9)}).update(chunk))
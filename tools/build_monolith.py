@@ -7,9 +7,13 @@ FILE_ORDER = [
     'indexing.py',
     'core.py',
     'concat.py',
+    'aggregation.py',
     'groupby.py',
     'merge.py',
-    'io.py'
+    'reshape.py',
+    'io.py',
+    'sqlite.py',
+    'spill.py'
 ]
 
 SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')